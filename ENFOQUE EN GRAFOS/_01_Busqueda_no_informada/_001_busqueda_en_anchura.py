@@ -1,6 +1,6 @@
-from collections import deque  # Importamos deque para usarlo como una cola eficiente
+from _009_nucleo_de_busqueda import busqueda_con_predecesores  # Núcleo con mapa de predecesores
 
-def bfs(graph, start, goal):
+def bfs(graph, start, goal, estadisticas=None):
     """
     Función para realizar una búsqueda en anchura (BFS) Breadth-First Search.
     Cómo funciona: Explora todos los nodos a un nivel de profundidad antes de pasar al      siguiente nivel. Es ideal para encontrar el camino más corto en grafos no ponderados.
@@ -8,41 +8,30 @@ def bfs(graph, start, goal):
         Encontrar el camino más corto en un grafo no ponderado.
         Resolver problemas de conectividad en grafos.
         Resolver rompecabezas como laberintos.
-    :param graph: Diccionario que representa el grafo.
+    :param graph: Diccionario que representa el grafo o GrafoCSR compilado.
     :param start: Nodo de inicio.
     :param goal: Nodo objetivo.
+    :param estadisticas: EstadisticasBusqueda opcional (frontera máxima, bytes asignados, ...).
     :return: Lista con el camino más corto desde start hasta goal.
     """
-    
-    queue = deque([(start, [start])])  # Cola con (nodo actual, camino hasta él)
-    visited = set()  # Conjunto para almacenar nodos visitados
+    # La cola guarda solo nodos; el camino se reconstruye con los predecesores al llegar al destino
+    resultado = busqueda_con_predecesores(graph, start, goal, estrategia="anchura", estadisticas=estadisticas)
+    if resultado is None:  # Si no encontramos el objetivo, devolvemos None
+        return None
+    return resultado[1]
 
-    while queue:
-        node, path = queue.popleft()  # Extraemos el primer nodo en la cola
-        
-        if node == goal:  # Si hemos encontrado el destino, devolvemos el camino
-            return path  
+if __name__ == "__main__":
+    # Definimos el grafo con las conexiones entre lugares
+    graph = {
+        "Casa": ["Parque", "Escuela"],
+        "Parque": ["Tienda"],
+        "Escuela": ["Biblioteca"],
+        "Biblioteca": ["Tienda"],
+        "Tienda": []
+    }
 
-        if node not in visited:  # Si el nodo no ha sido visitado
-            visited.add(node)  # Lo marcamos como visitado
-            
-            for neighbor in graph.get(node, []):  # Recorremos los vecinos del nodo
-                if neighbor not in visited:  # Solo agregamos nodos no visitados
-                    queue.append((neighbor, path + [neighbor]))  # Agregamos a la cola
+    # Ejecutamos BFS para encontrar el camino más corto de "Casa" a "Tienda"
+    camino = bfs(graph, "Casa", "Tienda")
 
-    return None  # Si no encontramos el objetivo, devolvemos None
-
-# Definimos el grafo con las conexiones entre lugares
-graph = {
-    "Casa": ["Parque", "Escuela"],
-    "Parque": ["Tienda"],
-    "Escuela": ["Biblioteca"],
-    "Biblioteca": ["Tienda"],
-    "Tienda": []
-}
-
-# Ejecutamos BFS para encontrar el camino más corto de "Casa" a "Tienda"
-camino = bfs(graph, "Casa", "Tienda")
-
-# Mostramos el resultado
-print("Camino más corto:", camino)
+    # Mostramos el resultado
+    print("Camino más corto:", camino)
@@ -2,89 +2,270 @@
 # Este método realiza búsquedas simultáneas desde el nodo inicial y el nodo objetivo, avanzando hacia el centro.
 # Cuando las dos búsquedas se encuentran, se combina el camino desde ambas direcciones para obtener la solución.
 # Es especialmente útil en grafos grandes, ya que reduce significativamente el espacio de búsqueda en comparación con
-# una búsqueda unidireccional.z
+# una búsqueda unidireccional.
 
-from collections import deque  # Importamos deque para manejar las colas de búsqueda de manera eficiente
+import heapq  # Cola de prioridad para la variante con costos
+import math
+import random
+import time
 
-def busqueda_bidireccional(grafo, inicio, objetivo):
+from _008_grafo_csr import adaptar_grafo  # Permite recibir también un GrafoCSR compilado
+from _009_nucleo_de_busqueda import EstadisticasBusqueda
+
+
+def invertir_grafo(grafo):
+    """
+    Construye la adyacencia inversa de un grafo dirigido: para cada nodo, quiénes llegan a él.
+    :param grafo: Diccionario (nodo: [vecinos]) o (nodo: [(vecino, costo)]), o GrafoCSR.
+    :return: Grafo inverso en el mismo formato.
+    """
+    if not isinstance(grafo, dict):
+        return grafo.invertido()  # El GrafoCSR guarda su inverso ya compilado
+    inverso = {nodo: [] for nodo in grafo}
+    for nodo, vecinos in grafo.items():
+        for vecino in vecinos:
+            if isinstance(vecino, tuple):  # Arista con costo (vecino, costo)
+                inverso.setdefault(vecino[0], []).append((nodo, vecino[1]))
+            else:
+                inverso.setdefault(vecino, []).append(nodo)
+    return inverso
+
+
+def _unir_caminos(padres_inicio, padres_objetivo, encuentro):
+    """
+    Une el camino inicio -> encuentro (mapa de padres hacia adelante) con el camino
+    encuentro -> objetivo (mapa de padres hacia atrás).
+    """
+    camino = []
+    nodo = encuentro
+    while nodo is not None:
+        camino.append(nodo)
+        nodo = padres_inicio[nodo]
+    camino.reverse()
+    nodo = padres_objetivo[encuentro]
+    while nodo is not None:
+        camino.append(nodo)
+        nodo = padres_objetivo[nodo]
+    return camino
+
+
+def _profundidad_en(padres, nodo):
+    """
+    Número de aristas desde nodo hasta la raíz de su árbol de padres.
+    """
+    profundidad = 0
+    while padres[nodo] is not None:
+        nodo = padres[nodo]
+        profundidad += 1
+    return profundidad
+
+
+def busqueda_bidireccional(grafo, inicio, objetivo, grafo_inverso=None, estadisticas=None):
     """
     Búsqueda Bidireccional para encontrar el camino más corto entre dos nodos.
-    :param grafo: Diccionario que representa el grafo (nodo: [vecinos]).
+    Avanza hacia adelante desde el inicio y hacia atrás (sobre las aristas invertidas) desde el objetivo,
+    expandiendo siempre el nivel completo de la frontera más pequeña.
+    :param grafo: Diccionario que representa el grafo (nodo: [vecinos]) o GrafoCSR.
     :param inicio: Nodo inicial.
     :param objetivo: Nodo objetivo.
+    :param grafo_inverso: Adyacencia inversa precalculada (se construye con invertir_grafo si no se da).
+    :param estadisticas: EstadisticasBusqueda opcional con los nodos expandidos y generados.
     :return: Lista con el camino entre inicio y objetivo, o None si no se encuentra.
     """
     # Caso especial: si el nodo inicial es igual al nodo objetivo
     if inicio == objetivo:
         return [inicio]
 
-    # Inicializamos las colas de búsqueda y los conjuntos visitados
-    cola_inicio = deque([[inicio]])  # Cola para la búsqueda desde el nodo inicial
-    cola_objetivo = deque([[objetivo]])  # Cola para la búsqueda desde el nodo objetivo
-    visitados_inicio = {inicio}  # Conjunto de nodos visitados desde el inicio
-    visitados_objetivo = {objetivo}  # Conjunto de nodos visitados desde el objetivo
-
-    # Mientras ambas colas tengan elementos, continuamos la búsqueda
-    while cola_inicio and cola_objetivo:
-        # Expansión desde el inicio
-        camino_inicio = cola_inicio.popleft()  # Extraemos el primer camino de la cola
-        actual_inicio = camino_inicio[-1]  # Último nodo del camino actual
-
-        # Recorremos los vecinos del nodo actual desde el inicio
-        for vecino in grafo.get(actual_inicio, []):
-            if vecino not in visitados_inicio:  # Si el vecino no ha sido visitado
-                nuevo_camino = camino_inicio + [vecino]  # Construimos un nuevo camino
-                cola_inicio.append(nuevo_camino)  # Lo agregamos a la cola
-                visitados_inicio.add(vecino)  # Marcamos el vecino como visitado
-
-                # Verificamos si este vecino ya fue visitado desde el objetivo
-                if vecino in visitados_objetivo:
-                    # Si se encuentra, combinamos los caminos y devolvemos el resultado
-                    camino_objetivo = next(camino for camino in cola_objetivo if camino[-1] == vecino)
-                    return nuevo_camino + camino_objetivo[::-1][1:]
-
-        # Expansión desde el objetivo
-        camino_objetivo = cola_objetivo.popleft()  # Extraemos el primer camino de la cola
-        actual_objetivo = camino_objetivo[-1]  # Último nodo del camino actual
-
-        # Recorremos los vecinos del nodo actual desde el objetivo
-        for vecino in grafo.get(actual_objetivo, []):
-            if vecino not in visitados_objetivo:  # Si el vecino no ha sido visitado
-                nuevo_camino = camino_objetivo + [vecino]  # Construimos un nuevo camino
-                cola_objetivo.append(nuevo_camino)  # Lo agregamos a la cola
-                visitados_objetivo.add(vecino)  # Marcamos el vecino como visitado
-
-                # Verificamos si este vecino ya fue visitado desde el inicio
-                if vecino in visitados_inicio:
-                    # Si se encuentra, combinamos los caminos y devolvemos el resultado
-                    camino_inicio = next(camino for camino in cola_inicio if camino[-1] == vecino)
-                    return camino_inicio + nuevo_camino[::-1][1:]
+    if grafo_inverso is None:
+        grafo_inverso = invertir_grafo(grafo)
+    adaptado = adaptar_grafo(grafo, inicio, objetivo)
+    if adaptado is None:  # El inicio o el objetivo no existen en el GrafoCSR
+        return None
+    vecinos, inicio, objetivo, a_nombres = adaptado
+    if isinstance(grafo_inverso, dict):
+        predecesores = lambda nodo: grafo_inverso.get(nodo, [])
+    else:
+        predecesores = grafo_inverso.vecinos
+    if estadisticas is None:
+        estadisticas = EstadisticasBusqueda()
+
+    # Mapas de padres de cada lado: solo contienen los nodos alcanzados, no todo el grafo
+    padres_inicio = {inicio: None}
+    padres_objetivo = {objetivo: None}
+    frontera_inicio = [inicio]
+    frontera_objetivo = [objetivo]
+
+    while frontera_inicio and frontera_objetivo:
+        # Expandimos el lado con menos nodos en su frontera
+        if len(frontera_inicio) <= len(frontera_objetivo):
+            frontera, sucesores, padres, padres_otro = frontera_inicio, vecinos, padres_inicio, padres_objetivo
+        else:
+            frontera, sucesores, padres, padres_otro = frontera_objetivo, predecesores, padres_objetivo, padres_inicio
+
+        siguiente = []
+        mejor_encuentro, mejor_longitud = None, math.inf
+        for nodo in frontera:
+            estadisticas.nodos_expandidos += 1
+            for vecino in sucesores(nodo):
+                if vecino in padres:
+                    continue
+                padres[vecino] = nodo
+                siguiente.append(vecino)
+                estadisticas.nodos_generados += 1
+                if vecino in padres_otro:
+                    # Se terminan de revisar los encuentros de este nivel y se conserva el más corto
+                    longitud = _profundidad_en(padres, vecino) + _profundidad_en(padres_otro, vecino)
+                    if longitud < mejor_longitud:
+                        mejor_encuentro, mejor_longitud = vecino, longitud
+        estadisticas.max_frontera = max(estadisticas.max_frontera, len(siguiente))
+
+        if mejor_encuentro is not None:
+            return a_nombres(_unir_caminos(padres_inicio, padres_objetivo, mejor_encuentro))
+        if frontera is frontera_inicio:
+            frontera_inicio = siguiente
+        else:
+            frontera_objetivo = siguiente
 
     # Si no se encuentra un camino, devolvemos None
     return None
 
 
-# Definimos un grafo con pueblos mágicos de Jalisco
-grafo_pueblos_magicos_jalisco = {
-    "Tequila": ["Mazamitla", "San Sebastián del Oeste"],  # Conexiones desde Tequila
-    "Mazamitla": ["Tapalpa"],  # Conexiones desde Mazamitla
-    "San Sebastián del Oeste": ["Mascota"],  # Conexiones desde San Sebastián del Oeste
-    "Tapalpa": ["Ajijic"],  # Conexiones desde Tapalpa
-    "Mascota": ["Talpa de Allende"],  # Conexiones desde Mascota
-    "Ajijic": [],  # Ajijic no tiene conexiones
-    "Talpa de Allende": ["Lagos de Moreno"],  # Conexiones desde Talpa de Allende
-    "Lagos de Moreno": []  # Lagos de Moreno no tiene conexiones
-}
-
-# Parámetros de búsqueda
-nodo_inicial = "Tequila"  # Nodo inicial de la búsqueda
-nodo_objetivo = "Lagos de Moreno"  # Nodo objetivo de la búsqueda
-
-# Ejecutamos la búsqueda bidireccional
-camino = busqueda_bidireccional(grafo_pueblos_magicos_jalisco, nodo_inicial, nodo_objetivo)
-
-# Mostramos el resultado
-if camino:
-    print(f"Camino encontrado (de {nodo_inicial} a {nodo_objetivo}): {camino}")
-else:
-    print(f"No se encontró un camino entre '{nodo_inicial}' y '{nodo_objetivo}'.")
\ No newline at end of file
+def dijkstra_bidireccional(grafo, inicio, objetivo, grafo_inverso=None, estadisticas=None):
+    """
+    Búsqueda de costo uniforme bidireccional (Dijkstra bidireccional).
+    Usa el mismo modelo de costos que ucs (ciudad: [(vecina, costo)]) y se detiene con la regla estándar:
+    cuando la suma de los mínimos de ambas colas alcanza el mejor costo de encuentro conocido.
+    :param grafo: Diccionario que representa el grafo con costos o GrafoCSR.
+    :param inicio: Nodo inicial.
+    :param objetivo: Nodo objetivo.
+    :param grafo_inverso: Adyacencia inversa precalculada (se construye con invertir_grafo si no se da).
+    :param estadisticas: EstadisticasBusqueda opcional con los nodos expandidos y generados.
+    :return: Tupla con el costo total y el camino más barato, o None si no existe.
+    """
+    if grafo_inverso is None:
+        grafo_inverso = invertir_grafo(grafo)
+    adaptado = adaptar_grafo(grafo, inicio, objetivo, ponderado=True)
+    if adaptado is None:  # El inicio o el objetivo no existen en el GrafoCSR
+        return None
+    vecinos, inicio, objetivo, a_nombres = adaptado
+    if isinstance(grafo_inverso, dict):
+        predecesores = lambda nodo: grafo_inverso.get(nodo, [])
+    else:
+        predecesores = grafo_inverso.vecinos_con_costo
+    if inicio == objetivo:
+        return 0, a_nombres([inicio])
+    if estadisticas is None:
+        estadisticas = EstadisticasBusqueda()
+
+    # Estado de cada lado: cola de prioridad, mejor costo conocido, padres y nodos cerrados
+    lados = [
+        {"cola": [(0, inicio)], "costo": {inicio: 0}, "padres": {inicio: None}, "cerrados": set(), "sucesores": vecinos},
+        {"cola": [(0, objetivo)], "costo": {objetivo: 0}, "padres": {objetivo: None}, "cerrados": set(),
+         "sucesores": predecesores},
+    ]
+    mejor_costo, encuentro = math.inf, None
+
+    while lados[0]["cola"] and lados[1]["cola"]:
+        # Regla de parada: ningún camino por explorar puede mejorar el encuentro actual
+        if lados[0]["cola"][0][0] + lados[1]["cola"][0][0] >= mejor_costo:
+            break
+
+        # Expandimos el lado con la frontera más pequeña
+        indice = 0 if len(lados[0]["cola"]) <= len(lados[1]["cola"]) else 1
+        lado, otro = lados[indice], lados[1 - indice]
+        costo, nodo = heapq.heappop(lado["cola"])
+        if nodo in lado["cerrados"]:  # Entrada obsoleta
+            continue
+        lado["cerrados"].add(nodo)
+        estadisticas.nodos_expandidos += 1
+
+        for vecino, costo_arista in lado["sucesores"](nodo):
+            nuevo_costo = costo + costo_arista
+            if nuevo_costo < lado["costo"].get(vecino, math.inf):
+                lado["costo"][vecino] = nuevo_costo
+                lado["padres"][vecino] = nodo
+                heapq.heappush(lado["cola"], (nuevo_costo, vecino))
+                estadisticas.nodos_generados += 1
+            # Si el otro lado ya alcanzó al vecino, tenemos un camino completo candidato
+            if vecino in otro["costo"]:
+                total = lado["costo"][vecino] + otro["costo"][vecino]
+                if total < mejor_costo:
+                    mejor_costo, encuentro = total, vecino
+        estadisticas.max_frontera = max(estadisticas.max_frontera, len(lado["cola"]) + len(otro["cola"]))
+
+    if encuentro is None:
+        return None
+    return mejor_costo, a_nombres(_unir_caminos(lados[0]["padres"], lados[1]["padres"], encuentro))
+
+
+def comparar_con_unidireccional(num_nodos=50_000, consultas=10, semilla=1):
+    """
+    Compara los nodos expandidos por BFS/UCS y por sus variantes bidireccionales
+    en consultas punto a punto sobre un grafo sintético compilado como GrafoCSR.
+    """
+    from _008_grafo_csr import GrafoCSR, grafo_sintetico
+    from _009_nucleo_de_busqueda import busqueda_con_predecesores
+
+    grafo = GrafoCSR.desde_aristas(num_nodos, *grafo_sintetico(num_nodos))
+    inverso = grafo.invertido()
+    generador = random.Random(semilla)
+    pares = [(generador.randrange(num_nodos), generador.randrange(num_nodos)) for _ in range(consultas)]
+
+    for nombre, unidireccional, bidireccional in (
+            ("BFS", lambda a, b, e: busqueda_con_predecesores(grafo, a, b, estadisticas=e),
+             lambda a, b, e: busqueda_bidireccional(grafo, a, b, inverso, e)),
+            ("UCS", lambda a, b, e: busqueda_con_predecesores(grafo, a, b, "costo_uniforme", estadisticas=e),
+             lambda a, b, e: dijkstra_bidireccional(grafo, a, b, inverso, e))):
+        totales = []
+        for busqueda in (unidireccional, bidireccional):
+            estadisticas = EstadisticasBusqueda()
+            t0 = time.perf_counter()
+            for a, b in pares:
+                busqueda(a, b, estadisticas)
+            totales.append((estadisticas.nodos_expandidos / consultas, time.perf_counter() - t0))
+        print(f"{nombre}: unidireccional {totales[0][0]:.0f} nodos/consulta ({totales[0][1]:.2f} s), "
+              f"bidireccional {totales[1][0]:.0f} nodos/consulta ({totales[1][1]:.2f} s)")
+
+
+if __name__ == "__main__":
+    # Definimos un grafo con pueblos mágicos de Jalisco
+    grafo_pueblos_magicos_jalisco = {
+        "Tequila": ["Mazamitla", "San Sebastián del Oeste"],  # Conexiones desde Tequila
+        "Mazamitla": ["Tapalpa"],  # Conexiones desde Mazamitla
+        "San Sebastián del Oeste": ["Mascota"],  # Conexiones desde San Sebastián del Oeste
+        "Tapalpa": ["Ajijic"],  # Conexiones desde Tapalpa
+        "Mascota": ["Talpa de Allende"],  # Conexiones desde Mascota
+        "Ajijic": [],  # Ajijic no tiene conexiones
+        "Talpa de Allende": ["Lagos de Moreno"],  # Conexiones desde Talpa de Allende
+        "Lagos de Moreno": []  # Lagos de Moreno no tiene conexiones
+    }
+
+    # Parámetros de búsqueda
+    nodo_inicial = "Tequila"  # Nodo inicial de la búsqueda
+    nodo_objetivo = "Lagos de Moreno"  # Nodo objetivo de la búsqueda
+
+    # Ejecutamos la búsqueda bidireccional
+    camino = busqueda_bidireccional(grafo_pueblos_magicos_jalisco, nodo_inicial, nodo_objetivo)
+
+    # Mostramos el resultado
+    if camino:
+        print(f"Camino encontrado (de {nodo_inicial} a {nodo_objetivo}): {camino}")
+    else:
+        print(f"No se encontró un camino entre '{nodo_inicial}' y '{nodo_objetivo}'.")
+
+    # Variante con costos sobre el grafo de ciudades usado por UCS
+    grafo_ciudades = {
+        "Ciudad de México": [("Guadalajara", 10), ("Monterrey", 15)],
+        "Guadalajara": [("Tijuana", 12), ("Cancún", 15)],
+        "Monterrey": [("Mérida", 10)],
+        "Tijuana": [("Chihuahua", 2)],
+        "Cancún": [("Chihuahua", 5)],
+        "Mérida": [("Chihuahua", 10)],
+        "Chihuahua": []
+    }
+    resultado = dijkstra_bidireccional(grafo_ciudades, "Ciudad de México", "Chihuahua")
+    print(f"Dijkstra bidireccional: {resultado}")
+
+    # Nodos expandidos frente a la búsqueda unidireccional en un grafo grande
+    print()
+    comparar_con_unidireccional()
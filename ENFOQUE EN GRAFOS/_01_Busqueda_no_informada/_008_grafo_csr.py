@@ -0,0 +1,354 @@
+# Representación compacta de grafos en formato CSR (Compressed Sparse Row).
+# Los nombres de los nodos se internan como enteros consecutivos (0..n-1) y la adyacencia se guarda
+# en tres arreglos planos:
+# - desplazamientos: las aristas del nodo i ocupan las posiciones desplazamientos[i]..desplazamientos[i + 1].
+# - destinos: identificador entero del vecino de cada arista.
+# - costos: costo de cada arista (1.0 cuando el grafo original no tiene costos).
+# Frente a un diccionario de listas de cadenas, este formato ocupa una fracción de la memoria y las
+# búsquedas trabajan con enteros en lugar de calcular el hash de cadenas en cada paso.
+
+from array import array  # Arreglos compactos de tipos primitivos
+from multiprocessing import shared_memory
+import random
+import sys
+import time
+
+
+class GrafoCSR:
+    """
+    Grafo dirigido compilado: nodos internados como enteros y adyacencia en arreglos CSR.
+    """
+    def __init__(self, nombres, desplazamientos, destinos, costos):
+        self.nombres = nombres  # Lista id -> nombre del nodo
+        self._indices = None  # Diccionario nombre -> id, creado en el primer uso
+        self.desplazamientos = desplazamientos  # array('q') de longitud n + 1
+        self.destinos = destinos  # array('i') con el vecino de cada arista
+        self.costos = costos  # array('d') con el costo de cada arista
+        self._invertido = None  # Grafo con las aristas invertidas, calculado bajo demanda
+
+    @classmethod
+    def desde_diccionario(cls, grafo):
+        """
+        Compila un grafo en forma de diccionario.
+        Acepta los formatos usados en los ejemplos: {nodo: [vecinos]}, {nodo: [(vecino, costo)]}
+        y {nodo: {vecino: costo}}.
+        :param grafo: Diccionario que representa el grafo.
+        :return: GrafoCSR equivalente.
+        """
+        # Internamos primero los nodos con aristas salientes y después los que solo aparecen como destino
+        nombres = list(grafo)
+        indices = {nombre: i for i, nombre in enumerate(nombres)}
+        aristas = []
+        for nombre, vecinos in grafo.items():
+            if isinstance(vecinos, dict):
+                vecinos = vecinos.items()
+            lista = []
+            for vecino in vecinos:
+                if isinstance(vecino, tuple):
+                    vecino, costo = vecino
+                else:
+                    costo = 1
+                if vecino not in indices:
+                    indices[vecino] = len(nombres)
+                    nombres.append(vecino)
+                lista.append((indices[vecino], costo))
+            aristas.append(lista)
+
+        desplazamientos = array("q", [0])
+        destinos = array("i")
+        costos = array("d")
+        for i in range(len(nombres)):
+            for vecino, costo in (aristas[i] if i < len(aristas) else ()):
+                destinos.append(vecino)
+                costos.append(costo)
+            desplazamientos.append(len(destinos))
+        return cls(nombres, desplazamientos, destinos, costos)
+
+    @classmethod
+    def desde_aristas(cls, num_nodos, origenes, destinos, costos=None, nombres=None):
+        """
+        Compila un grafo a partir de listas paralelas de aristas con identificadores enteros.
+        :param num_nodos: Número de nodos del grafo.
+        :param origenes: Secuencia con el nodo origen de cada arista.
+        :param destinos: Secuencia con el nodo destino de cada arista.
+        :param costos: Secuencia con el costo de cada arista (None para costo 1).
+        :param nombres: Lista de nombres de los nodos (por defecto, el propio id).
+        :return: GrafoCSR equivalente.
+        """
+        # Ordenamiento por conteo: contamos aristas por origen y acumulamos los desplazamientos
+        conteo = array("q", bytes(8 * (num_nodos + 1)))
+        for origen in origenes:
+            conteo[origen + 1] += 1
+        for i in range(num_nodos):
+            conteo[i + 1] += conteo[i]
+        desplazamientos = array("q", conteo)
+
+        siguiente = array("q", conteo[:-1])  # Próxima posición libre de cada nodo
+        destinos_csr = array("i", bytes(4 * len(destinos)))
+        costos_csr = array("d", [1.0]) * len(destinos)
+        for k, origen in enumerate(origenes):
+            posicion = siguiente[origen]
+            destinos_csr[posicion] = destinos[k]
+            if costos is not None:
+                costos_csr[posicion] = costos[k]
+            siguiente[origen] = posicion + 1
+
+        if nombres is None:
+            nombres = list(range(num_nodos))
+        return cls(nombres, desplazamientos, destinos_csr, costos_csr)
+
+    @property
+    def indices(self):
+        """
+        Diccionario nombre -> id. Se crea la primera vez que se necesita, de modo que los procesos
+        que solo trabajan con ids no pagan su memoria.
+        """
+        if self._indices is None:
+            self._indices = {nombre: i for i, nombre in enumerate(self.nombres)}
+        return self._indices
+
+    def __len__(self):
+        return len(self.nombres)
+
+    @property
+    def num_aristas(self):
+        return len(self.destinos)
+
+    def id_de(self, nombre):
+        """
+        Devuelve el identificador entero de un nodo, o None si no existe.
+        """
+        return self.indices.get(nombre)
+
+    def nombre_de(self, identificador):
+        """
+        Devuelve el nombre original de un nodo a partir de su identificador.
+        """
+        return self.nombres[identificador]
+
+    def vecinos(self, identificador):
+        """
+        Devuelve los identificadores de los vecinos de un nodo.
+        """
+        return self.destinos[self.desplazamientos[identificador]:self.desplazamientos[identificador + 1]]
+
+    def vecinos_con_costo(self, identificador):
+        """
+        Devuelve pares (vecino, costo) de las aristas salientes de un nodo.
+        """
+        inicio = self.desplazamientos[identificador]
+        fin = self.desplazamientos[identificador + 1]
+        return zip(self.destinos[inicio:fin], self.costos[inicio:fin])
+
+    def invertido(self):
+        """
+        Devuelve el grafo con todas las aristas invertidas (mismos ids y nombres).
+        Se calcula una sola vez y se guarda para las consultas siguientes.
+        """
+        if self._invertido is None:
+            origenes = array("i")
+            for nodo in range(len(self.nombres)):
+                origenes.extend([nodo] * (self.desplazamientos[nodo + 1] - self.desplazamientos[nodo]))
+            invertido = GrafoCSR.desde_aristas(len(self.nombres), self.destinos, origenes, self.costos, [])
+            invertido.nombres, invertido._indices = self.nombres, self._indices  # Se comparten las tablas de nombres
+            invertido._invertido = self
+            self._invertido = invertido
+        return self._invertido
+
+    def tamano_en_bytes(self):
+        """
+        Memoria ocupada por los arreglos CSR (sin contar la tabla de nombres).
+        """
+        return sum(arreglo.itemsize * len(arreglo) for arreglo in (self.desplazamientos, self.destinos, self.costos))
+
+
+class GrafoCompartido:
+    """
+    Copia de los arreglos de un GrafoCSR en un bloque de memoria compartida entre procesos.
+    Los procesos de trabajo reciben solo el descriptor (nombre del bloque y tamaños) y abren el grafo
+    sin copiarlo; el proceso que lo creó debe llamar a liberar() cuando terminen.
+    """
+    def __init__(self, grafo):
+        n, m = len(grafo), grafo.num_aristas
+        # Orden de mayor a menor tamaño de elemento para que cada arreglo quede alineado
+        self.bloque = shared_memory.SharedMemory(create=True, size=max(1, 8 * (n + 1) + 12 * m))
+        vista = self.bloque.buf
+        vista[:8 * (n + 1)] = grafo.desplazamientos.tobytes()
+        vista[8 * (n + 1):8 * (n + 1) + 8 * m] = grafo.costos.tobytes()
+        vista[8 * (n + 1) + 8 * m:8 * (n + 1) + 12 * m] = grafo.destinos.tobytes()
+        self.descriptor = (self.bloque.name, n, m)
+
+    def liberar(self):
+        """
+        Cierra y elimina el bloque de memoria compartida.
+        """
+        self.bloque.close()
+        self.bloque.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.liberar()
+
+
+def abrir_grafo_compartido(descriptor, nombres=None):
+    """
+    Abre en otro proceso un grafo publicado con GrafoCompartido, sin copiar sus arreglos.
+    :param descriptor: Atributo descriptor del GrafoCompartido.
+    :param nombres: Lista id -> nombre (por defecto, el propio id).
+    :return: Tupla (GrafoCSR sobre la memoria compartida, bloque). El bloque debe seguir referenciado
+             mientras se use el grafo.
+    """
+    nombre_bloque, n, m = descriptor
+    bloque = shared_memory.SharedMemory(name=nombre_bloque)
+    vista = bloque.buf
+    desplazamientos = vista[:8 * (n + 1)].cast("q")
+    costos = vista[8 * (n + 1):8 * (n + 1) + 8 * m].cast("d")
+    destinos = vista[8 * (n + 1) + 8 * m:8 * (n + 1) + 12 * m].cast("i")
+    grafo = GrafoCSR(nombres if nombres is not None else range(n), desplazamientos, destinos, costos)
+    return grafo, bloque
+
+
+def adaptar_grafo(grafo, inicio, objetivo, ponderado=False):
+    """
+    Prepara un grafo (diccionario o GrafoCSR) para que las búsquedas lo recorran de la misma forma.
+    :param grafo: Diccionario {nodo: [vecinos]} / {nodo: [(vecino, costo)]} o un GrafoCSR.
+    :param inicio: Nodo inicial (nombre).
+    :param objetivo: Nodo objetivo (nombre).
+    :param ponderado: Si es True, la función de vecinos devuelve pares (vecino, costo).
+    :return: Tupla (vecinos, inicio, objetivo, a_nombres) o None si el inicio o el objetivo
+             no existen en el GrafoCSR. a_nombres convierte un camino interno a nombres.
+    """
+    if isinstance(grafo, dict):
+        return lambda nodo: grafo.get(nodo, []), inicio, objetivo, lambda camino: camino
+
+    # Cualquier otro objeto se trata como GrafoCSR (se compara por forma y no con isinstance
+    # para que funcione aunque el módulo se haya cargado también como __main__)
+    inicio_id, objetivo_id = grafo.id_de(inicio), grafo.id_de(objetivo)
+    if inicio_id is None or objetivo_id is None:
+        return None
+    vecinos = grafo.vecinos_con_costo if ponderado else grafo.vecinos
+    nombres = grafo.nombres
+    return vecinos, inicio_id, objetivo_id, lambda camino: [nombres[i] for i in camino]
+
+
+# ============================================
+# BENCHMARK: DICCIONARIO VS GrafoCSR
+# ============================================
+def grafo_sintetico(num_nodos, grado=4, semilla=0):
+    """
+    Genera las aristas de un grafo dirigido aleatorio: cada nodo i se conecta con i + 1 y con
+    (grado - 1) nodos al azar, con costos enteros entre 1 y 10.
+    :return: Tres listas paralelas (origenes, destinos, costos).
+    """
+    generador = random.Random(semilla)
+    origenes, destinos, costos = array("i"), array("i"), array("d")
+    for i in range(num_nodos):
+        origenes.append(i)
+        destinos.append((i + 1) % num_nodos)
+        for _ in range(grado - 1):
+            origenes.append(i)
+            destinos.append(generador.randrange(num_nodos))
+    for _ in range(len(origenes)):
+        costos.append(generador.randint(1, 10))
+    return origenes, destinos, costos
+
+
+def grafo_malla(ancho, alto, semilla=0):
+    """
+    Genera las aristas de una malla de ancho x alto parecida a una red de calles: cada nodo se une
+    con su vecino derecho y su vecino inferior en ambos sentidos, con costos enteros entre 1 y 10.
+    :return: Tres listas paralelas (origenes, destinos, costos).
+    """
+    generador = random.Random(semilla)
+    origenes, destinos, costos = array("i"), array("i"), array("d")
+    for nodo in range(ancho * alto):
+        fila, columna = divmod(nodo, ancho)
+        for vecino in ((nodo + 1) if columna < ancho - 1 else None, (nodo + ancho) if fila < alto - 1 else None):
+            if vecino is not None:
+                costo = generador.randint(1, 10)
+                origenes.extend((nodo, vecino))
+                destinos.extend((vecino, nodo))
+                costos.extend((costo, costo))
+    return origenes, destinos, costos
+
+
+def tamano_diccionario(grafo):
+    """
+    Estima la memoria de un grafo en forma de diccionario (diccionario, listas, tuplas y nombres).
+    """
+    total = sys.getsizeof(grafo)
+    for nombre, vecinos in grafo.items():
+        total += sys.getsizeof(nombre) + sys.getsizeof(vecinos)
+        for vecino in vecinos:
+            if isinstance(vecino, tuple):
+                total += sys.getsizeof(vecino) + sys.getsizeof(vecino[1])
+    return total
+
+
+def benchmark(num_nodos=1_000_000, grado=4):
+    """
+    Compara memoria y tiempo de BFS y UCS sobre el mismo grafo sintético en forma de
+    diccionario de cadenas y en forma de GrafoCSR.
+    """
+    from _001_busqueda_en_anchura import bfs
+    from _002_busqueda_en_anchura_con_costo_uniforme import ucs
+
+    origenes, destinos, costos = grafo_sintetico(num_nodos, grado)
+    nombres = [f"n{i}" for i in range(num_nodos)]
+    inicio, objetivo = nombres[0], nombres[-1]
+    print(f"Grafo sintético: {num_nodos} nodos, {len(destinos)} aristas")
+
+    csr = GrafoCSR.desde_aristas(num_nodos, origenes, destinos, costos, nombres)
+    print(f"GrafoCSR: {csr.tamano_en_bytes() / 2**20:.1f} MiB en arreglos")
+
+    for nombre_busqueda, busqueda, ponderado in (("BFS", bfs, False), ("UCS", ucs, True)):
+        grafo = {nombre: [] for nombre in nombres}
+        for k in range(len(origenes)):
+            vecino = nombres[destinos[k]]
+            grafo[nombres[origenes[k]]].append((vecino, int(costos[k])) if ponderado else vecino)
+        memoria = tamano_diccionario(grafo)
+
+        t0 = time.perf_counter()
+        busqueda(grafo, inicio, objetivo)
+        t_diccionario = time.perf_counter() - t0
+        del grafo
+
+        t0 = time.perf_counter()
+        busqueda(csr, inicio, objetivo)
+        t_csr = time.perf_counter() - t0
+
+        print(f"{nombre_busqueda}: diccionario {memoria / 2**20:.1f} MiB, {t_diccionario:.2f} s | "
+              f"GrafoCSR {t_csr:.2f} s ({t_diccionario / t_csr:.1f}x)")
+
+
+if __name__ == "__main__":
+    # Compilamos el grafo de ciudades usado por UCS y buscamos sobre la versión compacta
+    from _002_busqueda_en_anchura_con_costo_uniforme import ucs
+
+    grafo_ciudades = {
+        "Ciudad de México": [("Guadalajara", 10), ("Monterrey", 15)],
+        "Guadalajara": [("Tijuana", 12), ("Cancún", 15)],
+        "Monterrey": [("Mérida", 10)],
+        "Tijuana": [("Chihuahua", 2)],
+        "Cancún": [("Chihuahua", 5)],
+        "Mérida": [("Chihuahua", 10)],
+        "Chihuahua": []
+    }
+    compilado = GrafoCSR.desde_diccionario(grafo_ciudades)
+    print(f"Nodos: {len(compilado)}, aristas: {compilado.num_aristas}")
+    print(f"Desplazamientos: {list(compilado.desplazamientos)}")
+    print(f"UCS sobre GrafoCSR: {ucs(compilado, 'Ciudad de México', 'Chihuahua')}")
+
+    # Nodos que solo aparecen como destino (sin clave propia en el diccionario)
+    solo_destinos = GrafoCSR.desde_diccionario({"A": ["B"], "B": {"C": 2}})
+    assert solo_destinos.nombres == ["A", "B", "C"]
+    assert list(solo_destinos.vecinos(solo_destinos.id_de("C"))) == []
+    assert ucs(solo_destinos, "A", "C") == (3, ["A", "B", "C"])
+
+    # Benchmark con un grafo sintético de un millón de nodos: python _008_grafo_csr.py --benchmark [num_nodos]
+    if "--benchmark" in sys.argv:
+        posicion = sys.argv.index("--benchmark")
+        argumentos = sys.argv[posicion + 1:posicion + 2]
+        benchmark(int(argumentos[0]) if argumentos else 1_000_000)
@@ -0,0 +1,325 @@
+# Núcleo de búsqueda compartido por BFS, UCS y la búsqueda en grafos.
+# En lugar de guardar en la frontera una copia completa del camino de cada nodo (path + [vecino]),
+# el núcleo mantiene un único mapa de predecesores y un conjunto de visitados. El camino solo se
+# reconstruye, siguiendo los predecesores hacia atrás, cuando se alcanza el objetivo.
+# - Con un diccionario, los predecesores y los visitados se guardan en un dict y un set.
+# - Con un GrafoCSR, se guardan en un array de enteros y en un mapa de bits (un bit por nodo).
+
+from array import array
+from collections import deque
+import heapq
+import math
+import sys
+import time
+
+from _008_grafo_csr import adaptar_grafo
+
+
+class EstadisticasBusqueda:
+    """
+    Contadores que el núcleo rellena durante una búsqueda.
+    """
+    def __init__(self):
+        self.nodos_expandidos = 0  # Nodos extraídos de la frontera y expandidos
+        self.nodos_generados = 0  # Entradas agregadas a la frontera
+        self.max_frontera = 0  # Tamaño máximo que alcanzó la frontera
+        self.bytes_asignados = 0  # Memoria estimada que reservaron las estructuras de la búsqueda
+
+    def __repr__(self):
+        return (f"EstadisticasBusqueda(expandidos={self.nodos_expandidos}, generados={self.nodos_generados}, "
+                f"max_frontera={self.max_frontera}, bytes_asignados={self.bytes_asignados})")
+
+
+class MapaDeBits:
+    """
+    Conjunto de enteros 0..n-1 guardado en un bit por elemento.
+    """
+    def __init__(self, tamano):
+        self.bits = bytearray((tamano + 7) >> 3)
+
+    def add(self, i):
+        self.bits[i >> 3] |= 1 << (i & 7)
+
+    def __contains__(self, i):
+        return self.bits[i >> 3] & (1 << (i & 7)) != 0
+
+    def __sizeof__(self):
+        return object.__sizeof__(self) + sys.getsizeof(self.bits)
+
+
+class _DiccionarioConDefecto(dict):
+    """
+    Diccionario que devuelve un valor por defecto para claves ausentes sin insertarlas.
+    """
+    def __init__(self, defecto):
+        super().__init__()
+        self.defecto = defecto
+
+    def __missing__(self, clave):
+        return self.defecto
+
+
+def _estructuras(grafo, ponderado):
+    """
+    Crea las estructuras de predecesores, visitados y mejor costo adecuadas al tipo de grafo.
+    """
+    if isinstance(grafo, dict):
+        mejor_costo = _DiccionarioConDefecto(math.inf) if ponderado else None
+        return {}, set(), mejor_costo
+    num_nodos = len(grafo)
+    mejor_costo = array("d", [math.inf]) * num_nodos if ponderado else None
+    return array("i", [-1]) * num_nodos, MapaDeBits(num_nodos), mejor_costo
+
+
+def reconstruir_camino(predecesores, inicio, nodo):
+    """
+    Reconstruye el camino desde inicio hasta nodo siguiendo el mapa de predecesores.
+    """
+    camino = [nodo]
+    while nodo != inicio:
+        nodo = predecesores[nodo]
+        camino.append(nodo)
+    return camino[::-1]
+
+
+def busqueda_con_predecesores(grafo, inicio, objetivo, estrategia="anchura", prueba_temprana=False,
+                              estadisticas=None):
+    """
+    Búsqueda genérica con mapa de predecesores y reconstrucción perezosa del camino.
+    :param grafo: Diccionario {nodo: [vecinos]} / {nodo: [(vecino, costo)]}, GrafoCSR o Problema
+                  (_015_problema_implicito.py), cuyos estados se generan bajo demanda.
+    :param inicio: Nodo inicial (con un Problema, None usa su estado inicial).
+    :param objetivo: Nodo objetivo (con un Problema se ignora y se usa su prueba de objetivo).
+    :param estrategia: "anchura" (cola FIFO) o "costo_uniforme" (cola de prioridad por costo acumulado).
+    :param prueba_temprana: Si es True, la prueba de objetivo se hace al generar el nodo y no al extraerlo
+                            (solo para la estrategia "anchura").
+    :param estadisticas: Objeto EstadisticasBusqueda opcional que se rellena durante la búsqueda.
+    :return: Tupla (costo, camino) o None si no se encuentra el objetivo.
+    """
+    if hasattr(grafo, "es_objetivo"):  # Problema con espacio de estados implícito
+        from _015_problema_implicito import resolver_problema
+
+        return resolver_problema(grafo, estrategia, inicio, estadisticas=estadisticas)
+    ponderado = estrategia == "costo_uniforme"
+    adaptado = adaptar_grafo(grafo, inicio, objetivo, ponderado=ponderado)
+    if adaptado is None:  # El inicio o el objetivo no existen en el GrafoCSR
+        return None
+    vecinos, inicio, objetivo, a_nombres = adaptado
+    if estadisticas is None:
+        estadisticas = EstadisticasBusqueda()
+    predecesores, visitados, mejor_costo = _estructuras(grafo, ponderado)
+
+    if ponderado:
+        resultado = _costo_uniforme(vecinos, inicio, objetivo, predecesores, visitados, mejor_costo, estadisticas)
+        # Cada entrada del montículo es una tupla (costo, nodo) con su costo en coma flotante
+        bytes_por_entrada = sys.getsizeof((0.0, inicio)) + sys.getsizeof(0.0)
+    else:
+        resultado = _anchura(vecinos, inicio, objetivo, predecesores, visitados, prueba_temprana, estadisticas)
+        bytes_por_entrada = 0  # La cola guarda referencias a nodos que ya existen
+
+    # Memoria de las estructuras que solo crecen más las entradas creadas para la frontera
+    estadisticas.bytes_asignados += (sys.getsizeof(predecesores) + sys.getsizeof(visitados)
+                                     + (sys.getsizeof(mejor_costo) if ponderado else 0)
+                                     + estadisticas.max_frontera * 8
+                                     + estadisticas.nodos_generados * bytes_por_entrada)
+    if resultado is None:
+        return None
+    costo, nodo = resultado
+    return costo, a_nombres(reconstruir_camino(predecesores, inicio, nodo))
+
+
+def _anchura(vecinos, inicio, objetivo, predecesores, visitados, prueba_temprana, estadisticas):
+    """
+    Recorrido en anchura: cada nodo se marca como visitado al agregarlo a la cola,
+    por lo que entra en la frontera una sola vez.
+    :return: Tupla (profundidad, nodo objetivo) o None.
+    """
+    if inicio == objetivo:
+        return 0, inicio
+    frontera = deque([inicio])
+    visitados.add(inicio)
+    max_frontera = 1
+
+    while frontera:
+        nodo = frontera.popleft()
+        if nodo == objetivo:
+            return _longitud(predecesores, inicio, nodo), nodo
+        estadisticas.nodos_expandidos += 1
+
+        for vecino in vecinos(nodo):
+            if vecino not in visitados:
+                visitados.add(vecino)
+                predecesores[vecino] = nodo
+                estadisticas.nodos_generados += 1
+                if prueba_temprana and vecino == objetivo:
+                    return _longitud(predecesores, inicio, vecino), vecino
+                frontera.append(vecino)
+        if len(frontera) > max_frontera:
+            max_frontera = len(frontera)
+        estadisticas.max_frontera = max_frontera
+
+    return None
+
+
+def _longitud(predecesores, inicio, nodo):
+    """
+    Número de aristas entre inicio y nodo según el mapa de predecesores.
+    """
+    longitud = 0
+    while nodo != inicio:
+        nodo = predecesores[nodo]
+        longitud += 1
+    return longitud
+
+
+def _costo_uniforme(vecinos, inicio, objetivo, predecesores, visitados, mejor_costo, estadisticas, pendientes=None):
+    """
+    Costo uniforme (Dijkstra) con eliminación perezosa: las entradas obsoletas del montículo se
+    descartan al extraerlas y solo se actualiza el predecesor cuando mejora el costo.
+    :param pendientes: Conjunto opcional de nodos; la búsqueda termina cuando todos se han cerrado.
+    :return: Tupla (costo, nodo objetivo) o None.
+    """
+    frontera = [(0, inicio)]
+    mejor_costo[inicio] = 0
+    max_frontera = 1
+
+    while frontera:
+        costo, nodo = heapq.heappop(frontera)
+        if nodo in visitados:  # Entrada obsoleta: el nodo ya se cerró con un costo menor
+            continue
+        if nodo == objetivo:
+            return costo, nodo
+        visitados.add(nodo)
+        estadisticas.nodos_expandidos += 1
+        if pendientes is not None and nodo in pendientes:
+            pendientes.discard(nodo)
+            if not pendientes:  # Todos los objetivos del barrido ya tienen su costo definitivo
+                return None
+
+        for vecino, costo_arista in vecinos(nodo):
+            if vecino in visitados:
+                continue
+            nuevo_costo = costo + costo_arista
+            if nuevo_costo < mejor_costo[vecino]:
+                mejor_costo[vecino] = nuevo_costo
+                predecesores[vecino] = nodo
+                heapq.heappush(frontera, (nuevo_costo, vecino))
+                estadisticas.nodos_generados += 1
+        if len(frontera) > max_frontera:
+            max_frontera = len(frontera)
+        estadisticas.max_frontera = max_frontera
+
+    return None
+
+
+_SIN_OBJETIVO = object()  # Objetivo que no coincide con ningún nodo
+
+
+def barrido_desde(grafo, origen, objetivos=None, estadisticas=None):
+    """
+    Costo uniforme desde un origen hacia todos los nodos alcanzables (sin objetivo).
+    :param grafo: Diccionario {nodo: [(vecino, costo)]} o GrafoCSR.
+    :param origen: Nodo de origen (nombre).
+    :param objetivos: Ids (GrafoCSR) o nombres (diccionario) opcionales; el barrido se detiene en cuanto
+                      todos tienen su distancia definitiva. Los demás nodos pueden quedar con una cota.
+    :param estadisticas: Objeto EstadisticasBusqueda opcional.
+    :return: Con un diccionario, {nodo: distancia} de los nodos alcanzables. Con un GrafoCSR,
+             array('d') indexado por id con math.inf en los nodos inalcanzables.
+    """
+    if not isinstance(grafo, dict):
+        origen_id = grafo.id_de(origen)
+        if origen_id is None:
+            raise KeyError(origen)
+        return barrido_desde_id(grafo, origen_id, objetivos, estadisticas)
+    vecinos, origen, _, _ = adaptar_grafo(grafo, origen, origen, ponderado=True)
+    predecesores, visitados, mejor_costo = _estructuras(grafo, ponderado=True)
+    # Sin objetivo alcanzable, la búsqueda cierra todo lo que se puede alcanzar desde el origen
+    pendientes = set(objetivos) if objetivos is not None else None
+    _costo_uniforme(vecinos, origen, _SIN_OBJETIVO, predecesores, visitados, mejor_costo,
+                    estadisticas or EstadisticasBusqueda(), pendientes)
+    return dict(mejor_costo)
+
+
+def barrido_desde_id(grafo, origen, objetivos=None, estadisticas=None):
+    """
+    barrido_desde sobre un GrafoCSR con el origen dado por su id. No consulta el índice de nombres,
+    así que los procesos que abren un grafo compartido y trabajan solo con ids nunca lo construyen.
+    :param origen: Id del nodo de origen.
+    :return: array('d') indexado por id con math.inf en los nodos inalcanzables.
+    """
+    if not 0 <= origen < len(grafo):
+        raise KeyError(origen)
+    predecesores, visitados, mejor_costo = _estructuras(grafo, ponderado=True)
+    pendientes = set(objetivos) if objetivos is not None else None
+    _costo_uniforme(grafo.vecinos_con_costo, origen, _SIN_OBJETIVO, predecesores, visitados, mejor_costo,
+                    estadisticas or EstadisticasBusqueda(), pendientes)
+    return mejor_costo
+
+
+# ============================================
+# COMPARACIÓN CON LA FRONTERA DE CAMINOS COPIADOS
+# ============================================
+def _bfs_con_copias(grafo, inicio, objetivo, estadisticas):
+    """
+    BFS original, que guarda en la cola una copia del camino de cada nodo, instrumentado
+    con las mismas estadísticas que el núcleo para poder comparar.
+    """
+    cola = deque([(inicio, [inicio])])
+    visitados = set()
+    while cola:
+        nodo, camino = cola.popleft()
+        if nodo == objetivo:
+            return camino
+        if nodo not in visitados:
+            visitados.add(nodo)
+            estadisticas.nodos_expandidos += 1
+            for vecino in grafo.get(nodo, []):
+                if vecino not in visitados:
+                    nuevo_camino = camino + [vecino]
+                    estadisticas.bytes_asignados += sys.getsizeof(nuevo_camino) + sys.getsizeof((vecino, nuevo_camino))
+                    estadisticas.nodos_generados += 1
+                    cola.append((vecino, nuevo_camino))
+            estadisticas.max_frontera = max(estadisticas.max_frontera, len(cola))
+    return None
+
+
+def comparar_en_cadena(longitud):
+    """
+    Compara memoria y tiempo del BFS con caminos copiados frente al núcleo con predecesores
+    en una cadena larga donde cada nodo tiene además una hoja lateral.
+    """
+    cadena = {}
+    for i in range(longitud):
+        cadena[i] = [i + 1, -i - 1]  # Siguiente eslabón y una hoja sin salida
+    inicio, objetivo = 0, longitud
+
+    for nombre, busqueda in (("Caminos copiados", lambda e: _bfs_con_copias(cadena, inicio, objetivo, e)),
+                             ("Predecesores", lambda e: busqueda_con_predecesores(cadena, inicio, objetivo,
+                                                                                  estadisticas=e))):
+        estadisticas = EstadisticasBusqueda()
+        t0 = time.perf_counter()
+        busqueda(estadisticas)
+        transcurrido = time.perf_counter() - t0
+        print(f"{nombre}: {transcurrido:.3f} s, max_frontera={estadisticas.max_frontera}, "
+              f"bytes_asignados={estadisticas.bytes_asignados / 2**20:.1f} MiB")
+
+
+if __name__ == "__main__":
+    grafo_ciudades = {
+        "Ciudad de México": [("Guadalajara", 10), ("Monterrey", 15)],
+        "Guadalajara": [("Tijuana", 12), ("Cancún", 15)],
+        "Monterrey": [("Mérida", 10)],
+        "Tijuana": [("Chihuahua", 2)],
+        "Cancún": [("Chihuahua", 5)],
+        "Mérida": [("Chihuahua", 10)],
+        "Chihuahua": []
+    }
+    estadisticas = EstadisticasBusqueda()
+    resultado = busqueda_con_predecesores(grafo_ciudades, "Ciudad de México", "Chihuahua",
+                                          estrategia="costo_uniforme", estadisticas=estadisticas)
+    print(f"Costo uniforme: {resultado}")
+    print(estadisticas)
+
+    # Con una cadena de 5000 eslabones, copiar el camino en cada paso cuesta memoria cuadrática
+    print("\nCadena de 5000 nodos:")
+    comparar_en_cadena(5000)
@@ -0,0 +1,151 @@
+# Motor de búsqueda en profundidad sin recursión, compartido por DFS, DLS e IDDFS.
+# Las versiones recursivas copian el camino (path + [vecino]) en cada nivel y fallan con
+# RecursionError en grafos con más de ~1000 niveles. Aquí la pila es explícita:
+# - camino[i] es el nodo en la profundidad i y iteradores[i] recorre sus vecinos pendientes.
+# - Los ciclos se evitan comprobando si el vecino ya está en el camino actual.
+# - La pila se reutiliza entre las iteraciones de IDDFS en lugar de crearse de nuevo en cada límite.
+
+from _008_grafo_csr import adaptar_grafo
+from _009_nucleo_de_busqueda import MapaDeBits
+
+_FIN = object()  # Marca de iterador agotado
+
+
+class PilaProfundidad:
+    """
+    Pila explícita reutilizable: las posiciones se sobrescriben en lugar de crear listas nuevas.
+    """
+    def __init__(self):
+        self.camino = []  # Nodo en cada profundidad
+        self.iteradores = []  # Vecinos pendientes de cada nodo del camino
+
+    def poner(self, profundidad, nodo, iterador):
+        """
+        Coloca un nodo y su iterador de vecinos en la profundidad indicada.
+        """
+        if profundidad < len(self.camino):
+            self.camino[profundidad] = nodo
+            self.iteradores[profundidad] = iterador
+        else:
+            self.camino.append(nodo)
+            self.iteradores.append(iterador)
+
+
+def _profundidad(vecinos, inicio, objetivo, limite, visitados, pila):
+    """
+    Búsqueda en profundidad con pila explícita.
+    :param vecinos: Función que devuelve los vecinos de un nodo.
+    :param limite: Profundidad máxima (None para no limitar).
+    :param visitados: Conjunto de visitados global (DFS) o None para comprobar solo el camino actual.
+    :param pila: PilaProfundidad que se reutiliza.
+    :return: Tupla (camino o None, podado). podado indica si algún nodo se dejó sin expandir por el límite.
+    """
+    if inicio == objetivo:
+        return [inicio], False
+    if limite == 0:  # El inicio está en el límite: solo importa si tiene sucesores
+        return None, any(vecino != inicio for vecino in vecinos(inicio))
+
+    en_camino = {inicio}
+    if visitados is not None:
+        visitados.add(inicio)
+    pila.poner(0, inicio, iter(vecinos(inicio)))
+    camino, iteradores = pila.camino, pila.iteradores
+    tope = 0
+    podado = False
+
+    while tope >= 0:
+        vecino = next(iteradores[tope], _FIN)
+        if vecino is _FIN:  # Sin vecinos pendientes: retrocedemos un nivel
+            en_camino.discard(camino[tope])
+            iteradores[tope] = None
+            tope -= 1
+            continue
+        if vecino in en_camino or (visitados is not None and vecino in visitados):
+            continue
+        if vecino == objetivo:
+            resultado = camino[:tope + 1]
+            resultado.append(vecino)
+            return resultado, podado
+        if limite is not None and tope + 1 >= limite:
+            # El vecino está en el límite: no se expande, pero recordamos si tenía por dónde seguir
+            if not podado:
+                podado = any(v != vecino and v not in en_camino for v in vecinos(vecino))
+            continue
+
+        tope += 1
+        pila.poner(tope, vecino, iter(vecinos(vecino)))
+        en_camino.add(vecino)
+        if visitados is not None:
+            visitados.add(vecino)
+
+    return None, podado
+
+
+def busqueda_en_profundidad(grafo, inicio, objetivo, limite=None, pila=None):
+    """
+    Búsqueda en profundidad (DFS) o en profundidad limitada (DLS) sin recursión.
+    Sin límite se comporta como DFS en grafos (no repite nodos visitados); con límite, como DLS,
+    evitando solo los ciclos del camino actual.
+    :param grafo: Diccionario que representa el grafo (nodo: [vecinos]) o GrafoCSR.
+    :param inicio: Nodo inicial.
+    :param objetivo: Nodo objetivo.
+    :param limite: Profundidad máxima permitida (None para DFS sin límite).
+    :param pila: PilaProfundidad opcional para reutilizar memoria entre llamadas.
+    :return: Lista con el camino al objetivo o None si no se encuentra.
+    """
+    adaptado = adaptar_grafo(grafo, inicio, objetivo)
+    if adaptado is None:  # El inicio o el objetivo no existen en el GrafoCSR
+        return None
+    vecinos, inicio, objetivo, a_nombres = adaptado
+
+    visitados = None
+    if limite is None:
+        visitados = set() if isinstance(grafo, dict) else MapaDeBits(len(grafo))
+    camino, _ = _profundidad(vecinos, inicio, objetivo, limite, visitados, pila or PilaProfundidad())
+    return a_nombres(camino) if camino else None
+
+
+def profundizacion_iterativa(grafo, inicio, objetivo, limite_maximo=None, al_iterar=None, detener_sin_poda=True):
+    """
+    Búsqueda en profundidad iterativa (IDDFS) sin recursión.
+    :param grafo: Diccionario que representa el grafo (nodo: [vecinos]) o GrafoCSR.
+    :param inicio: Nodo inicial.
+    :param objetivo: Nodo objetivo.
+    :param limite_maximo: Límite de profundidad más alto que se probará (None para no acotar).
+    :param al_iterar: Función opcional que se llama con cada límite antes de buscar con él.
+    :param detener_sin_poda: Si es True, termina en cuanto una iteración no deja ningún nodo sin
+                             expandir por el límite: una profundidad mayor no encontraría nada nuevo.
+    :return: Lista con el camino al objetivo o None si no se encuentra.
+    """
+    adaptado = adaptar_grafo(grafo, inicio, objetivo)
+    if adaptado is None:  # El inicio o el objetivo no existen en el GrafoCSR
+        return None
+    vecinos, inicio, objetivo, a_nombres = adaptado
+
+    pila = PilaProfundidad()  # La misma pila sirve para todas las iteraciones
+    profundidad = 0
+    while limite_maximo is None or profundidad <= limite_maximo:
+        if al_iterar is not None:
+            al_iterar(profundidad)
+        camino, podado = _profundidad(vecinos, inicio, objetivo, profundidad, None, pila)
+        if camino:
+            return a_nombres(camino)
+        if detener_sin_poda and not podado:  # Todo lo alcanzable ya se exploró
+            return None
+        profundidad += 1
+    return None
+
+
+if __name__ == "__main__":
+    # Una cadena de 10000 nodos supera el límite de recursión de Python
+    cadena = {i: [i + 1] for i in range(10_000)}
+    camino = busqueda_en_profundidad(cadena, 0, 10_000)
+    print(f"DFS en cadena de 10000 nodos: {len(camino)} nodos en el camino")
+    camino = profundizacion_iterativa(cadena, 9_990, 10_000)
+    print(f"IDDFS desde el nodo 9990: {camino}")
+
+    # Grafo con ciclo: IDDFS se detiene cuando una iteración no poda nada
+    grafo_con_ciclo = {"A": ["B"], "B": ["C", "A"], "C": ["A"], "D": []}
+    iteraciones = []
+    camino = profundizacion_iterativa(grafo_con_ciclo, "A", "D", al_iterar=iteraciones.append)
+    print(f"Objetivo inalcanzable: {camino} tras probar los límites {iteraciones}")
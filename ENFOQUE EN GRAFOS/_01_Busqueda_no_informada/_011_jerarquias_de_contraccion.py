@@ -0,0 +1,415 @@
+# Jerarquías de contracción (Contraction Hierarchies) para consultas repetidas de camino mínimo.
+# Cuando el grafo no cambia y se hacen muchas consultas, conviene pagar un preprocesamiento:
+# - Los nodos se ordenan por "importancia" y se contraen de uno en uno, del menos al más importante.
+# - Al contraer v, cada par u -> v -> w cuyo camino mínimo pasa por v recibe un atajo u -> w con el
+#   mismo costo (si una búsqueda local de "testigos" encuentra otro camino igual de barato, no hace falta).
+# - Al final, cada arista original o atajo va de un nodo a otro de rango mayor o menor. Una consulta
+#   solo sube: búsqueda hacia adelante desde el inicio por aristas que suben de rango y búsqueda hacia
+#   atrás desde el objetivo por aristas que también suben. Ambas exploran pocos cientos de nodos.
+# - Cada atajo recuerda el nodo intermedio contraído, así el camino se desempaqueta hasta las
+#   aristas originales.
+
+from array import array
+import heapq
+import math
+import os
+import pickle
+import random
+import struct
+import sys
+import tempfile
+import time
+
+from _008_grafo_csr import GrafoCSR, grafo_malla
+from _009_nucleo_de_busqueda import busqueda_con_predecesores
+
+_CABECERA = struct.Struct("<4sIqq")
+_FIRMA = b"CH01"
+
+
+class _Ascendente:
+    """
+    Aristas que suben de rango en formato CSR, con el nodo intermedio de cada atajo (-1 si es original).
+    """
+    def __init__(self, desplazamientos, destinos, costos, medios):
+        self.desplazamientos = desplazamientos  # array('q') de longitud n + 1
+        self.destinos = destinos  # array('i')
+        self.costos = costos  # array('d')
+        self.medios = medios  # array('i')
+
+    @classmethod
+    def desde_listas(cls, listas):
+        desplazamientos, destinos, costos, medios = array("q", [0]), array("i"), array("d"), array("i")
+        for aristas in listas:
+            for destino, (costo, medio) in aristas.items():
+                destinos.append(destino)
+                costos.append(costo)
+                medios.append(medio)
+            desplazamientos.append(len(destinos))
+        return cls(desplazamientos, destinos, costos, medios)
+
+    def buscar(self, nodo, destino):
+        """
+        Posición de la arista nodo -> destino en los arreglos.
+        """
+        for posicion in range(self.desplazamientos[nodo], self.desplazamientos[nodo + 1]):
+            if self.destinos[posicion] == destino:
+                return posicion
+        raise KeyError((nodo, destino))
+
+    def arreglos(self):
+        return self.desplazamientos, self.destinos, self.costos, self.medios
+
+
+class JerarquiaContraccion:
+    """
+    Índice de jerarquías de contracción: rango de cada nodo y grafos ascendentes hacia adelante y hacia atrás.
+    """
+    def __init__(self, nombres, rango, adelante, atras):
+        self.nombres = nombres  # Lista id -> nombre (la misma del GrafoCSR original)
+        self.indices = {nombre: i for i, nombre in enumerate(nombres)}
+        self.rango = rango  # array('i'): orden de contracción de cada nodo
+        self.adelante = adelante  # _Ascendente con las aristas u -> w, rango[w] > rango[u]
+        self.atras = atras  # _Ascendente con las aristas invertidas: en x se guarda u si existe u -> x y rango[u] > rango[x]
+
+    @property
+    def num_atajos(self):
+        return sum(1 for medio in self.adelante.medios if medio >= 0) + \
+               sum(1 for medio in self.atras.medios if medio >= 0)
+
+    def tamano_en_bytes(self):
+        """
+        Memoria ocupada por los arreglos del índice (sin contar la tabla de nombres).
+        """
+        arreglos = (self.rango,) + self.adelante.arreglos() + self.atras.arreglos()
+        return sum(arreglo.itemsize * len(arreglo) for arreglo in arreglos)
+
+    # ============================================
+    # CONSULTAS
+    # ============================================
+    def consulta(self, inicio, objetivo):
+        """
+        Camino mínimo entre dos nodos usando el índice.
+        :param inicio: Nodo inicial (nombre).
+        :param objetivo: Nodo objetivo (nombre).
+        :return: Tupla (costo, camino) como ucs, o None si no existe camino.
+        """
+        inicio_id, objetivo_id = self.indices.get(inicio), self.indices.get(objetivo)
+        if inicio_id is None or objetivo_id is None:
+            return None
+        resultado = self.consulta_ids(inicio_id, objetivo_id)
+        if resultado is None:
+            return None
+        costo, camino = resultado
+        return costo, [self.nombres[nodo] for nodo in camino]
+
+    def distancia(self, inicio_id, objetivo_id):
+        """
+        Solo el costo mínimo entre dos ids (sin desempaquetar el camino), o math.inf.
+        """
+        return self._encuentro(inicio_id, objetivo_id)[0]
+
+    def consulta_ids(self, inicio_id, objetivo_id):
+        """
+        Igual que consulta, pero con identificadores enteros.
+        """
+        costo, encuentro, aristas_adelante, aristas_atras = self._encuentro(inicio_id, objetivo_id)
+        if encuentro is None:
+            return None
+
+        # Aristas del tramo inicio -> encuentro (grafo adelante) y encuentro -> objetivo (grafo atrás)
+        tramo = []
+        nodo = encuentro
+        while nodo != inicio_id:
+            anterior, posicion = aristas_adelante[nodo]
+            tramo.append((anterior, nodo, self.adelante.medios[posicion]))
+            nodo = anterior
+        tramo.reverse()
+        nodo = encuentro
+        while nodo != objetivo_id:
+            siguiente, posicion = aristas_atras[nodo]
+            tramo.append((nodo, siguiente, self.atras.medios[posicion]))
+            nodo = siguiente
+
+        camino = [inicio_id]
+        for cola, cabeza, medio in tramo:
+            self._desempaquetar(cola, cabeza, medio, camino)
+        return costo, camino
+
+    def _encuentro(self, inicio_id, objetivo_id):
+        """
+        Búsqueda bidireccional ascendente.
+        :return: Tupla (costo, nodo de encuentro, aristas del árbol hacia adelante, aristas del árbol hacia atrás).
+        """
+        distancias = ({inicio_id: 0.0}, {objetivo_id: 0.0})
+        aristas = ({}, {})  # nodo -> (nodo previo en su búsqueda, posición de la arista)
+        fronteras = ([(0.0, inicio_id)], [(0.0, objetivo_id)])
+        cerrados = (set(), set())
+        grafos = (self.adelante, self.atras)
+        mejor, encuentro = math.inf, None
+        if inicio_id == objetivo_id:
+            mejor, encuentro = 0.0, inicio_id
+
+        activos = [True, True]
+        while activos[0] or activos[1]:
+            for lado in (0, 1):
+                if not activos[lado]:
+                    continue
+                frontera = fronteras[lado]
+                # Una dirección se detiene cuando su mínimo ya no puede mejorar el mejor encuentro
+                if not frontera or frontera[0][0] >= mejor:
+                    activos[lado] = False
+                    continue
+                costo, nodo = heapq.heappop(frontera)
+                if nodo in cerrados[lado]:
+                    continue
+                cerrados[lado].add(nodo)
+                otro = distancias[1 - lado].get(nodo)
+                if otro is not None and costo + otro < mejor:
+                    mejor, encuentro = costo + otro, nodo
+
+                grafo = grafos[lado]
+                distancia = distancias[lado]
+                for posicion in range(grafo.desplazamientos[nodo], grafo.desplazamientos[nodo + 1]):
+                    vecino = grafo.destinos[posicion]
+                    nuevo = costo + grafo.costos[posicion]
+                    if nuevo < distancia.get(vecino, math.inf):
+                        distancia[vecino] = nuevo
+                        aristas[lado][vecino] = (nodo, posicion)
+                        heapq.heappush(frontera, (nuevo, vecino))
+        return mejor, encuentro, aristas[0], aristas[1]
+
+    def _desempaquetar(self, cola, cabeza, medio, camino):
+        """
+        Agrega al camino los nodos originales de la arista cola -> cabeza (sin repetir cola).
+        """
+        pila = [(cola, cabeza, medio)]
+        while pila:
+            cola, cabeza, medio = pila.pop()
+            if medio < 0:
+                camino.append(cabeza)
+                continue
+            # El intermedio se contrajo antes que ambos extremos: cola -> medio está guardada en el grafo
+            # atrás de medio y medio -> cabeza en el grafo adelante de medio
+            primera = self.atras.medios[self.atras.buscar(medio, cola)]
+            segunda = self.adelante.medios[self.adelante.buscar(medio, cabeza)]
+            pila.append((medio, cabeza, segunda))
+            pila.append((cola, medio, primera))
+
+    # ============================================
+    # PERSISTENCIA
+    # ============================================
+    def guardar(self, ruta):
+        """
+        Escribe el índice en un archivo binario: cabecera, arreglos y la tabla de nombres al final.
+        """
+        with open(ruta, "wb") as archivo:
+            archivo.write(_CABECERA.pack(_FIRMA, len(self.nombres), len(self.adelante.destinos),
+                                         len(self.atras.destinos)))
+            self.rango.tofile(archivo)
+            for arreglo in self.adelante.arreglos() + self.atras.arreglos():
+                arreglo.tofile(archivo)
+            pickle.dump(self.nombres, archivo)
+
+    @classmethod
+    def cargar(cls, ruta):
+        """
+        Lee un índice escrito con guardar.
+        """
+        with open(ruta, "rb") as archivo:
+            firma, n, m_adelante, m_atras = _CABECERA.unpack(archivo.read(_CABECERA.size))
+            if firma != _FIRMA:
+                raise ValueError(f"{ruta} no contiene una jerarquía de contracción")
+
+            def leer(tipo, cantidad):
+                arreglo = array(tipo)
+                arreglo.fromfile(archivo, cantidad)
+                return arreglo
+
+            rango = leer("i", n)
+            grafos = []
+            for m in (m_adelante, m_atras):
+                grafos.append(_Ascendente(leer("q", n + 1), leer("i", m), leer("d", m), leer("i", m)))
+            nombres = pickle.load(archivo)
+        return cls(nombres, rango, *grafos)
+
+
+# ============================================
+# PREPROCESAMIENTO
+# ============================================
+def _testigos(salientes, origen, excluido, limite, max_asentados):
+    """
+    Dijkstra local desde origen que no pasa por el nodo excluido.
+    Se detiene al superar el costo límite o tras asentar max_asentados nodos; no encontrar un testigo
+    solo provoca un atajo de más, nunca un resultado incorrecto.
+    :return: Diccionario {nodo: costo} con las distancias encontradas.
+    """
+    distancias = {origen: 0.0}
+    frontera = [(0.0, origen)]
+    asentados = 0
+    while frontera and asentados < max_asentados:
+        costo, nodo = heapq.heappop(frontera)
+        if costo > limite:
+            break
+        if costo > distancias[nodo]:
+            continue
+        asentados += 1
+        for vecino, (costo_arista, _) in salientes[nodo].items():
+            nuevo = costo + costo_arista
+            if vecino != excluido and nuevo < distancias.get(vecino, math.inf):
+                distancias[vecino] = nuevo
+                heapq.heappush(frontera, (nuevo, vecino))
+    return distancias
+
+
+def _atajos(salientes, entrantes, nodo, max_asentados):
+    """
+    Atajos (u, w, costo) necesarios para contraer un nodo.
+    """
+    atajos = []
+    for u, (costo_entrada, _) in entrantes[nodo].items():
+        salidas = [(w, costo) for w, (costo, _) in salientes[nodo].items() if w != u]
+        if not salidas:
+            continue
+        limite = costo_entrada + max(costo for _, costo in salidas)
+        distancias = _testigos(salientes, u, nodo, limite, max_asentados)
+        for w, costo_salida in salidas:
+            if distancias.get(w, math.inf) > costo_entrada + costo_salida:
+                atajos.append((u, w, costo_entrada + costo_salida))
+    return atajos
+
+
+def construir_jerarquia(grafo, max_asentados=50, al_avanzar=None):
+    """
+    Ordena y contrae todos los nodos de un GrafoCSR.
+    La importancia de un nodo es su diferencia de aristas (atajos que crearía menos aristas que quita)
+    más el número de vecinos ya contraídos y su nivel en la jerarquía, que reparten las contracciones
+    por todo el grafo y mantienen baja la altura de las búsquedas ascendentes.
+    Las prioridades se actualizan de forma perezosa: al extraer un nodo se recalcula y, si ya no es
+    el mínimo, vuelve al montículo.
+    :param grafo: GrafoCSR ponderado.
+    :param max_asentados: Nodos que puede asentar cada búsqueda de testigos.
+    :param al_avanzar: Función opcional que recibe el número de nodos contraídos cada 10000 contracciones.
+    :return: JerarquiaContraccion.
+    """
+    n = len(grafo)
+    salientes = [{} for _ in range(n)]  # salientes[u][w] = (costo, medio)
+    entrantes = [{} for _ in range(n)]  # entrantes[w][u] = (costo, medio)
+    for u in range(n):
+        for w, costo in grafo.vecinos_con_costo(u):
+            if w != u and costo < salientes[u].get(w, (math.inf,))[0]:  # Solo la arista paralela más barata
+                salientes[u][w] = entrantes[w][u] = (costo, -1)
+
+    vecinos_contraidos = array("i", bytes(4 * n))
+    nivel = array("i", bytes(4 * n))  # Uno más que el mayor nivel de los vecinos ya contraídos
+
+    def prioridad(nodo):
+        atajos = _atajos(salientes, entrantes, nodo, max_asentados)
+        return len(atajos) - len(salientes[nodo]) - len(entrantes[nodo]) + vecinos_contraidos[nodo] + nivel[nodo]
+
+    monticulo = [(prioridad(nodo), nodo) for nodo in range(n)]
+    heapq.heapify(monticulo)
+    rango = array("i", bytes(4 * n))
+    adelante, atras = [None] * n, [None] * n
+    contraidos = 0
+    while monticulo:
+        _, nodo = heapq.heappop(monticulo)
+        actual = prioridad(nodo)
+        if monticulo and actual > monticulo[0][0]:  # Prioridad desactualizada: vuelve al montículo
+            heapq.heappush(monticulo, (actual, nodo))
+            continue
+
+        for u, w, costo in _atajos(salientes, entrantes, nodo, max_asentados):
+            if costo < salientes[u].get(w, (math.inf,))[0]:
+                salientes[u][w] = entrantes[w][u] = (costo, nodo)
+
+        # Todos los vecinos que quedan se contraerán después: sus aristas suben de rango
+        rango[nodo] = contraidos
+        adelante[nodo], atras[nodo] = salientes[nodo], entrantes[nodo]
+        for vecino in set(salientes[nodo]) | set(entrantes[nodo]):
+            vecinos_contraidos[vecino] += 1
+            if nivel[nodo] + 1 > nivel[vecino]:
+                nivel[vecino] = nivel[nodo] + 1
+        for w in salientes[nodo]:
+            del entrantes[w][nodo]
+        for u in entrantes[nodo]:
+            del salientes[u][nodo]
+        salientes[nodo], entrantes[nodo] = {}, {}
+
+        contraidos += 1
+        if al_avanzar is not None and contraidos % 10_000 == 0:
+            al_avanzar(contraidos)
+
+    return JerarquiaContraccion(grafo.nombres, rango, _Ascendente.desde_listas(adelante),
+                                _Ascendente.desde_listas(atras))
+
+
+# ============================================
+# BENCHMARK
+# ============================================
+def _percentil(valores, p):
+    return valores[min(len(valores) - 1, int(p / 100 * len(valores)))]
+
+
+def benchmark(ancho=100, alto=100, consultas=1000, semilla=1):
+    """
+    Mide preprocesamiento, tamaño del índice y latencia de consultas frente a UCS en una malla vial.
+    """
+    grafo = GrafoCSR.desde_aristas(ancho * alto, *grafo_malla(ancho, alto))
+    print(f"Malla {ancho}x{alto}: {len(grafo)} nodos, {grafo.num_aristas} aristas")
+
+    t0 = time.perf_counter()
+    jerarquia = construir_jerarquia(grafo, al_avanzar=lambda k: print(f"  {k} nodos contraídos"))
+    print(f"Preprocesamiento: {time.perf_counter() - t0:.1f} s, {jerarquia.num_atajos} atajos")
+
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "malla.ch")
+        jerarquia.guardar(ruta)
+        print(f"Índice: {jerarquia.tamano_en_bytes() / 2**20:.2f} MiB en memoria, "
+              f"{os.path.getsize(ruta) / 2**20:.2f} MiB en disco")
+        jerarquia = JerarquiaContraccion.cargar(ruta)
+
+    generador = random.Random(semilla)
+    pares = [(generador.randrange(len(grafo)), generador.randrange(len(grafo))) for _ in range(consultas)]
+    latencias = {"CH (solo costo)": [], "CH (con camino)": [], "UCS": []}
+    for indice, (inicio, objetivo) in enumerate(pares):
+        t0 = time.perf_counter()
+        costo = jerarquia.distancia(inicio, objetivo)
+        t1 = time.perf_counter()
+        costo_ch, camino = jerarquia.consulta_ids(inicio, objetivo)
+        t2 = time.perf_counter()
+        latencias["CH (solo costo)"].append(t1 - t0)
+        latencias["CH (con camino)"].append(t2 - t1)
+        if indice < 50:  # UCS es mucho más lento: basta con una muestra para comparar y verificar
+            t0 = time.perf_counter()
+            costo_ucs, camino_ucs = busqueda_con_predecesores(grafo, inicio, objetivo, "costo_uniforme")
+            latencias["UCS"].append(time.perf_counter() - t0)
+            assert costo == costo_ch == costo_ucs, (inicio, objetivo, costo, costo_ucs)
+            assert sum(dict(grafo.vecinos_con_costo(a))[b] for a, b in zip(camino, camino[1:])) == costo_ucs
+
+    for nombre, valores in latencias.items():
+        valores.sort()
+        print(f"  {nombre}: p50 {_percentil(valores, 50) * 1e6:.0f} µs, p90 {_percentil(valores, 90) * 1e6:.0f} µs, "
+              f"p99 {_percentil(valores, 99) * 1e6:.0f} µs ({len(valores)} consultas)")
+
+
+if __name__ == "__main__":
+    # Índice sobre el grafo de ciudades del ejemplo de UCS
+    grafo_ciudades = {
+        "Ciudad de México": [("Guadalajara", 10), ("Monterrey", 15)],
+        "Guadalajara": [("Tijuana", 12), ("Cancún", 15)],
+        "Monterrey": [("Mérida", 10)],
+        "Tijuana": [("Chihuahua", 2)],
+        "Cancún": [("Chihuahua", 5)],
+        "Mérida": [("Chihuahua", 10)],
+        "Chihuahua": []
+    }
+    jerarquia = construir_jerarquia(GrafoCSR.desde_diccionario(grafo_ciudades))
+    print(f"Orden de contracción: {sorted(jerarquia.nombres, key=lambda nombre: jerarquia.rango[jerarquia.indices[nombre]])}")
+    print(f"CH: {jerarquia.consulta('Ciudad de México', 'Chihuahua')}")
+
+    # Malla de 200x200: python _011_jerarquias_de_contraccion.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark(200, 200)
+    else:
+        benchmark(50, 50, consultas=300)
@@ -0,0 +1,173 @@
+# Matrices de distancias uno a muchos y muchos a muchos.
+# Los algoritmos del viajero (por ejemplo, algoritmo_genetico) necesitan la distancia entre cada par de
+# ciudades. Calcularla con una llamada a ucs por par cuesta N² búsquedas; en cambio, un solo barrido de
+# costo uniforme desde un origen cierra todos sus destinos a la vez, así que bastan N barridos.
+# - distancias_uno_a_muchos: un barrido que se detiene en cuanto todos los objetivos tienen su costo.
+# - matriz_de_distancias: un barrido por origen, repartidos entre procesos que leen el grafo desde
+#   memoria compartida y escriben su fila directamente en la matriz de salida (también compartida).
+
+from array import array
+import math
+from multiprocessing import Pool, shared_memory
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+from _008_grafo_csr import GrafoCSR, GrafoCompartido, abrir_grafo_compartido, grafo_malla
+from _009_nucleo_de_busqueda import barrido_desde, barrido_desde_id, busqueda_con_predecesores
+
+
+def distancias_uno_a_muchos(grafo, origen, objetivos):
+    """
+    Distancias desde un origen hasta varios objetivos con un único barrido de costo uniforme.
+    :param grafo: Diccionario {nodo: [(vecino, costo)]} o GrafoCSR.
+    :param origen: Nodo de origen (nombre).
+    :param objetivos: Lista de nodos objetivo (nombres).
+    :return: Lista de distancias en el orden de objetivos (math.inf si un objetivo es inalcanzable).
+    """
+    if isinstance(grafo, dict):
+        distancias = barrido_desde(grafo, origen, objetivos)
+        return [distancias.get(objetivo, math.inf) for objetivo in objetivos]
+    ids = _a_ids(grafo, objetivos)
+    distancias = barrido_desde(grafo, origen, ids)
+    return [distancias[i] for i in ids]
+
+
+def _a_ids(grafo, nombres):
+    """
+    Convierte nombres de nodos a ids del GrafoCSR; un nombre desconocido lanza KeyError.
+    """
+    return [grafo.indices[nombre] for nombre in nombres]
+
+
+# ============================================
+# MATRIZ MUCHOS A MUCHOS
+# ============================================
+_trabajador = {}  # Estado de cada proceso de trabajo: grafo compartido, objetivos y matriz de salida
+
+
+def _iniciar_trabajador(descriptor, nombre_salida, objetivos):
+    """
+    Abre el grafo y la matriz de salida compartidos una sola vez por proceso.
+    """
+    grafo, bloque = abrir_grafo_compartido(descriptor)
+    salida = shared_memory.SharedMemory(name=nombre_salida)
+    _trabajador.update(grafo=grafo, bloques=(bloque, salida), salida=salida.buf.cast("d"), objetivos=objetivos)
+
+
+def _calcular_fila(tarea):
+    """
+    Barrido desde un origen; la fila se escribe directamente en la matriz compartida.
+    """
+    fila, origen = tarea
+    objetivos = _trabajador["objetivos"]
+    distancias = barrido_desde_id(_trabajador["grafo"], origen, objetivos)
+    k = len(objetivos)
+    _trabajador["salida"][fila * k:(fila + 1) * k] = array("d", [distancias[i] for i in objetivos])
+    return fila
+
+
+def matriz_de_distancias(grafo, origenes, objetivos=None, procesos=None):
+    """
+    Matriz de distancias mínimas entre cada origen y cada objetivo.
+    :param grafo: Diccionario {nodo: [(vecino, costo)]} o GrafoCSR.
+    :param origenes: Lista de nodos de origen (nombres).
+    :param objetivos: Lista de nodos objetivo (nombres); por defecto, los mismos orígenes.
+    :param procesos: Número de procesos (None para usar todos los núcleos, 1 para no crear procesos).
+    :return: numpy.ndarray de forma (len(origenes), len(objetivos)) con np.inf en los pares sin camino.
+    """
+    if isinstance(grafo, dict):
+        grafo = GrafoCSR.desde_diccionario(grafo)
+    if objetivos is None:
+        objetivos = origenes
+    ids_origenes, ids_objetivos = _a_ids(grafo, origenes), _a_ids(grafo, objetivos)
+    procesos = min(procesos or os.cpu_count() or 1, len(ids_origenes))
+
+    if procesos <= 1:
+        matriz = np.empty((len(ids_origenes), len(ids_objetivos)), dtype=np.float64)
+        columnas = np.array(ids_objetivos, dtype=np.intp)
+        for fila, origen in enumerate(ids_origenes):
+            distancias = barrido_desde_id(grafo, origen, ids_objetivos)
+            matriz[fila] = np.frombuffer(distancias, dtype=np.float64)[columnas]
+        return matriz
+
+    compartido = GrafoCompartido(grafo)
+    salida = shared_memory.SharedMemory(create=True, size=max(8, 8 * len(ids_origenes) * len(ids_objetivos)))
+    try:
+        with Pool(procesos, _iniciar_trabajador, (compartido.descriptor, salida.name, ids_objetivos)) as grupo:
+            for _ in grupo.imap_unordered(_calcular_fila, enumerate(ids_origenes)):
+                pass
+        vista = np.ndarray((len(ids_origenes), len(ids_objetivos)), dtype=np.float64, buffer=salida.buf)
+        matriz = vista.copy()
+        del vista  # La vista debe soltarse antes de cerrar el bloque
+    finally:
+        salida.close()
+        salida.unlink()
+        compartido.liberar()
+    return matriz
+
+
+# ============================================
+# BENCHMARK: UCS POR PAR VS BARRIDOS
+# ============================================
+def benchmark(ancho=100, alto=100, ciudades=20, procesos=None, semilla=1):
+    """
+    Compara una búsqueda UCS por par con un barrido por origen (en serie y en paralelo).
+    """
+    grafo = GrafoCSR.desde_aristas(ancho * alto, *grafo_malla(ancho, alto))
+    elegidas = random.Random(semilla).sample(range(len(grafo)), ciudades)
+    print(f"Malla {ancho}x{alto}, {ciudades} ciudades")
+
+    t0 = time.perf_counter()
+    por_pares = np.array([[busqueda_con_predecesores(grafo, a, b, "costo_uniforme")[0] for b in elegidas]
+                          for a in elegidas])
+    t_pares = time.perf_counter() - t0
+    print(f"  UCS por par ({ciudades * ciudades} búsquedas): {t_pares:.2f} s")
+
+    for nombre, numero in (("Barridos en serie", 1), ("Barridos en paralelo", procesos)):
+        t0 = time.perf_counter()
+        matriz = matriz_de_distancias(grafo, elegidas, procesos=numero)
+        transcurrido = time.perf_counter() - t0
+        assert np.array_equal(matriz, por_pares)
+        print(f"  {nombre} ({ciudades} barridos): {transcurrido:.2f} s ({t_pares / transcurrido:.1f}x)")
+
+
+if __name__ == "__main__":
+    grafo_ciudades = {
+        "Ciudad de México": [("Guadalajara", 10), ("Monterrey", 15)],
+        "Guadalajara": [("Tijuana", 12), ("Cancún", 15), ("Ciudad de México", 10)],
+        "Monterrey": [("Mérida", 10), ("Ciudad de México", 15)],
+        "Tijuana": [("Chihuahua", 2), ("Guadalajara", 12)],
+        "Cancún": [("Chihuahua", 5), ("Guadalajara", 15)],
+        "Mérida": [("Chihuahua", 10), ("Monterrey", 10)],
+        "Chihuahua": [("Tijuana", 2), ("Cancún", 5), ("Mérida", 10)]
+    }
+    print(f"Desde Ciudad de México: {distancias_uno_a_muchos(grafo_ciudades, 'Ciudad de México', ['Chihuahua', 'Mérida'])}")
+
+    # La matriz se usa directamente en el algoritmo genético, con las ciudades como índices
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "_02_Busqueda_Informada"))
+    from _009_Algoritmos_Genéticos import algoritmo_genetico
+
+    ciudades = ["Ciudad de México", "Tijuana", "Cancún", "Mérida", "Monterrey"]
+    matriz = matriz_de_distancias(grafo_ciudades, ciudades, procesos=2)
+    print(matriz)
+    mejor_ruta, mejor_distancia = algoritmo_genetico(list(range(len(ciudades))), matriz, 10, 100, 0.1)
+    print(f"Mejor ruta: {[ciudades[i] for i in mejor_ruta]}, distancia {mejor_distancia}")
+
+    # Un trabajador que abre el grafo compartido y barre por id no construye el índice de nombres
+    compartido = GrafoCompartido(GrafoCSR.desde_aristas(100, *grafo_malla(10, 10)))
+    grafo_trabajador, bloque = abrir_grafo_compartido(compartido.descriptor)
+    distancias = barrido_desde_id(grafo_trabajador, 0, [99])
+    assert distancias[99] < math.inf and grafo_trabajador._indices is None
+    del grafo_trabajador, distancias  # Las vistas deben soltarse antes de cerrar el bloque
+    bloque.close()
+    compartido.liberar()
+
+    # Malla de 300x300 con 60 ciudades: python _012_matriz_de_distancias.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark(300, 300, ciudades=60)
+    else:
+        benchmark()
@@ -0,0 +1,426 @@
+# Caché de resultados de búsqueda con invalidación por versión del grafo.
+# Un servicio de rutas repite muchas veces las mismas consultas (inicio, objetivo). La caché guarda
+# el resultado de cada consulta bajo la clave (algoritmo, inicio, objetivo) de un grafo y una versión:
+# - GrafoVersionado es un diccionario que incrementa su versión con cada modificación; al consultar con
+#   una versión distinta, las entradas del grafo se descartan.
+# - La capacidad es fija y se expulsa la entrada menos reciente (LRU) o la menos usada (LFU).
+# - Reutilización de subcaminos: todo subcamino de un camino mínimo también es mínimo, así que un
+#   camino A -> ... -> B -> ... -> Y -> ... -> Z guardado responde la consulta B -> Y sin buscar.
+# - Las búsquedas informadas reciben además una heurística (busqueda_a_estrella(grafo, heuristica, inicio,
+#   objetivo)); envolver_con_heuristica la fija y da a cada envoltura su propio nombre en la clave, así que
+#   dos heurísticas distintas nunca comparten resultados.
+# - Los contadores de aciertos, fallos, expulsiones e invalidaciones sirven para monitorear la caché.
+
+from collections import OrderedDict
+from itertools import count
+import os
+import random
+import sys
+import time
+import weakref
+
+from _002_busqueda_en_anchura_con_costo_uniforme import ucs
+
+
+class GrafoVersionado(dict):
+    """
+    Diccionario de adyacencia con un número de versión que aumenta con cada modificación.
+    Las búsquedas lo aceptan como cualquier otro diccionario. Si se modifica una lista de vecinos
+    directamente (grafo["A"].append(...)), hay que llamar a tocar() para que la caché se entere.
+    """
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.version = 0
+
+    def tocar(self):
+        """
+        Marca el grafo como modificado.
+        """
+        self.version += 1
+
+    def __setitem__(self, clave, valor):
+        super().__setitem__(clave, valor)
+        self.tocar()
+
+    def __delitem__(self, clave):
+        super().__delitem__(clave)
+        self.tocar()
+
+    def update(self, *args, **kwargs):
+        super().update(*args, **kwargs)
+        self.tocar()
+
+    def pop(self, *args):
+        resultado = super().pop(*args)
+        self.tocar()
+        return resultado
+
+    def popitem(self):
+        resultado = super().popitem()
+        self.tocar()
+        return resultado
+
+    def setdefault(self, clave, defecto=None):
+        if clave not in self:
+            self.tocar()
+        return super().setdefault(clave, defecto)
+
+    def clear(self):
+        super().clear()
+        self.tocar()
+
+    def agregar_arista(self, origen, destino, costo=None):
+        """
+        Agrega la arista origen -> destino (con costo, si se indica) y aumenta la versión.
+        """
+        self.setdefault(origen, []).append(destino if costo is None else (destino, costo))
+        self.tocar()
+
+    def quitar_arista(self, origen, destino):
+        """
+        Quita todas las aristas origen -> destino y aumenta la versión.
+        """
+        self[origen] = [vecino for vecino in self.get(origen, [])
+                        if (vecino[0] if isinstance(vecino, tuple) else vecino) != destino]
+
+
+def _costo_arista(grafo, origen, destino):
+    """
+    Costo de la arista más barata origen -> destino en un diccionario o GrafoCSR.
+    """
+    if isinstance(grafo, dict):
+        vecinos = grafo.get(origen, ())
+        if isinstance(vecinos, dict):
+            return vecinos[destino]
+        return min(vecino[1] if isinstance(vecino, tuple) else 1 for vecino in vecinos
+                   if (vecino[0] if isinstance(vecino, tuple) else vecino) == destino)
+    destino_id = grafo.id_de(destino)
+    return min(costo for vecino, costo in grafo.vecinos_con_costo(grafo.id_de(origen)) if vecino == destino_id)
+
+
+# Cómo leer y construir el resultado de cada tipo de algoritmo: "camino" (bfs, dfs y, con
+# envolver_con_heuristica, busqueda_a_estrella) devuelve una lista; "costo_y_camino" (ucs, buscar_camino del
+# motor A*) devuelve una tupla (costo, camino)
+_FORMATOS = {
+    "camino": (lambda resultado: (None, resultado), lambda costo, camino: camino),
+    "costo_y_camino": (lambda resultado: resultado, lambda costo, camino: (costo, camino)),
+}
+
+
+class _Entrada:
+    """
+    Resultado guardado: camino, posición de cada nodo en él y costos acumulados (para los subcaminos).
+    """
+    __slots__ = ("camino", "costo", "posiciones", "acumulados", "usos")
+
+    def __init__(self, camino, costo, acumulados):
+        self.camino = camino
+        self.costo = costo
+        self.posiciones = {nodo: i for i, nodo in enumerate(camino)} if camino else {}
+        self.acumulados = acumulados  # acumulados[i] = costo del camino hasta camino[i] (o None)
+        self.usos = 1
+
+
+class CacheDeCaminos:
+    """
+    Caché acotada de resultados de búsqueda con política LRU o LFU.
+    """
+    def __init__(self, capacidad=1024, politica="lru"):
+        if politica not in ("lru", "lfu"):
+            raise ValueError(f"Política desconocida: {politica}")
+        if capacidad < 1:
+            raise ValueError(f"La capacidad debe ser al menos 1: {capacidad}")
+        self.capacidad = capacidad
+        self.politica = politica
+        self._entradas = OrderedDict()  # (id del grafo, algoritmo, inicio, objetivo) -> _Entrada
+        self._frecuencias = {}  # LFU: número de usos -> OrderedDict de claves con ese número
+        self._min_frecuencia = 0
+        self._versiones = {}  # id del grafo -> [grafo, versión de sus entradas, número de entradas]
+        self._por_nodo = {}  # (id del grafo, algoritmo, nodo) -> claves cuyos caminos óptimos lo contienen
+        self._envolturas = count()  # Numera las envolturas con heurística
+        self.aciertos = 0
+        self.aciertos_subcamino = 0
+        self.fallos = 0
+        self.expulsiones = 0
+        self.invalidaciones = 0
+
+    def __len__(self):
+        return len(self._entradas)
+
+    def estadisticas(self):
+        """
+        Contadores para monitoreo.
+        """
+        consultas = self.aciertos + self.aciertos_subcamino + self.fallos
+        return {"entradas": len(self._entradas), "aciertos": self.aciertos,
+                "aciertos_subcamino": self.aciertos_subcamino, "fallos": self.fallos,
+                "expulsiones": self.expulsiones, "invalidaciones": self.invalidaciones,
+                "tasa_de_aciertos": (self.aciertos + self.aciertos_subcamino) / consultas if consultas else 0.0}
+
+    # ============================================
+    # CONSULTAS
+    # ============================================
+    def consultar(self, algoritmo, grafo, inicio, objetivo, calcular, formato="camino", optimo=True):
+        """
+        Devuelve el resultado guardado o lo calcula y lo guarda.
+        :param algoritmo: Nombre del algoritmo (forma parte de la clave).
+        :param grafo: Grafo consultado; su atributo version (si lo tiene) invalida las entradas viejas.
+        :param inicio: Nodo inicial.
+        :param objetivo: Nodo objetivo.
+        :param calcular: Función sin argumentos que ejecuta la búsqueda en caso de fallo.
+        :param formato: "camino" o "costo_y_camino", según lo que devuelva el algoritmo.
+        :param optimo: Si es True, los caminos del algoritmo son mínimos y se reutilizan sus subcaminos.
+        :return: El mismo resultado que devolvería calcular().
+        """
+        extraer, construir = _FORMATOS[formato]
+        version = self._revisar_version(grafo)
+        clave = (id(grafo), algoritmo, inicio, objetivo)
+
+        entrada = self._entradas.get(clave)
+        if entrada is not None:
+            self.aciertos += 1
+            self._usar(clave, entrada)
+            if entrada.camino is None:  # Consulta sin camino guardada como resultado negativo
+                return None
+            return construir(entrada.costo, list(entrada.camino))
+
+        if optimo:
+            subcamino = self._buscar_subcamino(id(grafo), algoritmo, inicio, objetivo, formato)
+            if subcamino is not None:
+                self.aciertos_subcamino += 1
+                return construir(*subcamino)
+
+        self.fallos += 1
+        resultado = calcular()
+        costo, camino = extraer(resultado) if resultado is not None else (None, None)
+        acumulados = None
+        if optimo and camino and formato == "costo_y_camino":
+            acumulados = [0]
+            for origen, destino in zip(camino, camino[1:]):
+                acumulados.append(acumulados[-1] + _costo_arista(grafo, origen, destino))
+        self._guardar(clave, _Entrada(list(camino) if camino is not None else None, costo, acumulados), optimo,
+                      grafo, version)
+        return resultado
+
+    def envolver(self, funcion, formato="camino", optimo=True, nombre=None):
+        """
+        Devuelve una versión con caché de una búsqueda con firma (grafo, inicio, objetivo), como bfs o ucs.
+        """
+        nombre = nombre or funcion.__name__
+
+        def con_cache(grafo, inicio, objetivo):
+            return self.consultar(nombre, grafo, inicio, objetivo, lambda: funcion(grafo, inicio, objetivo),
+                                  formato, optimo)
+        return con_cache
+
+    def envolver_con_heuristica(self, funcion, heuristica, formato="camino", optimo=True, nombre=None):
+        """
+        Devuelve una versión con caché de una búsqueda informada con la heurística fija, como
+        busqueda_a_estrella(grafo, heuristica, inicio, objetivo) o buscar_camino(grafo, inicio, objetivo,
+        heuristica). La función se llama con grafo posicional y el resto por nombre.
+        :param heuristica: Heurística que se pasa en cada búsqueda.
+        :param optimo: True solo si la heurística es admisible y, por tanto, los caminos son mínimos.
+        :return: Función con firma (grafo, inicio, objetivo).
+        """
+        # Cada envoltura tiene su propio algoritmo en la clave: un id de heurística podría reutilizarse
+        # cuando esta se libera, un número de envoltura no
+        nombre = (nombre or funcion.__name__, next(self._envolturas))
+
+        def con_cache(grafo, inicio, objetivo):
+            return self.consultar(nombre, grafo, inicio, objetivo,
+                                  lambda: funcion(grafo, heuristica=heuristica, inicio=inicio, objetivo=objetivo),
+                                  formato, optimo)
+        return con_cache
+
+    def _buscar_subcamino(self, grafo_id, algoritmo, inicio, objetivo, formato):
+        """
+        Busca un camino guardado que pase por inicio y después por objetivo.
+        :return: Tupla (costo, camino) del subcamino o None.
+        """
+        for clave in self._por_nodo.get((grafo_id, algoritmo, inicio), ()):
+            entrada = self._entradas[clave]
+            i, j = entrada.posiciones[inicio], entrada.posiciones.get(objetivo, -1)
+            if j < i:
+                continue
+            if formato == "costo_y_camino" and entrada.acumulados is None:
+                continue
+            self._usar(clave, entrada)
+            costo = entrada.acumulados[j] - entrada.acumulados[i] if entrada.acumulados else None
+            return costo, entrada.camino[i:j + 1]
+        return None
+
+    # ============================================
+    # ALMACENAMIENTO Y EXPULSIÓN
+    # ============================================
+    def _revisar_version(self, grafo):
+        """
+        Si el grafo cambió desde que se guardaron sus entradas, las descarta todas.
+        :return: Versión actual del grafo.
+        """
+        version = getattr(grafo, "version", 0)
+        registrado = self._versiones.get(id(grafo))
+        if registrado is not None and registrado[1] != version:
+            for clave in [clave for clave in self._entradas if clave[0] == id(grafo)]:
+                self._quitar(clave)  # Al quitar la última se borra también el registro del grafo
+                self.invalidaciones += 1
+        return version
+
+    def _usar(self, clave, entrada):
+        """
+        Actualiza la posición de la entrada según la política.
+        """
+        if self.politica == "lru":
+            self._entradas.move_to_end(clave)
+            return
+        grupo = self._frecuencias[entrada.usos]
+        del grupo[clave]
+        if not grupo:
+            del self._frecuencias[entrada.usos]
+            if self._min_frecuencia == entrada.usos:
+                self._min_frecuencia += 1
+        entrada.usos += 1
+        self._frecuencias.setdefault(entrada.usos, OrderedDict())[clave] = None
+
+    def _guardar(self, clave, entrada, optimo, grafo, version):
+        if len(self._entradas) >= self.capacidad:
+            self._expulsar()
+        # El registro guarda el grafo para que su id no se reutilice mientras tenga entradas; se borra con
+        # la última, así que la caché no retiene grafos que ya no tienen nada guardado
+        registrado = self._versiones.setdefault(clave[0], [grafo, version, 0])
+        registrado[2] += 1
+        self._entradas[clave] = entrada
+        if self.politica == "lfu":
+            self._frecuencias.setdefault(1, OrderedDict())[clave] = None
+            self._min_frecuencia = 1
+        if optimo and entrada.camino:
+            for nodo in entrada.posiciones:
+                self._por_nodo.setdefault((clave[0], clave[1], nodo), set()).add(clave)
+
+    def _expulsar(self):
+        """
+        Quita la entrada menos reciente (LRU) o la menos usada, y entre ellas la más antigua (LFU).
+        """
+        if self.politica == "lru":
+            clave = next(iter(self._entradas))
+        else:
+            clave = next(iter(self._frecuencias[self._min_frecuencia]))
+        self._quitar(clave)
+        self.expulsiones += 1
+
+    def _quitar(self, clave):
+        entrada = self._entradas.pop(clave)
+        registrado = self._versiones[clave[0]]
+        registrado[2] -= 1
+        if not registrado[2]:
+            del self._versiones[clave[0]]
+        if self.politica == "lfu":
+            grupo = self._frecuencias[entrada.usos]
+            del grupo[clave]
+            if not grupo:
+                del self._frecuencias[entrada.usos]
+                if self._min_frecuencia == entrada.usos and self._frecuencias:
+                    self._min_frecuencia = min(self._frecuencias)
+        for nodo in entrada.posiciones:
+            claves = self._por_nodo.get((clave[0], clave[1], nodo))
+            if claves is not None:
+                claves.discard(clave)
+                if not claves:
+                    del self._por_nodo[(clave[0], clave[1], nodo)]
+
+
+# ============================================
+# BENCHMARK CON CONSULTAS REPETIDAS
+# ============================================
+def benchmark(lado=50, consultas=1000, distintas=100, capacidad=75, semilla=1):
+    """
+    Consultas UCS con distribución sesgada (unos pocos pares muy repetidos) con y sin caché.
+    """
+    generador = random.Random(semilla)
+    grafo = GrafoVersionado()
+    for nodo in range(lado * lado):
+        fila, columna = divmod(nodo, lado)
+        grafo[nodo] = [(vecino, generador.randint(1, 10)) for vecino in
+                       ((nodo + 1) if columna < lado - 1 else None, (nodo - 1) if columna else None,
+                        (nodo + lado) if fila < lado - 1 else None, (nodo - lado) if fila else None)
+                       if vecino is not None]
+    pares = [(generador.randrange(lado * lado), generador.randrange(lado * lado)) for _ in range(distintas)]
+    pesos = [1 / (k + 1) for k in range(distintas)]  # Ley de Zipf
+    secuencia = generador.choices(pares, pesos, k=consultas)
+    print(f"Malla {lado}x{lado}: {consultas} consultas UCS sobre {distintas} pares distintos, capacidad {capacidad}")
+
+    t0 = time.perf_counter()
+    for inicio, objetivo in secuencia:
+        ucs(grafo, inicio, objetivo)
+    print(f"  Sin caché: {time.perf_counter() - t0:.2f} s")
+
+    for politica in ("lru", "lfu"):
+        cache = CacheDeCaminos(capacidad, politica)
+        ucs_con_cache = cache.envolver(ucs, formato="costo_y_camino")
+        t0 = time.perf_counter()
+        for inicio, objetivo in secuencia:
+            ucs_con_cache(grafo, inicio, objetivo)
+        print(f"  Con caché {politica.upper()}: {time.perf_counter() - t0:.2f} s, {cache.estadisticas()}")
+
+
+if __name__ == "__main__":
+    from _001_busqueda_en_anchura import bfs
+
+    grafo_ciudades = GrafoVersionado({
+        "Ciudad de México": [("Guadalajara", 10), ("Monterrey", 15)],
+        "Guadalajara": [("Tijuana", 12), ("Cancún", 15)],
+        "Monterrey": [("Mérida", 10)],
+        "Tijuana": [("Chihuahua", 2)],
+        "Cancún": [("Chihuahua", 5)],
+        "Mérida": [("Chihuahua", 10)],
+        "Chihuahua": []
+    })
+    cache = CacheDeCaminos(capacidad=100)
+    ucs_con_cache = cache.envolver(ucs, formato="costo_y_camino")
+    print(f"UCS: {ucs_con_cache(grafo_ciudades, 'Ciudad de México', 'Chihuahua')}")
+    print(f"UCS repetida: {ucs_con_cache(grafo_ciudades, 'Ciudad de México', 'Chihuahua')}")
+    print(f"Subcamino: {ucs_con_cache(grafo_ciudades, 'Guadalajara', 'Chihuahua')}")
+    grafo_ciudades.agregar_arista("Ciudad de México", "Chihuahua", 20)  # Nueva versión del grafo
+    print(f"UCS tras agregar una arista: {ucs_con_cache(grafo_ciudades, 'Ciudad de México', 'Chihuahua')}")
+
+    grafo_simple = {"A": ["B", "C"], "B": ["D"], "C": ["E"], "D": ["F"], "E": [], "F": []}
+    bfs_con_cache = cache.envolver(bfs)
+    print(f"BFS: {bfs_con_cache(grafo_simple, 'A', 'F')}, subcamino: {bfs_con_cache(grafo_simple, 'B', 'F')}")
+    print(cache.estadisticas())
+
+    # A* con dos heurísticas: cada envoltura guarda sus propios resultados
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "_02_Busqueda_Informada"))
+    from _011_Motor_A_Estrella import buscar_camino
+
+    nula = dict.fromkeys(grafo_ciudades, 0)
+    estimada = dict(nula, **{"Ciudad de México": 20, "Guadalajara": 7, "Monterrey": 20, "Tijuana": 2,
+                             "Cancún": 5, "Mérida": 10})
+    a_estrella_nula = cache.envolver_con_heuristica(buscar_camino, nula, formato="costo_y_camino")
+    a_estrella_estimada = cache.envolver_con_heuristica(buscar_camino, estimada, formato="costo_y_camino")
+    print(f"A*: {a_estrella_estimada(grafo_ciudades, 'Ciudad de México', 'Chihuahua')}")
+    fallos = cache.fallos
+    print(f"A* repetida: {a_estrella_estimada(grafo_ciudades, 'Ciudad de México', 'Chihuahua')}")
+    assert cache.fallos == fallos
+    print(f"A* con otra heurística: {a_estrella_nula(grafo_ciudades, 'Ciudad de México', 'Chihuahua')}")
+    assert cache.fallos == fallos + 1
+
+    for capacidad in (0, -1):
+        try:
+            CacheDeCaminos(capacidad)
+            raise AssertionError("Se aceptó una capacidad menor que 1")
+        except ValueError:
+            pass
+
+    # Al expulsarse la última entrada de un grafo, la caché deja de retenerlo
+    cache = CacheDeCaminos(capacidad=1)
+    temporal = GrafoVersionado({"A": ["B"], "B": []})
+    referencia = weakref.ref(temporal)
+    cache.consultar("bfs", temporal, "A", "B", lambda: bfs(temporal, "A", "B"))
+    cache.consultar("bfs", grafo_simple, "A", "F", lambda: bfs(grafo_simple, "A", "F"))
+    del temporal
+    assert referencia() is None and len(cache._versiones) == 1
+
+    # Más consultas y una malla mayor: python _013_cache_de_caminos.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark(100, 10_000, 1000, 500)
+    else:
+        benchmark()
@@ -0,0 +1,220 @@
+# Ejecución de lotes de consultas (inicio, objetivo) en varios procesos.
+# Cada búsqueda del repositorio resuelve una consulta en un núcleo. Para lotes grandes:
+# - El grafo se compila a GrafoCSR y sus arreglos se copian una sola vez a memoria compartida
+#   (GrafoCompartido); cada proceso los abre al iniciar, sin recibir el grafo con cada tarea.
+# - Las consultas se agrupan en bloques para que la comunicación entre procesos no domine.
+# - Los resultados se devuelven en el orden de entrada o según terminan, y cada proceso informa
+#   cuántas consultas resolvió y en cuánto tiempo.
+
+from itertools import islice
+from multiprocessing import Pool
+import os
+import random
+import sys
+import time
+
+from _008_grafo_csr import GrafoCSR, GrafoCompartido, abrir_grafo_compartido, grafo_malla
+from _009_nucleo_de_busqueda import busqueda_con_predecesores
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "_02_Busqueda_Informada"))
+
+_trabajador = {}  # Estado de cada proceso: grafo abierto y su bloque de memoria compartida
+
+
+def _iniciar_trabajador(descriptor, nombres):
+    """
+    Abre el grafo compartido una sola vez por proceso.
+    """
+    grafo, bloque = abrir_grafo_compartido(descriptor, nombres)
+    _trabajador.update(grafo=grafo, bloque=bloque)
+
+
+def _resolver(grafo, algoritmo, inicio, objetivo, heuristica):
+    """
+    Resuelve una consulta con el algoritmo indicado.
+    :return: bfs -> camino; ucs y a_estrella -> (costo, camino); None si no hay camino.
+    """
+    if algoritmo == "bfs":
+        resultado = busqueda_con_predecesores(grafo, inicio, objetivo, "anchura")
+        return resultado[1] if resultado else None
+    if algoritmo == "ucs":
+        return busqueda_con_predecesores(grafo, inicio, objetivo, "costo_uniforme")
+    if algoritmo == "a_estrella":
+        from _011_Motor_A_Estrella import a_estrella
+
+        inicio_id, objetivo_id = grafo.id_de(inicio), grafo.id_de(objetivo)
+        if inicio_id is None or objetivo_id is None:
+            return None
+        h = heuristica(grafo, objetivo_id) if heuristica is not None else (lambda nodo: 0)
+        nodo = a_estrella(grafo.vecinos_con_costo, inicio_id, lambda estado: estado == objetivo_id, h)
+        return (nodo.g, [grafo.nombre_de(i) for i in nodo.camino()]) if nodo else None
+    raise ValueError(f"Algoritmo desconocido: {algoritmo}")
+
+
+def _resolver_bloque(tarea, grafo=None):
+    """
+    Resuelve un bloque de consultas.
+    :param grafo: Grafo del ejecutor cuando se resuelve en el propio proceso; en los procesos del grupo
+                  es None y se usa el grafo abierto por _iniciar_trabajador.
+    :return: Tupla (pid, segundos, [(índice, resultado)]).
+    """
+    algoritmo, heuristica, bloque = tarea
+    if grafo is None:
+        grafo = _trabajador["grafo"]
+    t0 = time.perf_counter()
+    resultados = [(indice, _resolver(grafo, algoritmo, inicio, objetivo, heuristica))
+                  for indice, inicio, objetivo in bloque]
+    return os.getpid(), time.perf_counter() - t0, resultados
+
+
+class EjecutorPorLotes:
+    """
+    Grupo de procesos que comparten un grafo y resuelven lotes de consultas.
+    Se usa como gestor de contexto para liberar los procesos y la memoria compartida:
+
+        with EjecutorPorLotes(grafo, procesos=4) as ejecutor:
+            for resultado in ejecutor.mapear(consultas, "ucs"):
+                ...
+    """
+    def __init__(self, grafo, procesos=None, tamano_bloque=64):
+        """
+        :param grafo: Diccionario {nodo: [(vecino, costo)]} / {nodo: [vecinos]} o GrafoCSR.
+        :param procesos: Número de procesos (None para usar todos los núcleos, 1 para no crear procesos).
+        :param tamano_bloque: Consultas que recibe cada proceso por tarea.
+        """
+        self.grafo = GrafoCSR.desde_diccionario(grafo) if isinstance(grafo, dict) else grafo
+        self.procesos = procesos or os.cpu_count() or 1
+        self.tamano_bloque = tamano_bloque
+        self._por_proceso = {}  # pid -> [consultas resueltas, segundos de búsqueda]
+        self._compartido = None
+        self._grupo = None
+        if self.procesos > 1:
+            self._compartido = GrafoCompartido(self.grafo)
+            self._grupo = Pool(self.procesos, _iniciar_trabajador,
+                               (self._compartido.descriptor, self.grafo.nombres))
+
+    def mapear(self, consultas, algoritmo="ucs", ordenado=True, heuristica=None):
+        """
+        Resuelve un flujo de consultas.
+        :param consultas: Iterable de pares (inicio, objetivo) con nombres de nodos.
+        :param algoritmo: "bfs", "ucs" o "a_estrella".
+        :param ordenado: Si es True, produce los resultados en el orden de las consultas; si es False,
+                         produce pares (índice, resultado) según van terminando.
+        :param heuristica: Solo para "a_estrella": función de nivel de módulo (para poder enviarla a los
+                           procesos) que recibe (grafo, objetivo_id) y devuelve h(nodo_id).
+        """
+        tareas = ((algoritmo, heuristica, bloque) for bloque in self._bloques(consultas))
+        if self._grupo is None:
+            respuestas = (_resolver_bloque(tarea, self.grafo) for tarea in tareas)
+        elif ordenado:
+            respuestas = self._grupo.imap(_resolver_bloque, tareas)
+        else:
+            respuestas = self._grupo.imap_unordered(_resolver_bloque, tareas)
+
+        for pid, segundos, resultados in respuestas:
+            registro = self._por_proceso.setdefault(pid, [0, 0.0])
+            registro[0] += len(resultados)
+            registro[1] += segundos
+            for indice, resultado in resultados:
+                yield resultado if ordenado else (indice, resultado)
+
+    def _bloques(self, consultas):
+        iterador = enumerate(consultas)
+        while True:
+            bloque = [(indice, inicio, objetivo) for indice, (inicio, objetivo) in islice(iterador, self.tamano_bloque)]
+            if not bloque:
+                return
+            yield bloque
+
+    def estadisticas(self):
+        """
+        Rendimiento de cada proceso: {pid: {"consultas", "segundos", "consultas_por_segundo"}}.
+        """
+        return {pid: {"consultas": consultas, "segundos": segundos,
+                      "consultas_por_segundo": consultas / segundos if segundos else 0.0}
+                for pid, (consultas, segundos) in self._por_proceso.items()}
+
+    def cerrar(self):
+        """
+        Termina los procesos y libera la memoria compartida.
+        """
+        if self._grupo is not None:
+            self._grupo.close()
+            self._grupo.join()
+            self._grupo = None
+        if self._compartido is not None:
+            self._compartido.liberar()
+            self._compartido = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def heuristica_cero(grafo, objetivo):
+    """
+    Heurística nula para "a_estrella" (equivale a costo uniforme).
+    """
+    return lambda nodo: 0
+
+
+# ============================================
+# BENCHMARK
+# ============================================
+def benchmark(ancho=60, alto=60, consultas=200, procesos=None, semilla=1):
+    """
+    Compara la ejecución en un proceso con la de un grupo de procesos sobre el mismo lote de consultas.
+    """
+    grafo = GrafoCSR.desde_aristas(ancho * alto, *grafo_malla(ancho, alto))
+    generador = random.Random(semilla)
+    lote = [(generador.randrange(len(grafo)), generador.randrange(len(grafo))) for _ in range(consultas)]
+    print(f"Malla {ancho}x{alto}: {consultas} consultas UCS")
+
+    referencia = None
+    for numero in sorted({1, procesos or os.cpu_count() or 1}):
+        with EjecutorPorLotes(grafo, procesos=numero) as ejecutor:
+            t0 = time.perf_counter()
+            resultados = list(ejecutor.mapear(lote, "ucs"))
+            transcurrido = time.perf_counter() - t0
+            print(f"  {numero} proceso(s): {transcurrido:.2f} s, {consultas / transcurrido:.0f} consultas/s")
+            for pid, datos in ejecutor.estadisticas().items():
+                print(f"    pid {pid}: {datos['consultas']} consultas, {datos['consultas_por_segundo']:.0f} consultas/s")
+        if referencia is None:
+            referencia = [costo for costo, _ in resultados]
+        else:
+            assert [costo for costo, _ in resultados] == referencia
+
+
+if __name__ == "__main__":
+    grafo_ciudades = {
+        "Ciudad de México": [("Guadalajara", 10), ("Monterrey", 15)],
+        "Guadalajara": [("Tijuana", 12), ("Cancún", 15)],
+        "Monterrey": [("Mérida", 10)],
+        "Tijuana": [("Chihuahua", 2)],
+        "Cancún": [("Chihuahua", 5)],
+        "Mérida": [("Chihuahua", 10)],
+        "Chihuahua": []
+    }
+    consultas = [("Ciudad de México", "Chihuahua"), ("Monterrey", "Chihuahua"), ("Guadalajara", "Mérida"),
+                 ("Ciudad de México", "Cancún")]
+    with EjecutorPorLotes(grafo_ciudades, procesos=2, tamano_bloque=1) as ejecutor:
+        for (inicio, objetivo), resultado in zip(consultas, ejecutor.mapear(consultas, "ucs")):
+            print(f"UCS {inicio} -> {objetivo}: {resultado}")
+        for indice, resultado in ejecutor.mapear(consultas, "bfs", ordenado=False):
+            print(f"BFS consulta {indice}: {resultado}")
+        print(f"A*: {list(ejecutor.mapear(consultas[:1], 'a_estrella', heuristica=heuristica_cero))}")
+        print(ejecutor.estadisticas())
+
+    # Dos ejecutores en el propio proceso no comparten estado: cada uno responde sobre su grafo
+    with EjecutorPorLotes({"A": [("B", 1)]}, procesos=1) as primero, \
+            EjecutorPorLotes({"A": [("B", 100)]}, procesos=1) as segundo:
+        assert list(primero.mapear([("A", "B")])) == [(1.0, ["A", "B"])]
+        assert list(segundo.mapear([("A", "B")])) == [(100.0, ["A", "B"])]
+
+    # Lote mayor: python _014_ejecutor_por_lotes.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark(300, 300, consultas=2000)
+    else:
+        benchmark()
@@ -0,0 +1,375 @@
+# Problemas con espacio de estados implícito.
+# Las búsquedas de los ejemplos reciben un diccionario con todo el grafo o nodos enlazados (NodoColina,
+# NodoTabu, NodoTemple, ...). Eso descarta los rompecabezas y problemas de planificación cuyo espacio
+# tiene miles de millones de estados. Aquí los estados se generan bajo demanda:
+# - Problema define el estado inicial, los sucesores con su costo, la prueba de objetivo, la clave con
+#   la que se detectan duplicados y, opcionalmente, una heurística.
+# - AlmacenDuplicados guarda solo el hash de la clave de cada estado visto y su mejor costo, con un
+#   límite de entradas: al llenarse, se descarta la generación más antigua. Un estado olvidado puede
+#   volver a expandirse (más trabajo); si hay solución se sigue encontrando (salvo colisiones de hash),
+#   pero sin solución la búsqueda puede dar vueltas para siempre, porque cada estado olvidado vuelve a
+#   parecer nuevo. El límite cubre solo el almacén: la frontera crece con cada estado que se reinserta.
+#   Con un almacén acotado conviene pasar max_expansiones, que devuelve None al agotarse.
+# - bfs y ucs (y la búsqueda en grafos) aceptan un Problema en lugar del grafo; busqueda_mejor_primero
+#   cubre también A*, y NodoProblema presenta los estados como nodos para las búsquedas locales.
+
+from collections import deque
+import heapq
+from itertools import count
+import math
+import os
+import sys
+
+from _009_nucleo_de_busqueda import EstadisticasBusqueda
+
+
+class Problema:
+    """
+    Interfaz de un problema de búsqueda con estados generados bajo demanda.
+    Las subclases implementan estado_inicial, sucesores y es_objetivo; clave y heuristica son opcionales.
+    """
+    def estado_inicial(self):
+        raise NotImplementedError
+
+    def sucesores(self, estado):
+        """
+        Pares (estado_sucesor, costo) alcanzables desde estado.
+        """
+        raise NotImplementedError
+
+    def es_objetivo(self, estado):
+        raise NotImplementedError
+
+    def clave(self, estado):
+        """
+        Valor hashable que identifica al estado para detectar duplicados (por defecto, el propio estado).
+        """
+        return estado
+
+    def heuristica(self, estado):
+        """
+        Estimación del costo restante hasta un objetivo (0 si no se conoce).
+        """
+        return 0
+
+
+class ProblemaDesdeGrafo(Problema):
+    """
+    Adapta un grafo en diccionario ({nodo: [vecinos]}, {nodo: [(vecino, costo)]} o {nodo: {vecino: costo}}).
+    """
+    def __init__(self, grafo, inicio, objetivo, heuristica=None):
+        self.grafo = grafo
+        self.inicio = inicio
+        self.objetivo = objetivo
+        self.tabla_heuristica = heuristica or {}
+
+    def estado_inicial(self):
+        return self.inicio
+
+    def sucesores(self, estado):
+        vecinos = self.grafo.get(estado, ())
+        if isinstance(vecinos, dict):
+            return vecinos.items()
+        return (vecino if isinstance(vecino, tuple) else (vecino, 1) for vecino in vecinos)
+
+    def es_objetivo(self, estado):
+        return estado == self.objetivo
+
+    def heuristica(self, estado):
+        return self.tabla_heuristica.get(estado, 0)
+
+
+# ============================================
+# ALMACÉN DE DUPLICADOS CON MEMORIA ACOTADA
+# ============================================
+class AlmacenDuplicados:
+    """
+    Mejor costo conocido de cada estado, indexado por el hash de su clave y con un número máximo de entradas.
+    Se guardan dos generaciones: cuando la actual llega a la mitad del límite pasa a ser la anterior y la
+    anterior se descarta, de modo que se olvidan primero los estados vistos hace más tiempo.
+    """
+    BYTES_POR_ENTRADA = 100  # Memoria aproximada de una entrada (hash entero, costo y hueco del diccionario)
+
+    def __init__(self, max_entradas=None, presupuesto_mb=None):
+        """
+        :param max_entradas: Número máximo de estados recordados (None para no limitar).
+        :param presupuesto_mb: Alternativa a max_entradas: memoria aproximada en MiB.
+        """
+        if presupuesto_mb is not None:
+            max_entradas = int(presupuesto_mb * 2**20 / self.BYTES_POR_ENTRADA)
+        self.max_entradas = max_entradas
+        self._actual = {}  # hash de la clave -> mejor costo
+        self._anterior = {}
+        self.olvidados = 0  # Entradas descartadas por el límite de memoria
+        self.duplicados = 0  # Estados generados que no mejoraban un costo conocido
+
+    def __len__(self):
+        return len(self._actual) + len(self._anterior)
+
+    def mejor_costo(self, clave):
+        """
+        Mejor costo registrado para la clave, o math.inf si no se conoce (o se olvidó).
+        """
+        codigo = hash(clave)
+        costo = self._actual.get(codigo)
+        if costo is None:
+            costo = self._anterior.get(codigo, math.inf)
+        return costo
+
+    def registrar(self, clave, costo):
+        """
+        Registra un costo para la clave si mejora el conocido.
+        :return: True si el estado es nuevo o su costo mejoró; False si es un duplicado.
+        """
+        if costo >= self.mejor_costo(clave):
+            self.duplicados += 1
+            return False
+        self._actual[hash(clave)] = costo
+        if self.max_entradas is not None and len(self._actual) >= max(1, self.max_entradas // 2):
+            self.olvidados += len(self._anterior)
+            self._anterior, self._actual = self._actual, {}
+        return True
+
+
+def _camino(nodo):
+    """
+    Reconstruye el camino de una cadena de nodos (estado, padre).
+    """
+    camino = []
+    while nodo is not None:
+        camino.append(nodo[0])
+        nodo = nodo[1]
+    return camino[::-1]
+
+
+# ============================================
+# BÚSQUEDAS SOBRE UN PROBLEMA
+# ============================================
+def busqueda_en_anchura_problema(problema, inicio=None, almacen=None, estadisticas=None, max_expansiones=None):
+    """
+    BFS sobre un Problema: la prueba de objetivo se hace al generar cada estado.
+    :param problema: Problema a resolver.
+    :param inicio: Estado inicial (por defecto, problema.estado_inicial()).
+    :param almacen: AlmacenDuplicados opcional (por defecto, sin límite).
+    :param estadisticas: EstadisticasBusqueda opcional.
+    :param max_expansiones: Límite opcional de expansiones (necesario para terminar con un almacén
+                            acotado cuando no hay solución).
+    :return: Tupla (profundidad, camino) o None si no hay solución (o se agotó el límite).
+    """
+    almacen = almacen if almacen is not None else AlmacenDuplicados()
+    estadisticas = estadisticas if estadisticas is not None else EstadisticasBusqueda()
+    inicio = problema.estado_inicial() if inicio is None else inicio
+    raiz = (inicio, None)
+    if problema.es_objetivo(inicio):
+        return 0, [inicio]
+    almacen.registrar(problema.clave(inicio), 0)
+    frontera = deque([(raiz, 0)])
+
+    while frontera:
+        if max_expansiones is not None and estadisticas.nodos_expandidos >= max_expansiones:
+            return None
+        nodo, profundidad = frontera.popleft()
+        estadisticas.nodos_expandidos += 1
+        for sucesor, _ in problema.sucesores(nodo[0]):
+            if not almacen.registrar(problema.clave(sucesor), profundidad + 1):
+                continue
+            hijo = (sucesor, nodo)
+            estadisticas.nodos_generados += 1
+            if problema.es_objetivo(sucesor):
+                return profundidad + 1, _camino(hijo)
+            frontera.append((hijo, profundidad + 1))
+        if len(frontera) > estadisticas.max_frontera:
+            estadisticas.max_frontera = len(frontera)
+    return None
+
+
+def busqueda_mejor_primero(problema, inicio=None, usar_heuristica=True, almacen=None, estadisticas=None,
+                           max_expansiones=None):
+    """
+    Costo uniforme (usar_heuristica=False) o A* (usar_heuristica=True) sobre un Problema.
+    Solo se inserta un estado cuando mejora su costo en el almacén; las entradas obsoletas del
+    montículo se descartan al extraerlas.
+    :param max_expansiones: Límite opcional de expansiones (ver busqueda_en_anchura_problema).
+    :return: Tupla (costo, camino) o None si no hay solución (o se agotó el límite).
+    """
+    almacen = almacen if almacen is not None else AlmacenDuplicados()
+    estadisticas = estadisticas if estadisticas is not None else EstadisticasBusqueda()
+    inicio = problema.estado_inicial() if inicio is None else inicio
+    h = problema.heuristica if usar_heuristica else (lambda estado: 0)
+    contador = count()
+    almacen.registrar(problema.clave(inicio), 0)
+    frontera = [(h(inicio), next(contador), 0, (inicio, None))]
+
+    while frontera:
+        _, _, g, nodo = heapq.heappop(frontera)
+        estado = nodo[0]
+        if g > almacen.mejor_costo(problema.clave(estado)):  # Entrada obsoleta
+            continue
+        if problema.es_objetivo(estado):
+            return g, _camino(nodo)
+        if max_expansiones is not None and estadisticas.nodos_expandidos >= max_expansiones:
+            return None
+        estadisticas.nodos_expandidos += 1
+        for sucesor, costo in problema.sucesores(estado):
+            nuevo_g = g + costo
+            if almacen.registrar(problema.clave(sucesor), nuevo_g):
+                heapq.heappush(frontera, (nuevo_g + h(sucesor), next(contador), nuevo_g, (sucesor, nodo)))
+                estadisticas.nodos_generados += 1
+        if len(frontera) > estadisticas.max_frontera:
+            estadisticas.max_frontera = len(frontera)
+    return None
+
+
+def resolver_problema(problema, estrategia="anchura", inicio=None, almacen=None, estadisticas=None,
+                      max_expansiones=None):
+    """
+    Punto de entrada usado por busqueda_con_predecesores (y, por tanto, por bfs y ucs) cuando
+    reciben un Problema en lugar de un grafo.
+    """
+    if estrategia == "anchura":
+        return busqueda_en_anchura_problema(problema, inicio, almacen, estadisticas, max_expansiones)
+    return busqueda_mejor_primero(problema, inicio, estrategia == "a_estrella", almacen, estadisticas,
+                                  max_expansiones)
+
+
+# ============================================
+# NODOS PARA LAS BÚSQUEDAS LOCALES
+# ============================================
+class NodoProblema:
+    """
+    Presenta un estado de un Problema con la misma forma que NodoColina, NodoTabu, NodoTemple y NodoHaz
+    (estado, heuristica y vecinos), de modo que las búsquedas locales funcionan sin cambios. Los vecinos
+    se generan cada vez que se piden, en lugar de enlazarse de antemano.
+    """
+    __slots__ = ("problema", "estado", "heuristica")
+
+    def __init__(self, problema, estado=None):
+        self.problema = problema
+        self.estado = problema.estado_inicial() if estado is None else estado
+        self.heuristica = problema.heuristica(self.estado)  # Valor que las búsquedas locales minimizan
+
+    @property
+    def vecinos(self):
+        return [NodoProblema(self.problema, sucesor) for sucesor, _ in self.problema.sucesores(self.estado)]
+
+    def __eq__(self, otro):
+        return isinstance(otro, NodoProblema) and self.problema.clave(self.estado) == otro.problema.clave(otro.estado)
+
+    def __hash__(self):
+        return hash(self.problema.clave(self.estado))
+
+
+# ============================================
+# EJEMPLO: PUZZLE DESLIZANTE
+# ============================================
+class PuzzleDeslizante(Problema):
+    """
+    Puzzle de lado x lado fichas (8-puzzle con lado 3, 15-puzzle con lado 4). El estado es una tupla con
+    la ficha de cada casilla y 0 en el hueco; el objetivo es (1, 2, ..., n - 1, 0).
+    """
+    def __init__(self, inicial, lado=None):
+        self.inicial = tuple(inicial)
+        self.lado = lado or int(round(len(self.inicial) ** 0.5))
+        n = self.lado * self.lado
+        self.objetivo = tuple(range(1, n)) + (0,)
+        # Casillas a las que puede moverse el hueco desde cada posición
+        self.movimientos = []
+        for posicion in range(n):
+            fila, columna = divmod(posicion, self.lado)
+            self.movimientos.append([posicion + d for d, valido in ((-self.lado, fila > 0), (self.lado, fila < self.lado - 1),
+                                                                    (-1, columna > 0), (1, columna < self.lado - 1)) if valido])
+        # Distancia Manhattan de cada ficha desde cada casilla a la suya (el hueco no cuenta)
+        self.distancias = [[0] * n]
+        for ficha in range(1, n):
+            fila_objetivo, columna_objetivo = divmod(ficha - 1, self.lado)
+            self.distancias.append([abs(posicion // self.lado - fila_objetivo) + abs(posicion % self.lado - columna_objetivo)
+                                    for posicion in range(n)])
+
+    def estado_inicial(self):
+        return self.inicial
+
+    def sucesores(self, estado):
+        hueco = estado.index(0)
+        for destino in self.movimientos[hueco]:
+            nuevo = list(estado)
+            nuevo[hueco], nuevo[destino] = nuevo[destino], 0
+            yield tuple(nuevo), 1
+
+    def es_objetivo(self, estado):
+        return estado == self.objetivo
+
+    def heuristica(self, estado):
+        """
+        Suma de distancias Manhattan de cada ficha a su casilla objetivo.
+        """
+        distancias = self.distancias
+        return sum(distancias[ficha][posicion] for posicion, ficha in enumerate(estado))
+
+
+def puzzle_aleatorio(lado, movimientos, semilla=0):
+    """
+    Puzzle resoluble obtenido con movimientos aleatorios desde el objetivo (sin deshacer el anterior).
+    """
+    import random
+
+    generador = random.Random(semilla)
+    problema = PuzzleDeslizante(tuple(range(1, lado * lado)) + (0,), lado)
+    estado, anterior = problema.objetivo, None
+    for _ in range(movimientos):
+        opciones = [sucesor for sucesor, _ in problema.sucesores(estado) if sucesor != anterior]
+        anterior, estado = estado, generador.choice(opciones)
+    return PuzzleDeslizante(estado, lado)
+
+
+if __name__ == "__main__":
+    from _001_busqueda_en_anchura import bfs
+    from _002_busqueda_en_anchura_con_costo_uniforme import ucs
+
+    # Un grafo de diccionario también puede verse como Problema
+    grafo_ciudades = {
+        "Ciudad de México": [("Guadalajara", 10), ("Monterrey", 15)],
+        "Guadalajara": [("Tijuana", 12), ("Cancún", 15)],
+        "Monterrey": [("Mérida", 10)],
+        "Tijuana": [("Chihuahua", 2)],
+        "Cancún": [("Chihuahua", 5)],
+        "Mérida": [("Chihuahua", 10)],
+        "Chihuahua": []
+    }
+    problema = ProblemaDesdeGrafo(grafo_ciudades, "Ciudad de México", "Chihuahua")
+    print(f"UCS sobre ProblemaDesdeGrafo: {ucs(problema, None, None)}")
+
+    # 8-puzzle: los estados se generan al expandir, nunca se construye el grafo completo
+    puzzle = PuzzleDeslizante((8, 6, 7, 2, 5, 4, 3, 0, 1))
+    for nombre, buscar in (("BFS", lambda e, a: busqueda_en_anchura_problema(puzzle, almacen=a, estadisticas=e)),
+                           ("UCS", lambda e, a: busqueda_mejor_primero(puzzle, usar_heuristica=False, almacen=a, estadisticas=e)),
+                           ("A* Manhattan", lambda e, a: busqueda_mejor_primero(puzzle, almacen=a, estadisticas=e))):
+        estadisticas, almacen = EstadisticasBusqueda(), AlmacenDuplicados(presupuesto_mb=64)
+        costo, camino = buscar(estadisticas, almacen)
+        print(f"{nombre}: {costo} movimientos, {estadisticas.nodos_expandidos} expansiones, "
+              f"{len(almacen)} estados en el almacén, {almacen.olvidados} olvidados")
+    print(f"bfs(puzzle): {len(bfs(puzzle, None, None)) - 1} movimientos")
+
+    # Con un límite de memoria pequeño se olvidan estados, pero la solución sigue encontrándose
+    almacen = AlmacenDuplicados(max_entradas=20_000)
+    costo, _ = busqueda_mejor_primero(puzzle, almacen=almacen)
+    print(f"A* con 20000 entradas como máximo: {costo} movimientos, {almacen.olvidados} estados olvidados")
+
+    # Sin solución, un almacén acotado olvida estados del ciclo y los reexpande sin fin: max_expansiones corta
+    ciclo = ProblemaDesdeGrafo({"A": ["B"], "B": ["C"], "C": ["A"], "D": []}, "A", "D")
+    for buscar in (busqueda_en_anchura_problema, busqueda_mejor_primero):
+        almacen, estadisticas = AlmacenDuplicados(max_entradas=2), EstadisticasBusqueda()
+        assert buscar(ciclo, almacen=almacen, estadisticas=estadisticas, max_expansiones=1000) is None
+        assert estadisticas.nodos_expandidos == 1000 and almacen.olvidados > 0
+    assert busqueda_mejor_primero(ciclo) is None  # Con el almacén sin límite termina por sí sola
+
+    # Las búsquedas locales reciben un NodoProblema como si fuera un nodo enlazado
+    sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "_02_Busqueda_Informada"))
+    from _005_Busqueda_de_Ascension_de_colinas import busqueda_ascension_colinas
+    from _011_Motor_A_Estrella import a_estrella
+
+    # El motor A* ya recibe funciones de sucesores, objetivo y heurística: basta con pasar los métodos
+    nodo = a_estrella(puzzle.sucesores, puzzle.estado_inicial(), puzzle.es_objetivo, puzzle.heuristica)
+    print(f"a_estrella con los métodos del Problema: {nodo.g} movimientos")
+
+    nodo, recorrido = busqueda_ascension_colinas(NodoProblema(puzzle_aleatorio(3, 12, semilla=3)))
+    print(f"Ascensión de colinas en el 8-puzzle: {len(recorrido) - 1} pasos hasta heurística {nodo.heuristica}")
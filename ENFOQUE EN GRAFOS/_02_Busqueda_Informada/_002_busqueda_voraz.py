@@ -1,17 +1,5 @@
-import heapq  # Para manejar la cola de prioridad
-
-class Nodo:
-    """
-    Clase que representa un nodo en el grafo.
-    """
-    def __init__(self, estado, heuristica=0, padre=None):
-        self.estado = estado  # Estado del nodo (nombre o identificador)
-        self.heuristica = heuristica  # Valor heurístico del nodo
-        self.padre = padre  # Nodo padre (para reconstruir el camino)
-    
-    def __lt__(self, otro):
-        # Comparación basada en el valor heurístico (para la cola de prioridad)
-        return self.heuristica < otro.heuristica
+# El motor usa un mapa de mejor g con eliminación perezosa en lugar de revisar toda la frontera
+from _011_Motor_A_Estrella import a_estrella, sucesores_de
 
 
 def reconstruir_camino(nodo):
@@ -36,39 +24,14 @@ def busqueda_voraz(grafo, heuristica, inicio, objetivo):
     :param objetivo: Nodo objetivo.
     :return: Lista con el camino desde inicio hasta objetivo, o None si no se encuentra.
     """
-    # Crear el nodo raíz
-    nodo_raiz = Nodo(estado=inicio, heuristica=heuristica[inicio])
-
-    # Inicializamos la frontera como una cola de prioridad
-    frontera = []
-    heapq.heappush(frontera, nodo_raiz)
-
-    # Conjunto de nodos explorados
-    explorados = set()
-
-    while frontera:
-        # Extraemos el nodo con el menor valor heurístico
-        nodo_actual = heapq.heappop(frontera)
-
-        # Si el nodo actual es el objetivo, reconstruimos el camino
-        if nodo_actual.estado == objetivo:
-            return reconstruir_camino(nodo_actual)
-
-        # Marcamos el nodo actual como explorado
-        explorados.add(nodo_actual.estado)
-
-        # Expandimos el nodo actual generando sus hijos
-        for vecino in grafo.get(nodo_actual.estado, []):
-            if vecino not in explorados:
-                # Crear un nodo hijo
-                nodo_hijo = Nodo(estado=vecino, heuristica=heuristica[vecino], padre=nodo_actual)
-
-                # Si el vecino no está en la frontera, lo agregamos
-                if not any(nodo.estado == vecino for nodo in frontera):
-                    heapq.heappush(frontera, nodo_hijo)
+    # Con peso_g = 0 el motor ordena la frontera solo por h(n); los empates se resuelven por orden de inserción
+    nodo_objetivo = a_estrella(sucesores_de(grafo), inicio, lambda estado: estado == objetivo,
+                               heuristica.__getitem__, peso_g=0)
 
     # Si no se encuentra un camino, devolvemos None
-    return None
+    if nodo_objetivo is None:
+        return None
+    return reconstruir_camino(nodo_objetivo)
 
 
 # Definimos un grafo con pueblos mágicos de México
@@ -23,26 +23,14 @@
 # - Búsqueda de rutas en mapas.
 # - Resolución de problemas de planificación.
 # - Juegos y sistemas de inteligencia artificial.
+#
+# Esta función solo responde con el camino óptimo; _025_ARA_Estrella.py da una versión anytime (ARA*)
+# que devuelve pronto un camino con cota de subóptimo y lo mejora dentro de un presupuesto de tiempo.
+# Para cuadrículas de 8 vecinos, _026_Busqueda_Saltos.py (JPS) evita expresarlas como diccionarios y poda
+# los caminos simétricos.
 
-import heapq  # Para manejar la cola de prioridad
-
-# ============================================
-# CLASE NODO
-# ============================================
-class Nodo:
-    """
-    Clase que representa un nodo en el grafo.
-    """
-    def __init__(self, estado, g=0, h=0, padre=None):
-        self.estado = estado  # Estado del nodo (nombre o identificador)
-        self.g = g  # Costo acumulado desde el nodo inicial (g(n))
-        self.h = h  # Valor heurístico del nodo (h(n))
-        self.f = g + h  # Costo total estimado (f(n) = g(n) + h(n))
-        self.padre = padre  # Nodo padre (para reconstruir el camino)
-    
-    def __lt__(self, otro):
-        # Comparación basada en el valor total f(n) (para la cola de prioridad)
-        return self.f < otro.f
+# El motor usa un mapa de mejor g con eliminación perezosa en lugar de revisar toda la frontera
+from _011_Motor_A_Estrella import a_estrella, sucesores_de
 
 
 # ============================================
@@ -64,50 +52,25 @@ def reconstruir_camino(nodo):
 # ============================================
 # IMPLEMENTACIÓN DE LA BÚSQUEDA A*
 # ============================================
-def busqueda_a_estrella(grafo, heuristica, inicio, objetivo):
+def busqueda_a_estrella(grafo, heuristica, inicio, objetivo, reabrir=False):
     """
     Implementación de la búsqueda A*.
     :param grafo: Diccionario que representa el grafo (nodo: {vecino: costo}).
     :param heuristica: Diccionario con valores heurísticos para cada nodo.
     :param inicio: Nodo inicial.
     :param objetivo: Nodo objetivo.
+    :param reabrir: Si es True, reabre nodos cerrados cuando la heurística no es consistente.
     :return: Lista con el camino desde inicio hasta objetivo, o None si no se encuentra.
     """
-    # Crear el nodo inicial
-    nodo_inicial = Nodo(estado=inicio, g=0, h=heuristica[inicio])
-
-    # Inicializamos la frontera como una cola de prioridad
-    frontera = []
-    heapq.heappush(frontera, nodo_inicial)
-
-    # Conjunto de nodos explorados
-    explorados = set()
-
-    while frontera:
-        # Extraemos el nodo con el menor valor f(n)
-        nodo_actual = heapq.heappop(frontera)
-
-        # Si el nodo actual es el objetivo, reconstruimos el camino
-        if nodo_actual.estado == objetivo:
-            return reconstruir_camino(nodo_actual)
-
-        # Marcamos el nodo actual como explorado
-        explorados.add(nodo_actual.estado)
-
-        # Expandimos el nodo actual generando sus hijos
-        for vecino, costo in grafo.get(nodo_actual.estado, {}).items():
-            if vecino not in explorados:
-                # Calcular g(n), h(n) y f(n) para el vecino
-                g = nodo_actual.g + costo
-                h = heuristica[vecino]
-                nodo_hijo = Nodo(estado=vecino, g=g, h=h, padre=nodo_actual)
-
-                # Si el vecino no está en la frontera, lo agregamos
-                if not any(nodo.estado == vecino for nodo in frontera):
-                    heapq.heappush(frontera, nodo_hijo)
+    # El motor guarda el menor g de cada estado: un camino más barato hacia un nodo que ya está
+    # en la frontera reemplaza al anterior en lugar de descartarse
+    nodo_objetivo = a_estrella(sucesores_de(grafo), inicio, lambda estado: estado == objetivo,
+                               heuristica.__getitem__, reabrir=reabrir)
 
     # Si no se encuentra un camino, devolvemos None
-    return None
+    if nodo_objetivo is None:
+        return None
+    return reconstruir_camino(nodo_objetivo)
 
 
 # ============================================
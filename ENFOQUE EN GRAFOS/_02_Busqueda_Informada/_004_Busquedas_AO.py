@@ -47,22 +47,28 @@ class NodoAO:
 # ============================================
 # FUNCIÓN PARA PROPAGAR VALORES HACIA ATRÁS
 # ============================================
-def propagar_valores(nodo):
+def propagar_valores(nodo, memo=None):
     """
     Propaga los valores heurísticos hacia atrás desde los nodos hoja hasta el nodo raíz.
     :param nodo: Nodo actual.
+    :param memo: Diccionario opcional {id(nodo): valor}. En un grafo AND-OR con subproblemas compartidos
+                 (un DAG), cada nodo se evalúa una sola vez en lugar de una vez por cada padre.
     :return: Valor heurístico actualizado del nodo.
     """
     if not nodo.hijos:  # Si el nodo no tiene hijos, es una hoja
         return nodo.heuristica
+    if memo is not None and id(nodo) in memo:
+        return memo[id(nodo)]
 
     if nodo.tipo == "OR":
         # Para nodos OR, seleccionamos el hijo con el menor valor heurístico
-        nodo.heuristica = min(propagar_valores(hijo) for hijo in nodo.hijos)
+        nodo.heuristica = min(propagar_valores(hijo, memo) for hijo in nodo.hijos)
     elif nodo.tipo == "AND":
         # Para nodos AND, sumamos los valores heurísticos de todos los hijos
-        nodo.heuristica = sum(propagar_valores(hijo) for hijo in nodo.hijos)
+        nodo.heuristica = sum(propagar_valores(hijo, memo) for hijo in nodo.hijos)
 
+    if memo is not None:
+        memo[id(nodo)] = nodo.heuristica
     return nodo.heuristica
 
 # ============================================
@@ -74,14 +80,19 @@ def busqueda_ao(nodo):
     :param nodo: Nodo raíz del grafo AND-OR.
     :return: Lista con los nodos que forman parte de la solución.
     """
-    # Propagamos los valores heurísticos hacia atrás
-    propagar_valores(nodo)
+    # Propagamos los valores heurísticos hacia atrás (una vez por nodo, aunque tenga varios padres)
+    propagar_valores(nodo, memo={})
 
     # Lista para almacenar la solución
     solucion = []
 
+    visitados = set()  # Subproblemas compartidos que ya forman parte de la solución
+
     # Función auxiliar para recorrer el grafo y construir la solución
     def construir_solucion(nodo):
+        if id(nodo) in visitados:
+            return
+        visitados.add(id(nodo))
         if not nodo.hijos:  # Si el nodo no tiene hijos, es una hoja
             solucion.append(nodo.estado)
             nodo.solucion = True
@@ -105,24 +116,25 @@ def busqueda_ao(nodo):
 # ============================================
 # EJEMPLO DE GRAFO AND-OR CON CIUDADES EUROPEAS
 # ============================================
-# Creamos los nodos del grafo
-nodo_madrid = NodoAO("Madrid", heuristica=10)
-nodo_paris = NodoAO("París", heuristica=5)
-nodo_berlin = NodoAO("Berlín", heuristica=2)
-nodo_roma = NodoAO("Roma", heuristica=1)
-nodo_viena = NodoAO("Viena", heuristica=7)
-nodo_atenas = NodoAO("Atenas", heuristica=3)
-
-# Definimos las relaciones AND-OR entre las ciudades
-nodo_madrid.agregar_hijos([nodo_paris, nodo_berlin], tipo="OR")  # Madrid tiene hijos París y Berlín (OR)
-nodo_paris.agregar_hijos([nodo_roma, nodo_viena], tipo="AND")  # París tiene hijos Roma y Viena (AND)
-nodo_berlin.agregar_hijos([nodo_atenas], tipo="OR")  # Berlín tiene un hijo Atenas (OR)
-
-# ============================================
-# EJECUCIÓN DE LA BÚSQUEDA AO*
-# ============================================
-# Ejecutamos la búsqueda AO* a partir del nodo raíz (Madrid)
-solucion_ao = busqueda_ao(nodo_madrid)
-
-# Mostramos el resultado
-print(f"Nodos que forman parte de la solución: {solucion_ao}")
\ No newline at end of file
+if __name__ == "__main__":
+    # Creamos los nodos del grafo
+    nodo_madrid = NodoAO("Madrid", heuristica=10)
+    nodo_paris = NodoAO("París", heuristica=5)
+    nodo_berlin = NodoAO("Berlín", heuristica=2)
+    nodo_roma = NodoAO("Roma", heuristica=1)
+    nodo_viena = NodoAO("Viena", heuristica=7)
+    nodo_atenas = NodoAO("Atenas", heuristica=3)
+
+    # Definimos las relaciones AND-OR entre las ciudades
+    nodo_madrid.agregar_hijos([nodo_paris, nodo_berlin], tipo="OR")  # Madrid tiene hijos París y Berlín (OR)
+    nodo_paris.agregar_hijos([nodo_roma, nodo_viena], tipo="AND")  # París tiene hijos Roma y Viena (AND)
+    nodo_berlin.agregar_hijos([nodo_atenas], tipo="OR")  # Berlín tiene un hijo Atenas (OR)
+
+    # ============================================
+    # EJECUCIÓN DE LA BÚSQUEDA AO*
+    # ============================================
+    # Ejecutamos la búsqueda AO* a partir del nodo raíz (Madrid)
+    solucion_ao = busqueda_ao(nodo_madrid)
+
+    # Mostramos el resultado
+    print(f"Nodos que forman parte de la solución: {solucion_ao}")
\ No newline at end of file
@@ -13,6 +13,7 @@
 #   - Máximos locales: Un punto que parece ser el mejor, pero no es el óptimo global.
 #   - Mesetas: Una región donde todos los vecinos tienen el mismo valor heurístico.
 #   - Crestas: Una región donde no hay un vecino mejor, pero el óptimo está más allá.
+# - _019_Reinicios_Colinas.py repite la ascensión desde estados aleatorios en varios procesos.
 # 
 # APLICACIÓN:
 # Este algoritmo es útil en problemas donde:
@@ -70,28 +71,29 @@ def busqueda_ascension_colinas(nodo_inicial):
 # ============================================
 # EJEMPLO DE GRAFO CON CIUDADES EUROPEAS
 # ============================================
-# Creamos los nodos del grafo
-nodo_madrid = NodoColina("Madrid", heuristica=10)
-nodo_paris = NodoColina("París", heuristica=8)
-nodo_berlin = NodoColina("Berlín", heuristica=6)
-nodo_roma = NodoColina("Roma", heuristica=4)
-nodo_viena = NodoColina("Viena", heuristica=3)
-nodo_atenas = NodoColina("Atenas", heuristica=0)  # Nodo objetivo con heurística 0
+if __name__ == "__main__":
+    # Creamos los nodos del grafo
+    nodo_madrid = NodoColina("Madrid", heuristica=10)
+    nodo_paris = NodoColina("París", heuristica=8)
+    nodo_berlin = NodoColina("Berlín", heuristica=6)
+    nodo_roma = NodoColina("Roma", heuristica=4)
+    nodo_viena = NodoColina("Viena", heuristica=3)
+    nodo_atenas = NodoColina("Atenas", heuristica=0)  # Nodo objetivo con heurística 0
 
-# Definimos las conexiones entre los nodos
-nodo_madrid.agregar_vecino(nodo_paris)
-nodo_madrid.agregar_vecino(nodo_berlin)
-nodo_paris.agregar_vecino(nodo_roma)
-nodo_berlin.agregar_vecino(nodo_viena)
-nodo_roma.agregar_vecino(nodo_atenas)
-nodo_viena.agregar_vecino(nodo_atenas)
+    # Definimos las conexiones entre los nodos
+    nodo_madrid.agregar_vecino(nodo_paris)
+    nodo_madrid.agregar_vecino(nodo_berlin)
+    nodo_paris.agregar_vecino(nodo_roma)
+    nodo_berlin.agregar_vecino(nodo_viena)
+    nodo_roma.agregar_vecino(nodo_atenas)
+    nodo_viena.agregar_vecino(nodo_atenas)
 
-# ============================================
-# EJECUCIÓN DE LA BÚSQUEDA DE ASCENSIÓN DE COLINAS
-# ============================================
-# Ejecutamos la búsqueda desde el nodo inicial (Madrid)
-nodo_objetivo, camino_recorrido = busqueda_ascension_colinas(nodo_madrid)
+    # ============================================
+    # EJECUCIÓN DE LA BÚSQUEDA DE ASCENSIÓN DE COLINAS
+    # ============================================
+    # Ejecutamos la búsqueda desde el nodo inicial (Madrid)
+    nodo_objetivo, camino_recorrido = busqueda_ascension_colinas(nodo_madrid)
 
-# Mostramos el resultado
-print(f"Nodo objetivo alcanzado: {nodo_objetivo.estado} con heurística {nodo_objetivo.heuristica}")
-print(f"Camino recorrido: {camino_recorrido}")
\ No newline at end of file
+    # Mostramos el resultado
+    print(f"Nodo objetivo alcanzado: {nodo_objetivo.estado} con heurística {nodo_objetivo.heuristica}")
+    print(f"Camino recorrido: {camino_recorrido}")
\ No newline at end of file
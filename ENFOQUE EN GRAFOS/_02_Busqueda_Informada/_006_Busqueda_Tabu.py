@@ -11,6 +11,8 @@
 # - Utiliza una lista tabú para almacenar soluciones recientes y evitar revisitar estados.
 # - Permite escapar de máximos locales al aceptar soluciones peores temporalmente.
 # - Es útil en problemas de optimización combinatoria donde el espacio de búsqueda es grande.
+# - Aquí la lista tabú guarda nodos completos; _016_Motor_Tabu.py prohíbe atributos de los movimientos
+#   y evalúa los vecinos por su delta de costo, como se hace en problemas grandes.
 # 
 # APLICACIÓN:
 # Este algoritmo es útil en problemas como:
@@ -18,6 +20,8 @@
 # - Diseño de redes.
 # - Problemas de planificación y asignación.
 
+from collections import deque
+
 # ============================================
 # CLASE NODO
 # ============================================
@@ -50,19 +54,21 @@ def busqueda_tabu(nodo_inicial, iteraciones_max, tamano_tabu):
     """
     nodo_actual = nodo_inicial
     mejor_nodo = nodo_actual
-    lista_tabu = []  # Lista tabú para almacenar nodos visitados
+    lista_tabu = deque()  # Nodos tabú en orden de llegada, para retirar el más antiguo en O(1)
+    en_tabu = set()  # Los mismos nodos, para consultar en O(1)
     camino = [nodo_actual.estado]  # Lista para almacenar el camino recorrido
 
     for _ in range(iteraciones_max):
         # Agregamos el nodo actual a la lista tabú
         lista_tabu.append(nodo_actual)
+        en_tabu.add(nodo_actual)
         if len(lista_tabu) > tamano_tabu:
-            lista_tabu.pop(0)  # Eliminamos el nodo más antiguo si la lista tabú excede su tamaño
+            en_tabu.discard(lista_tabu.popleft())  # Eliminamos el nodo más antiguo si la lista tabú excede su tamaño
 
         # Seleccionamos el mejor vecino que no esté en la lista tabú
         mejor_vecino = None
         for vecino in nodo_actual.vecinos:
-            if vecino not in lista_tabu and (mejor_vecino is None or vecino.heuristica < mejor_vecino.heuristica):
+            if vecino not in en_tabu and (mejor_vecino is None or vecino.heuristica < mejor_vecino.heuristica):
                 mejor_vecino = vecino
 
         # Si no hay vecinos válidos, terminamos la búsqueda
@@ -15,6 +15,8 @@
 #   Donde:
 #   - ΔE es la diferencia entre la calidad de la solución actual y la nueva.
 #   - T es la temperatura actual.
+# - Aquí se avanza una sola cadena; _017_Temple_Paralelo.py avanza cientos de cadenas a la vez con NumPy
+#   e intercambia temperaturas entre ellas (temple paralelo).
 # 
 # APLICACIÓN:
 # Este algoritmo es útil en problemas como:
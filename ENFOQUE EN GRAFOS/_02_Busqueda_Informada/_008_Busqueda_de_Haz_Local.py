@@ -11,6 +11,8 @@
 # - Explora múltiples estados simultáneamente, lo que reduce la probabilidad de quedar atrapado en un máximo local.
 # - Utiliza una heurística para evaluar los estados y seleccionar los mejores.
 # - No garantiza encontrar la solución óptima, pero puede ser más eficiente que otros métodos.
+# - _018_Motor_Haz.py aplica la misma idea a haces grandes: selección con heapq, estados duplicados
+#   descartados por hash, caminos con punteros al padre y un modo estocástico.
 # 
 # APLICACIÓN:
 # Este algoritmo es útil en problemas como:
@@ -71,13 +73,13 @@ def busqueda_haz_local(nodos_iniciales, k):
         caminos = [nuevos_caminos[i] for i in mejores_indices]
 
         # Si encontramos un nodo con heurística 0, terminamos la búsqueda
-        for nodo in haz:
+        for i, nodo in enumerate(haz):
             if nodo.heuristica == 0:
-                return nodo, caminos[haz.index(nodo)]
+                return nodo, caminos[i]
 
     # Devolvemos el mejor nodo encontrado y su camino
-    mejor_nodo = min(haz, key=lambda nodo: nodo.heuristica)
-    return mejor_nodo, caminos[haz.index(mejor_nodo)]
+    mejor = min(range(len(haz)), key=lambda i: haz[i].heuristica)
+    return haz[mejor], caminos[mejor]
 
 # ============================================
 # EJEMPLO DE GRAFO CON CIUDADES EUROPEAS
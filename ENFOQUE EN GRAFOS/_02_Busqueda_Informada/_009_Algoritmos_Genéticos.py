@@ -18,6 +18,11 @@
 # - Diseño de redes.
 # - Problemas de planificación y asignación.
 # - Ajuste de parámetros en modelos de aprendizaje automático.
+#
+# Para poblaciones grandes (10^4 individuos, cientos de ciudades), _020_Genetico_Vectorizado.py guarda la
+# población en un arreglo de NumPy y aplica cada operador a todas las filas a la vez; _021_Genetico_Islas.py
+# reparte varias de esas poblaciones entre procesos que intercambian sus mejores individuos, y
+# _022_Mejora_Local.py lleva hijos o soluciones finales a un óptimo local 2-opt / Or-opt.
 
 import random
 
@@ -28,7 +33,8 @@ def calcular_fitness(individuo, distancias):
     """
     Calcula el fitness de un individuo basado en la distancia total de su ruta.
     :param individuo: Lista que representa una ruta (permutación de ciudades).
-    :param distancias: Diccionario con las distancias entre ciudades.
+    :param distancias: Diccionario con las distancias entre ciudades, o matriz (por ejemplo, de
+                       matriz_de_distancias) cuando las ciudades son índices 0..n-1.
     :return: Fitness del individuo (inverso de la distancia total).
     """
     distancia_total = 0
@@ -100,8 +106,8 @@ def mutacion(individuo, tasa_mutacion):
 def algoritmo_genetico(ciudades, distancias, tamano_poblacion, generaciones, tasa_mutacion):
     """
     Implementación de un algoritmo genético para resolver el problema del viajero.
-    :param ciudades: Lista de ciudades.
-    :param distancias: Diccionario con las distancias entre ciudades.
+    :param ciudades: Lista de ciudades (nombres, o índices si distancias es una matriz).
+    :param distancias: Diccionario o matriz con las distancias entre ciudades.
     :param tamano_poblacion: Tamaño de la población inicial.
     :param generaciones: Número de generaciones.
     :param tasa_mutacion: Probabilidad de mutación.
@@ -141,25 +147,26 @@ def algoritmo_genetico(ciudades, distancias, tamano_poblacion, generaciones, tas
 # ============================================
 # EJEMPLO DE PROBLEMA DEL VIAJERO
 # ============================================
-# Definimos las ciudades y las distancias entre ellas
-ciudades = ["Madrid", "París", "Berlín", "Roma", "Viena", "Atenas"]
-distancias = {
-    "Madrid": {"Madrid": 0, "París": 1275, "Berlín": 1860, "Roma": 1950, "Viena": 2315, "Atenas": 2850},
-    "París": {"Madrid": 1275, "París": 0, "Berlín": 1050, "Roma": 1420, "Viena": 1235, "Atenas": 2100},
-    "Berlín": {"Madrid": 1860, "París": 1050, "Berlín": 0, "Roma": 1180, "Viena": 680, "Atenas": 1800},
-    "Roma": {"Madrid": 1950, "París": 1420, "Berlín": 1180, "Roma": 0, "Viena": 800, "Atenas": 1050},
-    "Viena": {"Madrid": 2315, "París": 1235, "Berlín": 680, "Roma": 800, "Viena": 0, "Atenas": 1280},
-    "Atenas": {"Madrid": 2850, "París": 2100, "Berlín": 1800, "Roma": 1050, "Viena": 1280, "Atenas": 0},
-}
-
-# Parámetros del algoritmo genético
-tamano_poblacion = 10
-generaciones = 100
-tasa_mutacion = 0.1
-
-# Ejecutamos el algoritmo genético
-mejor_ruta, mejor_distancia = algoritmo_genetico(ciudades, distancias, tamano_poblacion, generaciones, tasa_mutacion)
-
-# Mostramos el resultado
-print(f"Mejor ruta encontrada: {mejor_ruta}")
-print(f"Distancia total: {mejor_distancia}")
\ No newline at end of file
+if __name__ == "__main__":
+    # Definimos las ciudades y las distancias entre ellas
+    ciudades = ["Madrid", "París", "Berlín", "Roma", "Viena", "Atenas"]
+    distancias = {
+        "Madrid": {"Madrid": 0, "París": 1275, "Berlín": 1860, "Roma": 1950, "Viena": 2315, "Atenas": 2850},
+        "París": {"Madrid": 1275, "París": 0, "Berlín": 1050, "Roma": 1420, "Viena": 1235, "Atenas": 2100},
+        "Berlín": {"Madrid": 1860, "París": 1050, "Berlín": 0, "Roma": 1180, "Viena": 680, "Atenas": 1800},
+        "Roma": {"Madrid": 1950, "París": 1420, "Berlín": 1180, "Roma": 0, "Viena": 800, "Atenas": 1050},
+        "Viena": {"Madrid": 2315, "París": 1235, "Berlín": 680, "Roma": 800, "Viena": 0, "Atenas": 1280},
+        "Atenas": {"Madrid": 2850, "París": 2100, "Berlín": 1800, "Roma": 1050, "Viena": 1280, "Atenas": 0},
+    }
+
+    # Parámetros del algoritmo genético
+    tamano_poblacion = 10
+    generaciones = 100
+    tasa_mutacion = 0.1
+
+    # Ejecutamos el algoritmo genético
+    mejor_ruta, mejor_distancia = algoritmo_genetico(ciudades, distancias, tamano_poblacion, generaciones, tasa_mutacion)
+
+    # Mostramos el resultado
+    print(f"Mejor ruta encontrada: {mejor_ruta}")
+    print(f"Distancia total: {mejor_distancia}")
\ No newline at end of file
@@ -17,6 +17,9 @@
 # - Exploración de robots en entornos desconocidos.
 # - Juegos y simulaciones en tiempo real.
 # - Navegación en mapas desconocidos.
+#
+# Esta versión elige siempre el vecino más barato y puede dar vueltas en un ciclo para siempre;
+# _023_LRTA_Estrella.py implementa un agente que aprende su heurística (LRTA* / RTAA*) y la guarda entre viajes.
 
 # ============================================
 # CLASE NODO
@@ -0,0 +1,274 @@
+# ============================================
+# MOTOR DE BÚSQUEDA A* CON MAPA DE MEJOR g
+# ============================================
+
+# DESCRIPCIÓN TEÓRICA:
+# Las versiones de A* y de búsqueda voraz de esta carpeta revisan toda la frontera
+# (any(nodo.estado == vecino for nodo in frontera)) antes de cada inserción, lo cual cuesta O(frontera)
+# por arista y además descarta caminos más baratos hacia nodos que ya estaban en la frontera.
+#
+# Este motor sigue otra estrategia:
+# - Un diccionario mejor_g guarda el menor costo conocido para cada estado.
+# - Cuando se encuentra un camino más barato, se inserta una entrada nueva en el montículo y la anterior
+#   queda obsoleta; al extraerla se reconoce porque su g es mayor que mejor_g (eliminación perezosa).
+# - Los empates en f se rompen por el menor h y después por orden de inserción, de modo que el
+#   resultado es determinista.
+# - Con heurísticas inconsistentes, un estado cerrado puede reabrirse si aparece un camino más barato.
+#
+# CARACTERÍSTICAS:
+# - Cada inserción cuesta O(log n) en lugar de O(frontera).
+# - Con pesos (peso_g, peso_h) = (1, 1) es A*; con (0, 1) es la búsqueda voraz; con (1, 0) es costo uniforme.
+
+import heapq  # Para manejar la cola de prioridad
+from itertools import count
+import math
+import random
+import sys
+import time
+
+
+# ============================================
+# NODO DE BÚSQUEDA
+# ============================================
+class NodoBusqueda:
+    """
+    Nodo de búsqueda compacto: __slots__ evita un diccionario por instancia.
+    """
+    __slots__ = ("estado", "g", "padre")
+
+    def __init__(self, estado, g=0, padre=None):
+        self.estado = estado  # Estado del nodo (nombre o identificador)
+        self.g = g  # Costo acumulado desde el nodo inicial (g(n))
+        self.padre = padre  # Nodo padre (para reconstruir el camino)
+
+    def camino(self):
+        """
+        Reconstruye el camino desde el nodo inicial hasta este nodo.
+        """
+        camino = []
+        nodo = self
+        while nodo is not None:
+            camino.append(nodo.estado)
+            nodo = nodo.padre
+        return camino[::-1]
+
+
+class EstadisticasAEstrella:
+    """
+    Contadores de una ejecución del motor.
+    """
+    def __init__(self):
+        self.nodos_expandidos = 0  # Estados extraídos y expandidos
+        self.nodos_generados = 0  # Entradas insertadas en el montículo
+        self.reaperturas = 0  # Estados cerrados que se volvieron a abrir
+        self.max_frontera = 0  # Tamaño máximo del montículo
+
+    def __repr__(self):
+        return (f"EstadisticasAEstrella(expandidos={self.nodos_expandidos}, generados={self.nodos_generados}, "
+                f"reaperturas={self.reaperturas}, max_frontera={self.max_frontera})")
+
+
+# ============================================
+# MOTOR A*
+# ============================================
+def a_estrella(sucesores, inicio, es_objetivo, heuristica, peso_g=1, peso_h=1, reabrir=False, estadisticas=None,
+               recibe_nodo=False):
+    """
+    Motor genérico de búsqueda best-first con f(n) = peso_g * g(n) + peso_h * h(n).
+    :param sucesores: Función que recibe un estado y devuelve pares (vecino, costo).
+    :param inicio: Estado inicial.
+    :param es_objetivo: Función que indica si un estado es objetivo.
+    :param heuristica: Función que estima el costo restante desde un estado (math.inf poda el estado).
+    :param peso_g: Peso del costo acumulado (0 para búsqueda voraz).
+    :param peso_h: Peso de la heurística (0 para costo uniforme).
+    :param reabrir: Si es True, un estado cerrado se reabre al encontrar un camino más barato
+                    (necesario para garantizar el óptimo con heurísticas inconsistentes).
+    :param estadisticas: EstadisticasAEstrella opcional que se rellena durante la búsqueda.
+    :param recibe_nodo: Si es True, sucesores recibe el NodoBusqueda expandido (con su g y su padre) en lugar del
+                        estado; lo usan las búsquedas que podan según la dirección de llegada (JPS).
+    :return: NodoBusqueda del objetivo alcanzado (con su g y su cadena de padres) o None.
+    """
+    if estadisticas is None:
+        estadisticas = EstadisticasAEstrella()
+    contador = count()  # Desempate final por orden de inserción
+    h = heuristica(inicio)
+    frontera = [(peso_h * h, h, next(contador), NodoBusqueda(inicio))]
+    mejor_g = {inicio: 0}
+    cerrados = set()
+
+    while frontera:
+        if len(frontera) > estadisticas.max_frontera:
+            estadisticas.max_frontera = len(frontera)
+        _, _, _, nodo = heapq.heappop(frontera)
+        estado = nodo.estado
+        if nodo.g > mejor_g[estado] or estado in cerrados:  # Entrada obsoleta
+            continue
+        if es_objetivo(estado):
+            return nodo
+        cerrados.add(estado)
+        estadisticas.nodos_expandidos += 1
+
+        for vecino, costo in sucesores(nodo if recibe_nodo else estado):
+            g = nodo.g + costo
+            if g >= mejor_g.get(vecino, math.inf):
+                continue
+            if vecino in cerrados:
+                if not reabrir:
+                    continue
+                cerrados.discard(vecino)
+                estadisticas.reaperturas += 1
+            h = heuristica(vecino)
+            if h == math.inf:  # La heurística demuestra que el objetivo es inalcanzable desde aquí
+                continue
+            mejor_g[vecino] = g
+            heapq.heappush(frontera, (peso_g * g + peso_h * h, h, next(contador), NodoBusqueda(vecino, g, nodo)))
+            estadisticas.nodos_generados += 1
+
+    return None
+
+
+def sucesores_de(grafo):
+    """
+    Convierte un grafo en una función de sucesores (vecino, costo).
+    Acepta {nodo: {vecino: costo}}, {nodo: [(vecino, costo)]}, {nodo: [vecinos]} (costo 1)
+    y objetos con el método vecinos_con_costo, como GrafoCSR.
+    """
+    if not isinstance(grafo, dict):
+        return grafo.vecinos_con_costo
+
+    def sucesores(estado):
+        vecinos = grafo.get(estado, ())
+        if isinstance(vecinos, dict):
+            return vecinos.items()
+        return (vecino if isinstance(vecino, tuple) else (vecino, 1) for vecino in vecinos)
+    return sucesores
+
+
+def buscar_camino(grafo, inicio, objetivo, heuristica=None, peso_g=1, peso_h=1, reabrir=False, estadisticas=None):
+    """
+    Atajo para buscar entre dos nodos de un grafo con el motor A*.
+    :param grafo: Grafo en cualquiera de los formatos aceptados por sucesores_de.
+    :param heuristica: Diccionario o función con la heurística (None para h = 0).
+    :return: Tupla (costo, camino) o None si no existe camino.
+    """
+    if heuristica is None:
+        funcion_h = lambda estado: 0
+    elif isinstance(heuristica, dict):
+        funcion_h = heuristica.__getitem__
+    else:
+        funcion_h = heuristica
+    nodo = a_estrella(sucesores_de(grafo), inicio, lambda estado: estado == objetivo, funcion_h,
+                      peso_g, peso_h, reabrir, estadisticas)
+    if nodo is None:
+        return None
+    return nodo.g, nodo.camino()
+
+
+# ============================================
+# BENCHMARK EN MAPAS DE CUADRÍCULA
+# ============================================
+def mapa_cuadricula(ancho, alto, densidad_obstaculos=0.25, semilla=0):
+    """
+    Genera un mapa de cuadrícula aleatorio: bytearray con 1 en las celdas bloqueadas.
+    Las esquinas superior izquierda e inferior derecha siempre quedan libres.
+    """
+    generador = random.Random(semilla)
+    mapa = bytearray(1 if generador.random() < densidad_obstaculos else 0 for _ in range(ancho * alto))
+    mapa[0] = mapa[-1] = 0
+    return mapa
+
+
+def sucesores_cuadricula(mapa, ancho, alto):
+    """
+    Sucesores con 4 vecinos y costo 1 para una cuadrícula; los estados son índices fila * ancho + columna.
+    """
+    def sucesores(celda):
+        fila, columna = divmod(celda, ancho)
+        if columna > 0 and not mapa[celda - 1]:
+            yield celda - 1, 1
+        if columna < ancho - 1 and not mapa[celda + 1]:
+            yield celda + 1, 1
+        if fila > 0 and not mapa[celda - ancho]:
+            yield celda - ancho, 1
+        if fila < alto - 1 and not mapa[celda + ancho]:
+            yield celda + ancho, 1
+    return sucesores
+
+
+def _a_estrella_con_busqueda_lineal(sucesores, inicio, objetivo, heuristica, estadisticas):
+    """
+    Versión anterior de busqueda_a_estrella (revisión lineal de la frontera), conservada solo como referencia.
+    """
+    class Nodo:
+        def __init__(self, estado, g, h, padre):
+            self.estado, self.g, self.f, self.padre = estado, g, g + h, padre
+
+        def __lt__(self, otro):
+            return self.f < otro.f
+
+    frontera = [Nodo(inicio, 0, heuristica(inicio), None)]
+    explorados = set()
+    while frontera:
+        nodo_actual = heapq.heappop(frontera)
+        if nodo_actual.estado == objetivo:
+            return nodo_actual
+        explorados.add(nodo_actual.estado)
+        estadisticas.nodos_expandidos += 1
+        for vecino, costo in sucesores(nodo_actual.estado):
+            if vecino not in explorados and not any(nodo.estado == vecino for nodo in frontera):
+                heapq.heappush(frontera, Nodo(vecino, nodo_actual.g + costo, heuristica(vecino), nodo_actual))
+    return None
+
+
+def benchmark(ancho=1000, alto=1000, lado_referencia=60):
+    """
+    Expansiones y tiempo del motor en un mapa de ancho x alto, con distancia Manhattan y con h = 0.
+    La versión con revisión lineal de la frontera se mide en un mapa pequeño de lado_referencia.
+    """
+    for lado_x, lado_y, incluir_referencia in ((lado_referencia, lado_referencia, True), (ancho, alto, False)):
+        mapa = mapa_cuadricula(lado_x, lado_y)
+        sucesores = sucesores_cuadricula(mapa, lado_x, lado_y)
+        objetivo = lado_x * lado_y - 1
+        manhattan = lambda celda: (lado_y - 1 - celda // lado_x) + (lado_x - 1 - celda % lado_x)
+        print(f"Mapa {lado_x}x{lado_y}:")
+
+        variantes = [("A* Manhattan", lambda e: a_estrella(sucesores, 0, lambda c: c == objetivo, manhattan,
+                                                           estadisticas=e)),
+                     ("Costo uniforme (h = 0)", lambda e: a_estrella(sucesores, 0, lambda c: c == objetivo,
+                                                                     lambda c: 0, estadisticas=e))]
+        if incluir_referencia:
+            variantes.append(("A* con revisión lineal", lambda e: _a_estrella_con_busqueda_lineal(
+                sucesores, 0, objetivo, manhattan, e)))
+        for nombre, busqueda in variantes:
+            estadisticas = EstadisticasAEstrella()
+            t0 = time.perf_counter()
+            nodo = busqueda(estadisticas)
+            transcurrido = time.perf_counter() - t0
+            costo = nodo.g if nodo else None
+            print(f"  {nombre}: costo {costo}, {estadisticas.nodos_expandidos} expansiones, {transcurrido:.2f} s")
+
+
+if __name__ == "__main__":
+    grafo_ciudades = {
+        "Madrid": {"París": 1275, "Lisboa": 635},
+        "París": {"Berlín": 1050, "Roma": 1420},
+        "Lisboa": {"Madrid": 635, "París": 1450},
+        "Berlín": {"Varsovia": 570, "Praga": 350},
+        "Roma": {"Atenas": 1300},
+        "Varsovia": {"Moscú": 1150},
+        "Praga": {"Viena": 330},
+        "Atenas": {},
+        "Moscú": {},
+        "Viena": {}
+    }
+    heuristica = {"Madrid": 1500, "París": 1200, "Lisboa": 1600, "Berlín": 800, "Roma": 1000,
+                  "Varsovia": 600, "Praga": 700, "Atenas": 0, "Moscú": 0, "Viena": 400}
+    estadisticas = EstadisticasAEstrella()
+    print(f"A*: {buscar_camino(grafo_ciudades, 'Madrid', 'Atenas', heuristica, estadisticas=estadisticas)}")
+    print(estadisticas)
+
+    # Mapas de 1000x1000: python _011_Motor_A_Estrella.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        benchmark(200, 200)
@@ -0,0 +1,270 @@
+# ============================================
+# HEURÍSTICA ALT (A*, LANDMARKS Y DESIGUALDAD TRIANGULAR)
+# ============================================
+
+# DESCRIPCIÓN TEÓRICA:
+# En los ejemplos de A* la heurística es un diccionario escrito a mano, algo que no existe en un grafo real.
+# ALT la obtiene de un preprocesamiento:
+# - Se eligen k nodos "landmark" (L) alejados entre sí (selección del punto más lejano).
+# - Para cada landmark se calcula d(L, v) con un barrido de costo uniforme en el grafo y d(v, L)
+#   con otro barrido en el grafo invertido.
+# - Por la desigualdad triangular, para cualquier nodo v y objetivo t:
+#       d(v, t) >= d(L, t) - d(L, v)     y     d(v, t) >= d(v, L) - d(t, L)
+#   El máximo de estas cotas sobre todos los landmarks es una heurística admisible y consistente.
+#
+# ALMACENAMIENTO:
+# Las tablas se guardan como float32 en un archivo que se abre con mmap, de modo que varias consultas
+# (o varios procesos) comparten las mismas páginas sin cargarlas completas en memoria.
+# Formato: cabecera "<4sII" (b"ALT1", n, k), k ids de landmark en int32 y, por cada landmark,
+# los bloques desde[n] y hacia[n] en float32.
+#
+# CARACTERÍSTICAS:
+# - Con costos enteros menores que 2**24 las distancias caben sin redondeo en float32; con costos
+#   reales la cota puede exceder al costo real en el orden del redondeo de float32.
+# - Si una tabla demuestra que el objetivo es inalcanzable desde v, la heurística devuelve math.inf
+#   y el motor A* descarta el estado.
+
+from array import array
+import math
+import mmap
+import os
+import random
+import struct
+import sys
+import tempfile
+import time
+
+# Los módulos de búsqueda no informada (GrafoCSR, barrido de costo uniforme) viven en la carpeta hermana
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "_01_Busqueda_no_informada"))
+
+from _008_grafo_csr import GrafoCSR, grafo_malla
+from _009_nucleo_de_busqueda import barrido_desde_id
+from _011_Motor_A_Estrella import EstadisticasAEstrella, a_estrella
+
+_CABECERA = struct.Struct("<4sII")
+_FIRMA = b"ALT1"
+
+
+# ============================================
+# PREPROCESAMIENTO
+# ============================================
+def construir_landmarks(grafo, k, ruta, semilla=0):
+    """
+    Elige k landmarks por selección del punto más lejano y guarda sus tablas de distancias.
+    :param grafo: GrafoCSR ponderado.
+    :param k: Número de landmarks.
+    :param ruta: Archivo donde se escriben las tablas.
+    :param semilla: Semilla para elegir el nodo desde el que arranca la selección.
+    :return: Lista con los ids de los landmarks elegidos.
+    """
+    n = len(grafo)
+    inverso = grafo.invertido()
+    k = min(k, n)
+
+    # El primer landmark es el nodo más lejano a un nodo al azar
+    distancia_minima = barrido_desde_id(grafo, random.Random(semilla).randrange(n))
+    landmarks = []
+    with open(ruta, "wb") as archivo:
+        archivo.write(_CABECERA.pack(_FIRMA, n, k))
+        archivo.write(bytes(4 * k))  # Hueco para los ids, se rellena al terminar
+
+        for _ in range(k):
+            # Siguiente landmark: el nodo alcanzable más lejano a todos los ya elegidos
+            landmark, mayor = 0, -1.0
+            for nodo in range(n):
+                distancia = distancia_minima[nodo]
+                if mayor < distancia < math.inf and nodo not in landmarks:
+                    landmark, mayor = nodo, distancia
+            landmarks.append(landmark)
+
+            desde = barrido_desde_id(grafo, landmark)  # d(L, v)
+            hacia = barrido_desde_id(inverso, landmark)  # d(v, L)
+            array("f", desde).tofile(archivo)
+            array("f", hacia).tofile(archivo)
+            if len(landmarks) == 1:
+                distancia_minima = desde  # A partir del primero se mide la lejanía a los landmarks
+            else:
+                for nodo in range(n):
+                    if desde[nodo] < distancia_minima[nodo]:
+                        distancia_minima[nodo] = desde[nodo]
+
+        archivo.seek(_CABECERA.size)
+        array("i", landmarks).tofile(archivo)
+    return landmarks
+
+
+# ============================================
+# TABLAS EN DISCO Y HEURÍSTICA
+# ============================================
+class TablasLandmarks:
+    """
+    Tablas de distancias de los landmarks, proyectadas en memoria desde el archivo.
+    """
+    def __init__(self, ruta):
+        self._archivo = open(ruta, "rb")
+        self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        firma, self.num_nodos, self.num_landmarks = _CABECERA.unpack_from(self._mapa)
+        if firma != _FIRMA:
+            self.cerrar()
+            raise ValueError(f"{ruta} no contiene tablas de landmarks")
+        inicio_tablas = _CABECERA.size + 4 * self.num_landmarks
+        vista = memoryview(self._mapa)
+        self.landmarks = vista[_CABECERA.size:inicio_tablas].cast("i")  # Ids de los landmarks
+        self.tablas = vista[inicio_tablas:].cast("f")  # Bloques desde/hacia de cada landmark
+        vista.release()
+
+    def desde(self, indice, nodo):
+        """
+        Distancia del landmark número indice al nodo, d(L, v).
+        """
+        return self.tablas[2 * indice * self.num_nodos + nodo]
+
+    def hacia(self, indice, nodo):
+        """
+        Distancia del nodo al landmark número indice, d(v, L).
+        """
+        return self.tablas[(2 * indice + 1) * self.num_nodos + nodo]
+
+    def heuristica(self, objetivo, inicio=None, max_activos=None):
+        """
+        Construye la heurística ALT hacia un objetivo.
+        :param objetivo: Id del nodo objetivo.
+        :param inicio: Id del nodo inicial, usado para elegir los landmarks activos.
+        :param max_activos: Si se indica junto con inicio, solo se usan los landmarks que dan la
+                            mejor cota en el inicio (consultas más baratas, cotas algo peores).
+        :return: Función h(v) con la cota inferior de d(v, objetivo).
+        """
+        n, tablas = self.num_nodos, self.tablas
+        # Por cada landmark: desplazamiento de sus bloques y las distancias fijas del objetivo
+        terminos = [(2 * i * n, (2 * i + 1) * n, self.desde(i, objetivo), self.hacia(i, objetivo))
+                    for i in range(self.num_landmarks)]
+        if inicio is not None and max_activos is not None:
+            terminos.sort(key=lambda termino: -_cota(tablas, termino, inicio))
+            del terminos[max_activos:]
+
+        def h(nodo):
+            mejor = 0.0
+            for termino in terminos:
+                cota = _cota(tablas, termino, nodo)
+                if cota > mejor:
+                    mejor = cota
+            return mejor
+        return h
+
+    def cerrar(self):
+        """
+        Libera las vistas y cierra el archivo proyectado.
+        """
+        for atributo in ("landmarks", "tablas"):
+            vista = getattr(self, atributo, None)
+            if vista is not None:
+                vista.release()
+        self._mapa.close()
+        self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+def _cota(tablas, termino, nodo):
+    """
+    Cota inferior de d(nodo, t) que da un landmark, o math.inf si demuestra que t es inalcanzable.
+    """
+    base_desde, base_hacia, desde_a_objetivo, objetivo_a_landmark = termino
+    cota = 0.0
+    desde_a_nodo = tablas[base_desde + nodo]
+    if desde_a_nodo != math.inf:  # L llega a v: si no llega a t, v tampoco
+        if desde_a_objetivo == math.inf:
+            return math.inf
+        cota = desde_a_objetivo - desde_a_nodo
+    if objetivo_a_landmark != math.inf:  # t llega a L: si v no llega a L, tampoco llega a t
+        nodo_a_landmark = tablas[base_hacia + nodo]
+        if nodo_a_landmark == math.inf:
+            return math.inf
+        if nodo_a_landmark - objetivo_a_landmark > cota:
+            cota = nodo_a_landmark - objetivo_a_landmark
+    return cota
+
+
+# ============================================
+# BENCHMARK EN UNA MALLA TIPO RED DE CARRETERAS
+# ============================================
+def malla_vial(ancho, alto, semilla=0):
+    """
+    GrafoCSR de una malla de ancho x alto con aristas en ambos sentidos y costos enteros entre 1 y 10.
+    """
+    return GrafoCSR.desde_aristas(ancho * alto, *grafo_malla(ancho, alto, semilla))
+
+
+def benchmark(ancho=300, alto=300, k=8, consultas=20, semilla=1):
+    """
+    Compara las expansiones de A* con la heurística ALT frente a h = 0 en consultas aleatorias.
+    """
+    grafo = malla_vial(ancho, alto)
+    directorio = tempfile.TemporaryDirectory()
+    ruta = os.path.join(directorio.name, "landmarks.alt")
+    t0 = time.perf_counter()
+    construir_landmarks(grafo, k, ruta)
+    print(f"Malla {ancho}x{alto}, {k} landmarks: preprocesamiento {time.perf_counter() - t0:.1f} s, "
+          f"{os.path.getsize(ruta) / 2**20:.1f} MiB en disco")
+
+    generador = random.Random(semilla)
+    totales = {"ALT": [0, 0.0], "h = 0": [0, 0.0]}
+    with TablasLandmarks(ruta) as tablas:
+        for _ in range(consultas):
+            inicio, objetivo = generador.randrange(len(grafo)), generador.randrange(len(grafo))
+            costos = set()
+            for nombre, heuristica in (("ALT", tablas.heuristica(objetivo)), ("h = 0", lambda nodo: 0)):
+                estadisticas = EstadisticasAEstrella()
+                t0 = time.perf_counter()
+                nodo = a_estrella(grafo.vecinos_con_costo, inicio, lambda estado: estado == objetivo,
+                                  heuristica, estadisticas=estadisticas)
+                totales[nombre][1] += time.perf_counter() - t0
+                totales[nombre][0] += estadisticas.nodos_expandidos
+                costos.add(nodo.g)
+            assert len(costos) == 1, "ALT debe encontrar el mismo costo óptimo"
+    directorio.cleanup()
+
+    for nombre, (expansiones, segundos) in totales.items():
+        print(f"  {nombre}: {expansiones / consultas:.0f} expansiones por consulta, {segundos:.2f} s en total")
+    print(f"  Reducción de expansiones: {totales['h = 0'][0] / totales['ALT'][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    grafo_ciudades = {
+        "Madrid": {"París": 1275, "Lisboa": 635},
+        "París": {"Berlín": 1050, "Roma": 1420, "Madrid": 1275},
+        "Lisboa": {"Madrid": 635, "París": 1450},
+        "Berlín": {"Varsovia": 570, "Praga": 350, "París": 1050},
+        "Roma": {"Atenas": 1300, "París": 1420},
+        "Varsovia": {"Moscú": 1150, "Berlín": 570},
+        "Praga": {"Viena": 330, "Berlín": 350},
+        "Atenas": {"Roma": 1300},
+        "Moscú": {"Varsovia": 1150},
+        "Viena": {"Praga": 330}
+    }
+    compilado = GrafoCSR.desde_diccionario(grafo_ciudades)
+    directorio = tempfile.TemporaryDirectory()
+    ruta = os.path.join(directorio.name, "ciudades.alt")
+    landmarks = construir_landmarks(compilado, 2, ruta)
+    print(f"Landmarks elegidos: {[compilado.nombre_de(l) for l in landmarks]}")
+
+    with TablasLandmarks(ruta) as tablas:
+        inicio, objetivo = compilado.id_de("Lisboa"), compilado.id_de("Atenas")
+        h = tablas.heuristica(objetivo)
+        print(f"Heurística ALT hacia Atenas: { {nombre: h(i) for i, nombre in enumerate(compilado.nombres)} }")
+        estadisticas = EstadisticasAEstrella()
+        nodo = a_estrella(compilado.vecinos_con_costo, inicio, lambda estado: estado == objetivo, h,
+                          estadisticas=estadisticas)
+        print(f"A* con ALT: ({nodo.g}, {[compilado.nombre_de(i) for i in nodo.camino()]})")
+        print(estadisticas)
+    directorio.cleanup()
+
+    # Malla de 1000x1000 con 16 landmarks: python _012_Heuristica_Landmarks.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark(1000, 1000, k=16)
+    else:
+        benchmark(100, 100)
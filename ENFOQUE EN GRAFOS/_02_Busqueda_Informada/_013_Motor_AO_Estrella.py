@@ -0,0 +1,289 @@
+# ============================================
+# MOTOR AO* INCREMENTAL PARA GRAFOS AND-OR
+# ============================================
+
+# DESCRIPCIÓN TEÓRICA:
+# busqueda_ao (_004_Busquedas_AO.py) necesita el grafo completo de antemano y recorre todo el árbol
+# para propagar los valores. Este motor implementa AO* propiamente dicho:
+# - El grafo se genera bajo demanda con una función de sucesores que devuelve "conectores": cada conector
+#   es una tupla (costo, [hijos]) que exige resolver todos sus hijos (AND); el nodo elige uno de sus
+#   conectores (OR). Un conector sin hijos es una hoja resuelta con ese costo; un nodo sin conectores
+#   no tiene solución.
+# - Cada estado tiene un único registro, así que los subproblemas compartidos (un DAG) se evalúan una vez.
+# - En cada iteración se expanden las hojas sin expandir del mejor grafo solución parcial (el que siguen
+#   los conectores marcados desde la raíz).
+# - Los cambios de costo se propagan con una cola de nodos "sucios", de los más profundos a los más
+#   superficiales: solo se revisan los padres que marcan a un nodo cuyo costo, conector marcado o
+#   estado resuelto cambió.
+# - Los nodos resueltos o fallidos conservan su costo entre llamadas a resolver() del mismo motor.
+#
+# CARACTERÍSTICAS:
+# - Con una heurística admisible, el grafo solución encontrado es de costo mínimo.
+# - El grafo AND-OR debe ser acíclico.
+
+import heapq
+from itertools import count
+import math
+import random
+import sys
+import time
+
+from _004_Busquedas_AO import NodoAO, busqueda_ao, propagar_valores
+
+
+class _RegistroAO:
+    """
+    Estado de un nodo del grafo AND-OR explorado.
+    """
+    __slots__ = ("costo", "conectores", "marcado", "resuelto", "padres", "nivel")
+
+    def __init__(self, costo, nivel, resuelto=False):
+        self.costo = costo  # Estimación (o costo exacto si está resuelto) del nodo
+        self.nivel = nivel  # Profundidad con la que se descubrió (ordena la propagación)
+        self.conectores = None  # Lista de (costo, hijos) o None si no se ha expandido
+        self.marcado = -1  # Índice del mejor conector
+        self.resuelto = resuelto
+        self.padres = set()  # Estados que tienen a este nodo como hijo de algún conector
+
+
+class EstadisticasAO:
+    """
+    Contadores de las ejecuciones del motor.
+    """
+    def __init__(self):
+        self.expansiones = 0  # Nodos expandidos con la función de sucesores
+        self.revisiones = 0  # Nodos cuyo costo o conector cambió al propagar
+        self.iteraciones = 0  # Veces que se recorrió el mejor grafo solución parcial
+
+    def __repr__(self):
+        return (f"EstadisticasAO(expansiones={self.expansiones}, revisiones={self.revisiones}, "
+                f"iteraciones={self.iteraciones})")
+
+
+class MotorAOEstrella:
+    """
+    AO* perezoso sobre un grafo AND-OR implícito.
+    """
+    def __init__(self, sucesores, heuristica=lambda estado: 0, es_objetivo=None):
+        """
+        :param sucesores: Función que recibe un estado y devuelve sus conectores [(costo, [hijos])].
+        :param heuristica: Estimación admisible del costo de resolver un estado.
+        :param es_objetivo: Función opcional que marca estados ya resueltos con costo 0.
+        """
+        self.sucesores = sucesores
+        self.heuristica = heuristica
+        self.es_objetivo = es_objetivo
+        self.registros = {}  # estado -> _RegistroAO (se conserva entre llamadas a resolver)
+        self.estadisticas = EstadisticasAO()
+
+    def _registro(self, estado, nivel=0):
+        registro = self.registros.get(estado)
+        if registro is None:
+            if self.es_objetivo is not None and self.es_objetivo(estado):
+                registro = _RegistroAO(0, nivel, resuelto=True)
+            else:
+                registro = _RegistroAO(self.heuristica(estado), nivel)
+            self.registros[estado] = registro
+        return registro
+
+    def resolver(self, inicio, max_expansiones=None):
+        """
+        Busca el grafo solución de costo mínimo desde inicio.
+        :param inicio: Estado raíz.
+        :param max_expansiones: Límite opcional de expansiones para esta llamada.
+        :return: Tupla (costo, plan) donde plan es {estado: hijos del conector elegido}, o None si el
+                 problema no tiene solución o se agotó el límite.
+        """
+        raiz = self._registro(inicio)
+        expansiones = 0
+        while not raiz.resuelto and raiz.costo < math.inf:
+            hojas = self._hojas_pendientes(inicio)
+            self.estadisticas.iteraciones += 1
+            if not hojas or (max_expansiones is not None and expansiones >= max_expansiones):
+                return None
+            for estado in hojas:
+                self._expandir(estado)
+            expansiones += len(hojas)
+            self._propagar(hojas)
+
+        if not raiz.resuelto:
+            return None
+        return raiz.costo, self.plan(inicio)
+
+    def _hojas_pendientes(self, inicio):
+        """
+        Hojas sin expandir (ni resueltas) del mejor grafo solución parcial.
+        """
+        hojas = []
+        pila = [inicio]
+        vistos = {inicio}
+        while pila:
+            estado = pila.pop()
+            registro = self.registros[estado]
+            if registro.resuelto:
+                continue
+            if registro.conectores is None:
+                hojas.append(estado)
+                continue
+            if registro.marcado < 0:
+                continue
+            for hijo in registro.conectores[registro.marcado][1]:
+                if hijo not in vistos:
+                    vistos.add(hijo)
+                    pila.append(hijo)
+        return hojas
+
+    def _expandir(self, estado):
+        registro = self.registros[estado]
+        registro.conectores = [(costo, tuple(hijos)) for costo, hijos in self.sucesores(estado)]
+        for _, hijos in registro.conectores:
+            for hijo in hijos:
+                self._registro(hijo, registro.nivel + 1).padres.add(estado)
+        self.estadisticas.expansiones += 1
+
+    def _propagar(self, sucios):
+        """
+        Recalcula los nodos sucios, de los más profundos a los más superficiales, y encola a un padre
+        solo si algo cambió y el nodo está en el conector marcado del padre (si el costo bajó, a todos
+        los padres, porque otro conector puede pasar a ser el mejor).
+        """
+        registros = self.registros
+        contador = count()
+        cola = [(-registros[estado].nivel, next(contador), estado) for estado in sucios]
+        heapq.heapify(cola)
+        en_cola = set(sucios)
+        while cola:
+            estado = heapq.heappop(cola)[2]
+            en_cola.discard(estado)
+            registro = registros[estado]
+            if registro.conectores is None:
+                continue
+
+            mejor_costo, marcado = math.inf, -1
+            for indice, (costo, hijos) in enumerate(registro.conectores):
+                total = costo
+                for hijo in hijos:
+                    total += registros[hijo].costo
+                if total < mejor_costo:
+                    mejor_costo, marcado = total, indice
+            resuelto = marcado >= 0 and mejor_costo < math.inf and \
+                all(registros[hijo].resuelto for hijo in registro.conectores[marcado][1])
+
+            if (mejor_costo, marcado, resuelto) == (registro.costo, registro.marcado, registro.resuelto):
+                continue
+            bajo = mejor_costo < registro.costo
+            registro.costo, registro.marcado, registro.resuelto = mejor_costo, marcado, resuelto
+            self.estadisticas.revisiones += 1
+            for padre in registro.padres:
+                if padre in en_cola:
+                    continue
+                registro_padre = registros[padre]
+                if bajo or (registro_padre.marcado >= 0 and
+                            estado in registro_padre.conectores[registro_padre.marcado][1]):
+                    en_cola.add(padre)
+                    heapq.heappush(cola, (-registro_padre.nivel, next(contador), padre))
+
+    def plan(self, inicio):
+        """
+        Grafo solución marcado desde inicio: {estado: hijos del conector elegido}.
+        """
+        plan = {}
+        pila = [inicio]
+        while pila:
+            estado = pila.pop()
+            if estado in plan:
+                continue
+            registro = self.registros[estado]
+            hijos = registro.conectores[registro.marcado][1] if registro.conectores else ()
+            plan[estado] = hijos
+            pila.extend(hijos)
+        return plan
+
+
+def sucesores_de_nodos_ao(nodo):
+    """
+    Convierte los NodoAO de _004_Busquedas_AO.py en conectores: un nodo OR tiene un conector por hijo,
+    un nodo AND un único conector con todos sus hijos y una hoja un conector sin hijos con su heurística.
+    """
+    if not nodo.hijos:
+        return [(nodo.heuristica, [])]
+    if nodo.tipo == "AND":
+        return [(0, nodo.hijos)]
+    return [(0, [hijo]) for hijo in nodo.hijos]
+
+
+# ============================================
+# BENCHMARK EN UN DAG AND-OR POR CAPAS
+# ============================================
+def dag_por_capas(ancho, profundidad, semilla=0):
+    """
+    Problema de planificación por capas: el nodo (capa, i) puede resolverse por dos conectores de un hijo
+    en la capa siguiente (OR) o por un conector AND de dos hijos; la última capa son hojas con costo
+    aleatorio. Los costos de los conectores van de 1 a 10 y los de las hojas de 1 a 20.
+    :return: Tupla (sucesores, heuristica). La heurística admisible cuenta un costo mínimo de 1 por capa
+             restante más 1 por la hoja.
+    """
+    def sucesores(estado):
+        capa, i = estado
+        local = random.Random((capa * ancho + i) * 31 + semilla)  # Mismos conectores en cada expansión
+        if capa == profundidad:
+            return [(local.randint(1, 20), [])]
+        conectores = [(local.randint(1, 10), [(capa + 1, local.randrange(ancho))]) for _ in range(2)]
+        conectores.append((local.randint(1, 10), [(capa + 1, local.randrange(ancho)),
+                                                  (capa + 1, local.randrange(ancho))]))
+        return conectores
+    return sucesores, lambda estado: profundidad - estado[0] + 1
+
+
+def benchmark(ancho=200, profundidad=30, ancho_arbol=2, profundidad_arbol=18):
+    """
+    Compara propagar_valores sin y con memoización en un DAG que se desdobla en un árbol exponencial,
+    y mide AO* sobre un DAG por capas de ancho x profundidad nodos.
+    """
+    # DAG "escalera": cada capa tiene ancho_arbol nodos AND que apuntan a todos los de la capa siguiente
+    capas = [[NodoAO(f"{capa}-{i}", heuristica=i + 1) for i in range(ancho_arbol)]
+             for capa in range(profundidad_arbol + 1)]
+    for capa in range(profundidad_arbol):
+        for nodo in capas[capa]:
+            nodo.agregar_hijos(capas[capa + 1], tipo="AND" if capa % 2 else "OR")
+    for memo in (None, {}):
+        t0 = time.perf_counter()
+        valor = propagar_valores(capas[0][0], memo)
+        print(f"propagar_valores {'con' if memo is not None else 'sin'} memoización "
+              f"({profundidad_arbol} capas de {ancho_arbol} nodos): {valor}, {time.perf_counter() - t0:.3f} s")
+
+    sucesores, heuristica = dag_por_capas(ancho, profundidad)
+    for nombre, h in (("h = 0", lambda estado: 0), ("h por capas", heuristica)):
+        motor = MotorAOEstrella(sucesores, h)
+        t0 = time.perf_counter()
+        costo, plan = motor.resolver((0, 0))
+        print(f"AO* ({nombre}) en DAG de {ancho}x{profundidad + 1} nodos: costo {costo}, {len(plan)} nodos en el plan, "
+              f"{len(motor.registros)} generados, {time.perf_counter() - t0:.2f} s")
+        print(f"  {motor.estadisticas}")
+    t0 = time.perf_counter()
+    motor.resolver((1, 0))  # Reutiliza los registros ya resueltos por la primera consulta
+    print(f"  Segunda consulta sobre el mismo motor: {time.perf_counter() - t0:.3f} s, {motor.estadisticas}")
+
+
+if __name__ == "__main__":
+    # Mismo ejemplo que _004_Busquedas_AO.py
+    nodo_madrid = NodoAO("Madrid", heuristica=10)
+    nodo_paris = NodoAO("París", heuristica=5)
+    nodo_berlin = NodoAO("Berlín", heuristica=2)
+    nodo_roma = NodoAO("Roma", heuristica=1)
+    nodo_viena = NodoAO("Viena", heuristica=7)
+    nodo_atenas = NodoAO("Atenas", heuristica=3)
+    nodo_madrid.agregar_hijos([nodo_paris, nodo_berlin], tipo="OR")
+    nodo_paris.agregar_hijos([nodo_roma, nodo_viena], tipo="AND")
+    nodo_berlin.agregar_hijos([nodo_atenas], tipo="OR")
+
+    motor = MotorAOEstrella(sucesores_de_nodos_ao)
+    costo, plan = motor.resolver(nodo_madrid)
+    print(f"AO*: costo {costo}, plan {[(nodo.estado, [hijo.estado for hijo in hijos]) for nodo, hijos in plan.items()]}")
+    print(f"busqueda_ao: {busqueda_ao(nodo_madrid)}")
+
+    # DAG de 10^5 nodos: python _013_Motor_AO_Estrella.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark(1000, 100, profundidad_arbol=22)
+    else:
+        benchmark()
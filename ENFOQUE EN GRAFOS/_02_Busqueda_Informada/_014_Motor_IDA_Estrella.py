@@ -0,0 +1,267 @@
+# ============================================
+# MOTOR IDA* CON TABLA DE TRANSPOSICIÓN
+# ============================================
+
+# DESCRIPCIÓN TEÓRICA:
+# A* (_003_Busquedas_A_Estrella.py, _011_Motor_A_Estrella.py) guarda toda la frontera y todos los
+# estados cerrados; en el 15-puzzle eso son decenas de millones de estados. IDA* aplica la idea de la
+# búsqueda en profundidad limitada (dls) con un límite de costo f = g + h en lugar de profundidad:
+# - Cada iteración es una búsqueda en profundidad que no expande nodos con f > umbral; el siguiente
+#   umbral es el menor f que superó al actual. La memoria es la de la pila, proporcional a la profundidad.
+# - La pila es explícita (como en _010_profundidad_iterativa.py): cada marco guarda el estado, su g,
+#   sus hijos ya ordenados y el menor f que superó el umbral en su subárbol.
+# - Los hijos se recorren ordenados por f (por h cuando los costos son iguales): la solución aparece
+#   antes en la última iteración y, al primer hijo que supera el umbral, se descartan los restantes.
+# - Una tabla de transposición de tamaño fijo (arreglos indexados por hash) recuerda, por estado, el
+#   menor g con que se visitó en la iteración actual y una h aprendida al terminar su subárbol
+#   (menor f encontrado - g). Un estado que reaparece con un g no menor se poda, y la h aprendida sirve
+#   en las iteraciones siguientes. Ante una colisión de casilla se conserva el estado de menor g (el
+#   más cercano a la raíz, cuyo subárbol es mayor): reemplazo por profundidad.
+#
+# CARACTERÍSTICAS:
+# - Con una heurística admisible la solución es óptima; la tabla solo guarda cotas inferiores.
+# - La memoria es la pila más la tabla, fijada de antemano con tamano_tabla.
+
+from array import array
+import math
+from operator import itemgetter
+import os
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "_01_Busqueda_no_informada"))
+
+from _015_problema_implicito import AlmacenDuplicados, PuzzleDeslizante, busqueda_mejor_primero, puzzle_aleatorio
+
+
+class EstadisticasIDA:
+    """
+    Contadores de una ejecución de IDA*.
+    """
+    def __init__(self):
+        self.nodos_expandidos = 0
+        self.nodos_generados = 0
+        self.podas_tabla = 0  # Estados descartados por la tabla de transposición
+        self.iteraciones = 0
+        self.umbrales = []  # Umbral de f de cada iteración
+        self.segundos = 0.0
+
+    @property
+    def nodos_por_segundo(self):
+        return self.nodos_expandidos / self.segundos if self.segundos else 0.0
+
+    def __repr__(self):
+        return (f"EstadisticasIDA(expandidos={self.nodos_expandidos}, generados={self.nodos_generados}, "
+                f"podas_tabla={self.podas_tabla}, iteraciones={self.iteraciones}, "
+                f"nodos_por_segundo={self.nodos_por_segundo:.0f})")
+
+
+class TablaTransposicion:
+    """
+    Tabla de tamaño fijo con el hash de la clave, el menor g de la iteración en curso y la h aprendida.
+    """
+    def __init__(self, tamano):
+        """
+        :param tamano: Número de casillas (se redondea a una potencia de 2).
+        """
+        self.tamano = 1 << max(0, (tamano - 1).bit_length())
+        self.mascara = self.tamano - 1
+        self.codigos = array("q", [0]) * self.tamano
+        self.g = array("d", [math.inf]) * self.tamano
+        self.h = array("d", [0.0]) * self.tamano
+        self.iteracion = array("i", [-1]) * self.tamano
+
+    def tamano_en_bytes(self):
+        return sum(arreglo.itemsize * len(arreglo) for arreglo in (self.codigos, self.g, self.h, self.iteracion))
+
+    def h_aprendida(self, codigo):
+        casilla = codigo & self.mascara
+        return self.h[casilla] if self.codigos[casilla] == codigo and self.iteracion[casilla] >= 0 else 0.0
+
+    def visitar(self, codigo, g, h, iteracion):
+        """
+        Registra una visita al estado.
+        :return: False si el estado ya se visitó en esta iteración con un g menor o igual (se poda).
+        """
+        casilla = codigo & self.mascara
+        if self.codigos[casilla] == codigo and self.iteracion[casilla] >= 0:
+            if self.iteracion[casilla] == iteracion and self.g[casilla] <= g:
+                return False
+            self.g[casilla], self.iteracion[casilla] = g, iteracion
+            if h > self.h[casilla]:
+                self.h[casilla] = h
+            return True
+        # Casilla ocupada por otro estado: se reemplaza si es de una iteración anterior o está más abajo
+        if self.iteracion[casilla] != iteracion or g < self.g[casilla]:
+            self.codigos[casilla], self.g[casilla], self.h[casilla], self.iteracion[casilla] = codigo, g, h, iteracion
+        return True
+
+    def aprender(self, codigo, h):
+        casilla = codigo & self.mascara
+        if self.codigos[casilla] == codigo and h > self.h[casilla]:
+            self.h[casilla] = h
+
+
+_por_f_y_h = itemgetter(0, 1)  # Orden de los hijos: f creciente y, a igual f, menor h
+
+
+def ida_estrella(problema, inicio=None, tamano_tabla=1 << 18, ordenar=True, max_expansiones=None, estadisticas=None):
+    """
+    IDA* sin recursión sobre un Problema (_015_problema_implicito.py).
+    :param problema: Problema con sucesores, es_objetivo, clave y una heurística admisible.
+    :param inicio: Estado inicial (por defecto, problema.estado_inicial()).
+    :param tamano_tabla: Casillas de la tabla de transposición (0 para no usarla).
+    :param ordenar: Si es True, los hijos se recorren por f creciente.
+    :param max_expansiones: Límite opcional de expansiones.
+    :param estadisticas: EstadisticasIDA opcional que se rellena durante la búsqueda.
+    :return: Tupla (costo, camino) o None si no hay solución (o se agotó el límite).
+    """
+    estadisticas = estadisticas if estadisticas is not None else EstadisticasIDA()
+    tabla = TablaTransposicion(tamano_tabla) if tamano_tabla else None
+    inicio = problema.estado_inicial() if inicio is None else inicio
+    sucesores, heuristica, es_objetivo, clave = problema.sucesores, problema.heuristica, problema.es_objetivo, problema.clave
+    t0 = time.perf_counter()
+
+
+    def hijos_de(estado, g, padre, padre_h):
+        """
+        Hijos (f, h, g, estado, código hash) del estado. El padre no se genera (volver a él nunca mejora un camino),
+        pero su costo sí acota lo que se aprende del estado.
+        :return: Tupla (hijos, cota del camino que vuelve al padre).
+        """
+        hijos = []
+        cota_padre = math.inf
+        for hijo, costo in sucesores(estado):
+            g_hijo = g + costo
+            if hijo == padre:
+                cota_padre = g_hijo + padre_h
+                continue
+            h = heuristica(hijo)
+            codigo = 0
+            if tabla is not None:
+                codigo = hash(clave(hijo))
+                aprendida = tabla.h_aprendida(codigo)
+                if aprendida > h:
+                    h = aprendida
+            hijos.append((g_hijo + h, h, g_hijo, hijo, codigo))
+        estadisticas.nodos_generados += len(hijos)
+        if ordenar:
+            hijos.sort(key=_por_f_y_h)
+        return hijos, cota_padre
+
+    if es_objetivo(inicio):
+        return 0, [inicio]
+    h_inicio = heuristica(inicio)
+    umbral = h_inicio
+
+    # Marco de la pila: [estado, g, h, hijos, siguiente hijo, exceso, cota]
+    # - exceso: menor f mayor que el umbral en el subárbol (candidato al siguiente umbral).
+    # - cota: menor cota inferior de cualquier camino desde el estado, incluidas las ramas podadas;
+    #   al terminar el subárbol, cota - g se guarda como h aprendida.
+    while umbral < math.inf:
+        iteracion = estadisticas.iteraciones
+        estadisticas.iteraciones += 1
+        estadisticas.umbrales.append(umbral)
+        if tabla is not None:
+            tabla.visitar(hash(clave(inicio)), 0, h_inicio, iteracion)
+        hijos, cota = hijos_de(inicio, 0, None, 0)
+        pila = [[inicio, 0, h_inicio, hijos, 0, math.inf, cota]]
+        estadisticas.nodos_expandidos += 1
+        siguiente_umbral = math.inf
+
+        while pila:
+            marco = pila[-1]
+            hijos = marco[3]
+            if marco[4] == len(hijos):  # Subárbol terminado: aprendemos su cota y retrocedemos
+                pila.pop()
+                if tabla is not None and marco[6] < math.inf:
+                    tabla.aprender(hash(clave(marco[0])), marco[6] - marco[1])
+                if not pila:
+                    siguiente_umbral = marco[5]
+                else:
+                    padre = pila[-1]
+                    if marco[5] < padre[5]:
+                        padre[5] = marco[5]
+                    if marco[6] < padre[6]:
+                        padre[6] = marco[6]
+                continue
+
+            f, h, g, hijo, codigo = hijos[marco[4]]
+            marco[4] += 1
+            if f > umbral:
+                if f < marco[5]:
+                    marco[5] = f
+                if f < marco[6]:
+                    marco[6] = f
+                if ordenar:  # Los hijos restantes tienen f mayor o igual
+                    marco[4] = len(hijos)
+                continue
+            if es_objetivo(hijo):
+                estadisticas.segundos += time.perf_counter() - t0
+                return g, [m[0] for m in pila] + [hijo]
+            if tabla is not None:
+                if not tabla.visitar(codigo, g, h, iteracion):
+                    # Ya se visitó en esta iteración con un g menor o igual: su h sigue siendo una cota
+                    estadisticas.podas_tabla += 1
+                    cota = g + max(h, tabla.h_aprendida(codigo))
+                    if cota < marco[6]:
+                        marco[6] = cota
+                    continue
+
+            if max_expansiones is not None and estadisticas.nodos_expandidos >= max_expansiones:
+                estadisticas.segundos += time.perf_counter() - t0
+                return None
+            estadisticas.nodos_expandidos += 1
+            nuevos_hijos, cota = hijos_de(hijo, g, marco[0], marco[2])
+            pila.append([hijo, g, h, nuevos_hijos, 0, math.inf, cota])
+
+        if tabla is not None:
+            h_inicio = max(h_inicio, tabla.h_aprendida(hash(clave(inicio))))
+        umbral = siguiente_umbral
+    estadisticas.segundos += time.perf_counter() - t0
+    return None
+
+
+# ============================================
+# BENCHMARK EN EL 15-PUZZLE
+# ============================================
+def benchmark(instancias=4, movimientos=60, semilla=0):
+    """
+    Resuelve 15-puzzles aleatorios con IDA* (con y sin tabla de transposición y orden de hijos) y compara
+    la memoria con A* en la primera instancia.
+    """
+    variantes = (("sin tabla ni orden", 0, False), ("orden por h", 0, True), ("orden + tabla 2^18", 1 << 18, True))
+    totales = {nombre: [0, 0.0] for nombre, _, _ in variantes}
+    for indice in range(instancias):
+        puzzle = puzzle_aleatorio(4, movimientos, semilla + indice)
+        print(f"Instancia {indice}: {puzzle.inicial}, h = {puzzle.heuristica(puzzle.inicial)}")
+        for nombre, tamano, ordenar in variantes:
+            estadisticas = EstadisticasIDA()
+            costo, _ = ida_estrella(puzzle, tamano_tabla=tamano, ordenar=ordenar, estadisticas=estadisticas)
+            totales[nombre][0] += estadisticas.nodos_expandidos
+            totales[nombre][1] += estadisticas.segundos
+            print(f"  IDA* {nombre}: {costo} movimientos, {estadisticas.segundos:.2f} s, {estadisticas}")
+        if indice == 0:
+            almacen = AlmacenDuplicados()
+            costo, _ = busqueda_mejor_primero(puzzle, almacen=almacen)
+            tabla = TablaTransposicion(1 << 18)
+            print(f"  A*: {costo} movimientos con {len(almacen)} estados guardados "
+                  f"(~{len(almacen) * AlmacenDuplicados.BYTES_POR_ENTRADA / 2**20:.0f} MiB sin contar la frontera); "
+                  f"la tabla de IDA* ocupa {tabla.tamano_en_bytes() / 2**20:.0f} MiB fijos")
+    for nombre, (expandidos, segundos) in totales.items():
+        print(f"Total IDA* {nombre}: {expandidos} expansiones, {segundos:.2f} s, {expandidos / segundos:.0f} nodos/s")
+
+
+if __name__ == "__main__":
+    # 8-puzzle del ejemplo de _015_problema_implicito.py: 31 movimientos óptimos
+    puzzle = PuzzleDeslizante((8, 6, 7, 2, 5, 4, 3, 0, 1))
+    estadisticas = EstadisticasIDA()
+    costo, camino = ida_estrella(puzzle, estadisticas=estadisticas)
+    print(f"IDA* en el 8-puzzle: {costo} movimientos, umbrales {estadisticas.umbrales}")
+    print(f"  {estadisticas}")
+
+    # Más instancias y más desordenadas: python _014_Motor_IDA_Estrella.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark(instancias=10, movimientos=100)
+    else:
+        benchmark()
@@ -0,0 +1,308 @@
+# ============================================
+# BASES DE DATOS DE PATRONES ADITIVAS (PDB)
+# ============================================
+
+# DESCRIPCIÓN TEÓRICA:
+# En _001_heuristicas.py la heurística es un diccionario escrito a mano con una estimación por nodo.
+# En el puzzle deslizante el espacio tiene 10^13 estados, así que la estimación se calcula de antemano
+# sobre abstracciones más pequeñas:
+# - Un patrón es un subconjunto de fichas. El estado abstracto son las casillas de esas fichas y la del
+#   hueco; las demás fichas son indistinguibles y moverlas no cuesta nada, así que solo cuentan los
+#   movimientos de las fichas del patrón. Con patrones disjuntos la suma de sus distancias sigue siendo
+#   admisible (PDB aditiva).
+# - La tabla de un patrón se llena con un barrido hacia atrás desde el estado abstracto objetivo (los
+#   movimientos son reversibles). El hueco se desplaza a una casilla vecina: si en ella hay una ficha del
+#   patrón el movimiento cuesta 1 y si no cuesta 0, así que el barrido es una búsqueda en anchura 0-1 que
+#   cierra primero todo lo alcanzable a coste 0 dentro de cada nivel. Sin el hueco, una ficha podría
+#   moverse a una casilla vecina sin que el hueco llegara hasta ella y la cota quedaría por debajo de
+#   Manhattan en muchos estados.
+# - Cada estado abstracto se numera con un hash perfecto: el rango lexicográfico de la permutación
+#   parcial de casillas de las fichas, entre 0 y n! / (n - k)! - 1. La tabla es un arreglo de uint8
+#   indexado por rango que guarda el mínimo sobre las posiciones del hueco (la heurística no lo necesita).
+# - Los patrones son independientes, así que cada uno se genera en un proceso distinto.
+#
+# ALMACENAMIENTO:
+# Formato: cabecera "<4sII" (b"PDB1", bytes de metadatos, número de patrones), metadatos de
+# construcción en JSON (lado, patrones, tamaños, desplazamientos, segundos por patrón, procesos, fecha)
+# y después las tablas uint8. El archivo se abre con mmap en modo lectura: varios procesos que lo abren
+# comparten las mismas páginas del sistema operativo en lugar de tener una copia cada uno.
+
+from datetime import datetime, timezone
+import json
+import mmap
+from multiprocessing import Pool
+import os
+import struct
+import sys
+import tempfile
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "_01_Busqueda_no_informada"))
+
+from _015_problema_implicito import PuzzleDeslizante, puzzle_aleatorio
+from _014_Motor_IDA_Estrella import EstadisticasIDA, ida_estrella
+
+_CABECERA = struct.Struct("<4sII")
+_FIRMA = b"PDB1"
+_DESCONOCIDO = 255  # Distancia aún no calculada durante el barrido
+
+
+# ============================================
+# HASH PERFECTO DE PERMUTACIONES PARCIALES
+# ============================================
+def multiplicadores_rango(n, k):
+    """
+    Pesos del rango de una permutación parcial de k casillas de n: el peso i es (n-1-i)! / (n-k)!.
+    """
+    pesos = []
+    for i in range(k):
+        peso = 1
+        for factor in range(n - k + 1, n - i):
+            peso *= factor
+        pesos.append(peso)
+    return pesos
+
+
+def rango(posiciones, pesos):
+    """
+    Rango lexicográfico de una tupla de casillas distintas.
+    """
+    total = 0
+    for i, posicion in enumerate(posiciones):
+        menores = posicion
+        for anterior in posiciones[:i]:
+            if anterior < posicion:
+                menores -= 1
+        total += menores * pesos[i]
+    return total
+
+
+# ============================================
+# GENERACIÓN
+# ============================================
+def _generar_patron(tarea):
+    """
+    Búsqueda en anchura 0-1 sobre los estados abstractos (casillas del patrón, hueco) de un patrón.
+    :param tarea: Tupla (lado, patrón).
+    :return: Tupla (tabla bytearray, segundos, distancia máxima).
+    """
+    lado, patron = tarea
+    t0 = time.perf_counter()
+    n, k = lado * lado, len(patron)
+    pesos = multiplicadores_rango(n, k)
+    vecinas = PuzzleDeslizante(tuple(range(1, n)) + (0,), lado).movimientos
+    tabla = bytearray([_DESCONOCIDO]) * (pesos[0] * n)
+    visitados = bytearray(len(tabla) * n)  # Índice rango * n + hueco
+
+    objetivo = tuple(ficha - 1 for ficha in patron)  # La ficha f va en la casilla f - 1
+    frontera, nivel, maximo = [(objetivo, rango(objetivo, pesos), n - 1)], 0, 0
+    while frontera:
+        valor = min(nivel, _DESCONOCIDO - 1)
+        pila, siguiente = [], []
+        for estado, indice, hueco in frontera:  # Puede traer repetidos o estados ya cerrados a coste 0
+            if not visitados[indice * n + hueco]:
+                visitados[indice * n + hueco] = 1
+                pila.append((estado, indice, hueco))
+        while pila:
+            estado, indice, hueco = pila.pop()
+            if tabla[indice] == _DESCONOCIDO:
+                tabla[indice], maximo = valor, nivel
+            for destino in vecinas[hueco]:
+                if destino in estado:
+                    # Una ficha del patrón ocupa el hueco: coste 1, pasa al nivel siguiente
+                    i = estado.index(destino)
+                    nuevo = estado[:i] + (hueco,) + estado[i + 1:]
+                    nuevo_indice = rango(nuevo, pesos)
+                    if not visitados[nuevo_indice * n + destino]:
+                        siguiente.append((nuevo, nuevo_indice, destino))
+                elif not visitados[indice * n + destino]:
+                    # Se mueve una ficha ajena al patrón: coste 0, mismo nivel
+                    visitados[indice * n + destino] = 1
+                    pila.append((estado, indice, destino))
+        frontera = siguiente
+        nivel += 1
+    return tabla, time.perf_counter() - t0, maximo
+
+
+def construir_base_patrones(lado, patrones, ruta, procesos=None):
+    """
+    Genera las tablas de los patrones (un proceso por patrón) y las guarda con sus metadatos.
+    :param lado: Lado del puzzle (3 para el 8-puzzle, 4 para el 15-puzzle).
+    :param patrones: Lista de patrones disjuntos, cada uno una lista de fichas (sin el 0).
+    :param ruta: Archivo donde se escribe la base.
+    :param procesos: Número de procesos (None para usar todos los núcleos).
+    :return: Diccionario de metadatos escrito en el archivo.
+    """
+    fichas = [ficha for patron in patrones for ficha in patron]
+    if len(set(fichas)) != len(fichas) or not set(fichas) <= set(range(1, lado * lado)):
+        raise ValueError("Los patrones deben ser disjuntos y contener fichas de 1 a lado * lado - 1")
+    procesos = min(procesos or os.cpu_count() or 1, len(patrones))
+    tareas = [(lado, list(patron)) for patron in patrones]
+    t0 = time.perf_counter()
+    if procesos > 1:
+        with Pool(procesos) as grupo:
+            resultados = grupo.map(_generar_patron, tareas)
+    else:
+        resultados = list(map(_generar_patron, tareas))
+
+    desplazamientos, desplazamiento = [], 0
+    for tabla, _, _ in resultados:
+        desplazamientos.append(desplazamiento)
+        desplazamiento += len(tabla)
+    metadatos = {
+        "lado": lado,
+        "patrones": [list(patron) for patron in patrones],
+        "tamanos": [len(tabla) for tabla, _, _ in resultados],
+        "desplazamientos": desplazamientos,
+        "distancia_maxima": [maximo for _, _, maximo in resultados],
+        "segundos_por_patron": [round(segundos, 3) for _, segundos, _ in resultados],
+        "segundos_totales": round(time.perf_counter() - t0, 3),
+        "procesos": procesos,
+        "creado": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+    texto = json.dumps(metadatos).encode("utf-8")
+    with open(ruta, "wb") as archivo:
+        archivo.write(_CABECERA.pack(_FIRMA, len(texto), len(patrones)))
+        archivo.write(texto)
+        for tabla, _, _ in resultados:
+            archivo.write(tabla)
+    return metadatos
+
+
+# ============================================
+# BASE EN DISCO Y HEURÍSTICA
+# ============================================
+class BasePatrones:
+    """
+    Tablas de una PDB aditiva, proyectadas en memoria desde el archivo.
+    """
+    def __init__(self, ruta):
+        self._archivo = open(ruta, "rb")
+        self._mapa = mmap.mmap(self._archivo.fileno(), 0, access=mmap.ACCESS_READ)
+        firma, longitud, num_patrones = _CABECERA.unpack_from(self._mapa)
+        if firma != _FIRMA:
+            self.cerrar()
+            raise ValueError(f"{ruta} no contiene una base de patrones")
+        inicio = _CABECERA.size + longitud
+        self.metadatos = json.loads(self._mapa[_CABECERA.size:inicio].decode("utf-8"))
+        self.lado = self.metadatos["lado"]
+        self.patrones = [tuple(patron) for patron in self.metadatos["patrones"]]
+        n = self.lado * self.lado
+        self._pesos = [multiplicadores_rango(n, len(patron)) for patron in self.patrones]
+        vista = memoryview(self._mapa)
+        self.tablas = [vista[inicio + desplazamiento:inicio + desplazamiento + tamano]
+                       for desplazamiento, tamano in zip(self.metadatos["desplazamientos"], self.metadatos["tamanos"])]
+        vista.release()
+
+    def heuristica(self, estado):
+        """
+        Suma de las distancias de cada patrón en el estado (tupla con la ficha de cada casilla).
+        """
+        posiciones = [0] * len(estado)
+        for casilla, ficha in enumerate(estado):
+            posiciones[ficha] = casilla
+        total = 0
+        for patron, pesos, tabla in zip(self.patrones, self._pesos, self.tablas):
+            total += tabla[rango([posiciones[ficha] for ficha in patron], pesos)]
+        return total
+
+    def cerrar(self):
+        """
+        Libera las vistas y cierra el archivo proyectado.
+        """
+        for tabla in getattr(self, "tablas", ()):
+            tabla.release()
+        self.tablas = []
+        self._mapa.close()
+        self._archivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *excepcion):
+        self.cerrar()
+
+
+class PuzzleConPatrones(PuzzleDeslizante):
+    """
+    PuzzleDeslizante cuya heurística es el máximo entre la PDB y la distancia Manhattan (ambas admisibles).
+    """
+    def __init__(self, inicial, base):
+        super().__init__(inicial, base.lado)
+        self.base = base
+
+    def heuristica(self, estado):
+        return max(self.base.heuristica(estado), super().heuristica(estado))
+
+
+# ============================================
+# RESOLUCIÓN EN VARIOS PROCESOS CON UNA SOLA COPIA DE LA BASE
+# ============================================
+_trabajador = {}  # Base abierta por cada proceso
+
+
+def _abrir_base(ruta):
+    _trabajador["base"] = BasePatrones(ruta)
+
+
+def _resolver_instancia(inicial):
+    estadisticas = EstadisticasIDA()
+    costo, _ = ida_estrella(PuzzleConPatrones(inicial, _trabajador["base"]), estadisticas=estadisticas)
+    return os.getpid(), costo, estadisticas.nodos_expandidos, estadisticas.segundos
+
+
+def resolver_instancias(ruta, instancias, procesos=None):
+    """
+    Resuelve puzzles con IDA* en varios procesos que proyectan el mismo archivo de la base.
+    :return: Lista de tuplas (pid, costo, nodos expandidos, segundos) en el orden de las instancias.
+    """
+    with Pool(procesos or os.cpu_count() or 1, _abrir_base, (ruta,)) as grupo:
+        return grupo.map(_resolver_instancia, instancias)
+
+
+# ============================================
+# BENCHMARK EN EL 15-PUZZLE
+# ============================================
+def benchmark(patrones, instancias=4, movimientos=60, semilla=0):
+    """
+    Construye una PDB del 15-puzzle y compara IDA* con distancia Manhattan y con la PDB.
+    """
+    ruta = os.path.join(tempfile.gettempdir(), "pdb_15_puzzle.bin")
+    metadatos = construir_base_patrones(4, patrones, ruta)
+    print(f"PDB {'-'.join(str(len(patron)) for patron in patrones)}: {os.path.getsize(ruta) / 2**20:.1f} MiB, "
+          f"{metadatos['segundos_totales']} s con {metadatos['procesos']} proceso(s), "
+          f"distancias máximas {metadatos['distancia_maxima']}")
+
+    puzzles = [puzzle_aleatorio(4, movimientos, semilla + indice) for indice in range(instancias)]
+    with BasePatrones(ruta) as base:
+        for indice, puzzle in enumerate(puzzles):
+            for nombre, problema in (("Manhattan", puzzle), ("PDB", PuzzleConPatrones(puzzle.inicial, base))):
+                estadisticas = EstadisticasIDA()
+                costo, _ = ida_estrella(problema, estadisticas=estadisticas)
+                print(f"  Instancia {indice} IDA* {nombre}: {costo} movimientos, h0 = "
+                      f"{problema.heuristica(problema.inicial)}, {estadisticas.nodos_expandidos} expansiones, "
+                      f"{estadisticas.segundos:.2f} s")
+
+    for pid, costo, expandidos, segundos in resolver_instancias(ruta, [puzzle.inicial for puzzle in puzzles]):
+        print(f"  pid {pid}: {costo} movimientos, {expandidos} expansiones, {segundos:.2f} s")
+    os.remove(ruta)
+
+
+if __name__ == "__main__":
+    # 8-puzzle con dos patrones de 4 fichas
+    ruta = os.path.join(tempfile.gettempdir(), "pdb_8_puzzle.bin")
+    construir_base_patrones(3, [[1, 2, 3, 4], [5, 6, 7, 8]], ruta)
+    with BasePatrones(ruta) as base:
+        print(f"Metadatos: {base.metadatos}")
+        puzzle = PuzzleConPatrones((8, 6, 7, 2, 5, 4, 3, 0, 1), base)
+        estadisticas = EstadisticasIDA()
+        costo, _ = ida_estrella(puzzle, estadisticas=estadisticas)
+        print(f"IDA* con PDB en el 8-puzzle: {costo} movimientos, h0 = {puzzle.heuristica(puzzle.inicial)} "
+              f"(Manhattan {PuzzleDeslizante.heuristica(puzzle, puzzle.inicial)}), {estadisticas}")
+    os.remove(ruta)
+
+    # PDB 5-5-5 (más lenta de construir, más informada): python _015_Bases_de_Patrones.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark([[1, 2, 3, 4, 5], [6, 7, 8, 9, 10], [11, 12, 13, 14, 15]], instancias=6, movimientos=100)
+    else:
+        benchmark([[1, 2, 3, 4], [5, 6, 7, 8], [9, 10, 11, 12], [13, 14, 15]])
@@ -0,0 +1,318 @@
+# ============================================
+# MOTOR TABÚ CON MEMORIA DE ATRIBUTOS
+# ============================================
+
+# DESCRIPCIÓN TEÓRICA:
+# _006_Busqueda_Tabu.py guarda nodos completos en la lista tabú. En problemas reales (TSP, QAP) una
+# solución tiene miles de elementos, así que se prohíben atributos de los movimientos:
+# - Un movimiento 2-opt quita las aristas (a, b) y (c, d) del recorrido y pone (a, c) y (b, d).
+#   Las aristas quitadas se vuelven tabú durante `permanencia` iteraciones: un movimiento que vuelva a
+#   ponerlas se rechaza.
+# - La memoria tabú es un diccionario atributo -> iteración en que expira (consulta O(1)) y una deque
+#   con los atributos en orden de llegada: al empezar cada iteración se sacan de la deque los que ya
+#   expiraron y se borran del diccionario.
+# - Criterio de aspiración: un movimiento tabú se acepta si lleva a un costo menor que el mejor
+#   encontrado (prohibirlo no puede evitar un ciclo, porque esa solución nunca se visitó).
+# - Cada movimiento se evalúa por su delta de costo en O(1) (d(a,c) + d(b,d) - d(a,b) - d(c,d)) en lugar
+#   de recalcular la longitud del recorrido en O(n). El vecindario se limita con listas de candidatos:
+#   para cada ciudad a solo se prueban sus k ciudades más cercanas como c, es decir n * k movimientos.
+#
+# CARACTERÍSTICAS:
+# - El motor solo conoce la interfaz del problema (costo, movimientos, aplicar, solucion); el TSP con
+#   2-opt es el caso de ejemplo.
+# - Se mueve siempre al mejor movimiento admisible aunque empeore el costo; eso permite salir de los
+#   óptimos locales de 2-opt.
+
+from collections import deque
+import heapq
+import math
+import random
+import sys
+import time
+
+
+class MemoriaTabu:
+    """
+    Atributos prohibidos con la iteración en que expiran y una deque para retirarlos en orden.
+    """
+    def __init__(self, permanencia):
+        """
+        :param permanencia: Iteraciones que un atributo permanece prohibido.
+        """
+        self.permanencia = permanencia
+        self.expira = {}  # atributo -> iteración en que deja de ser tabú
+        self._cola = deque()  # (iteración de expiración, atributo) en orden de llegada
+
+    def prohibir(self, atributo, iteracion):
+        """
+        Prohíbe el atributo en las `permanencia` iteraciones siguientes a la dada.
+        """
+        fin = iteracion + self.permanencia + 1
+        self.expira[atributo] = fin
+        self._cola.append((fin, atributo))
+
+    def avanzar(self, iteracion):
+        """
+        Retira los atributos que expiran en la iteración dada o antes.
+        """
+        cola, expira = self._cola, self.expira
+        while cola and cola[0][0] <= iteracion:
+            fin, atributo = cola.popleft()
+            if expira.get(atributo) == fin:  # Si se volvió a prohibir, la entrada más nueva sigue vigente
+                del expira[atributo]
+
+    def __contains__(self, atributo):
+        return atributo in self.expira
+
+    def __len__(self):
+        return len(self.expira)
+
+
+class EstadisticasTabu:
+    """
+    Contadores de una ejecución del motor tabú.
+    """
+    def __init__(self):
+        self.iteraciones = 0
+        self.movimientos_evaluados = 0
+        self.rechazados_tabu = 0  # Mejores que el elegido pero prohibidos
+        self.aspiraciones = 0  # Movimientos tabú aceptados por mejorar el mejor costo
+        self.mejoras = 0
+        self.costo_inicial = 0.0
+        self.segundos = 0.0
+
+    @property
+    def movimientos_por_segundo(self):
+        return self.movimientos_evaluados / self.segundos if self.segundos else 0.0
+
+    def __repr__(self):
+        return (f"EstadisticasTabu(iteraciones={self.iteraciones}, evaluados={self.movimientos_evaluados}, "
+                f"rechazados_tabu={self.rechazados_tabu}, aspiraciones={self.aspiraciones}, "
+                f"mejoras={self.mejoras}, movimientos_por_segundo={self.movimientos_por_segundo:.0f})")
+
+
+def motor_tabu(problema, iteraciones_max, permanencia, max_sin_mejora=None, estadisticas=None):
+    """
+    Búsqueda tabú sobre atributos de movimientos.
+    :param problema: Objeto con `costo`, `movimientos()` (tuplas (delta, movimiento, atributos que añade)),
+                     `aplicar(movimiento)` (devuelve los atributos que quita) y `solucion()`.
+    :param iteraciones_max: Número máximo de iteraciones.
+    :param permanencia: Iteraciones que un atributo quitado queda prohibido.
+    :param max_sin_mejora: Iteraciones seguidas sin mejorar el mejor costo antes de parar (None: sin límite).
+    :param estadisticas: EstadisticasTabu opcional que se rellena durante la búsqueda.
+    :return: Tupla (mejor costo, mejor solución).
+    """
+    estadisticas = estadisticas if estadisticas is not None else EstadisticasTabu()
+    memoria = MemoriaTabu(permanencia)
+    expira = memoria.expira
+    costo = problema.costo
+    mejor_costo, mejor_solucion = costo, problema.solucion()
+    estadisticas.costo_inicial = costo
+    sin_mejora = 0
+    t0 = time.perf_counter()
+
+    for iteracion in range(iteraciones_max):
+        memoria.avanzar(iteracion)
+        elegido, delta_elegido, aspirado = None, math.inf, False
+        evaluados = 0
+        for delta, movimiento, atributos in problema.movimientos():
+            evaluados += 1
+            if delta >= delta_elegido:
+                continue
+            tabu = False
+            for atributo in atributos:
+                if atributo in expira:
+                    tabu = True
+                    break
+            if tabu and costo + delta >= mejor_costo - 1e-9:
+                estadisticas.rechazados_tabu += 1
+                continue
+            elegido, delta_elegido, aspirado = movimiento, delta, tabu
+        estadisticas.movimientos_evaluados += evaluados
+        estadisticas.iteraciones += 1
+        if elegido is None:  # Todo el vecindario es tabú
+            break
+
+        for atributo in problema.aplicar(elegido):
+            memoria.prohibir(atributo, iteracion)
+        costo += delta_elegido
+        estadisticas.aspiraciones += aspirado
+        if costo < mejor_costo - 1e-9:
+            mejor_costo, mejor_solucion = costo, problema.solucion()
+            estadisticas.mejoras += 1
+            sin_mejora = 0
+        else:
+            sin_mejora += 1
+            if max_sin_mejora is not None and sin_mejora >= max_sin_mejora:
+                break
+
+    estadisticas.segundos += time.perf_counter() - t0
+    return mejor_costo, mejor_solucion
+
+
+# ============================================
+# TSP EUCLÍDEO CON MOVIMIENTOS 2-OPT
+# ============================================
+class RecorridoTSP:
+    """
+    Recorrido de un TSP euclídeo con vecindario 2-opt sobre listas de candidatos.
+    """
+    def __init__(self, coordenadas, k=8, recorrido=None):
+        """
+        :param coordenadas: Lista de pares (x, y), una por ciudad.
+        :param k: Ciudades candidatas (las más cercanas) por ciudad.
+        :param recorrido: Orden inicial (por defecto, el del vecino más cercano).
+        """
+        self.coordenadas = [tuple(punto) for punto in coordenadas]
+        self.n = len(self.coordenadas)
+        self.vecinos = []
+        for a, (xa, ya) in enumerate(self.coordenadas):
+            cercanas = heapq.nsmallest(k + 1, ((math.hypot(xa - x, ya - y), c) for c, (x, y) in enumerate(self.coordenadas)))
+            self.vecinos.append([(c, d) for d, c in cercanas if c != a][:k])
+        self.recorrido = list(recorrido) if recorrido is not None else self._vecino_mas_cercano()
+        self.posicion = [0] * self.n
+        for i, ciudad in enumerate(self.recorrido):
+            self.posicion[ciudad] = i
+        self.costo = self.longitud(self.recorrido)
+
+    def distancia(self, a, b):
+        xa, ya = self.coordenadas[a]
+        xb, yb = self.coordenadas[b]
+        return math.hypot(xa - xb, ya - yb)
+
+    def longitud(self, recorrido):
+        """
+        Longitud de un recorrido completo, en O(n).
+        """
+        return sum(self.distancia(recorrido[i - 1], recorrido[i]) for i in range(len(recorrido)))
+
+    def _vecino_mas_cercano(self):
+        visitada = [False] * self.n
+        actual, recorrido = 0, [0]
+        visitada[0] = True
+        for _ in range(self.n - 1):
+            siguiente = next((c for c, _ in self.vecinos[actual] if not visitada[c]), None)
+            if siguiente is None:  # Todas las candidatas usadas: se busca entre todas las ciudades
+                siguiente = min((c for c in range(self.n) if not visitada[c]), key=lambda c: self.distancia(actual, c))
+            visitada[siguiente] = True
+            recorrido.append(siguiente)
+            actual = siguiente
+        return recorrido
+
+    def _arista(self, a, b):
+        return a * self.n + b if a < b else b * self.n + a
+
+    def movimientos(self):
+        """
+        Movimientos 2-opt (a, c): quitar (a, sucesor(a)) y (c, sucesor(c)), poner (a, c) y los dos sucesores.
+        """
+        recorrido, posicion, n, distancia, arista = self.recorrido, self.posicion, self.n, self.distancia, self._arista
+        for a in range(n):
+            i = posicion[a]
+            b = recorrido[i + 1 if i + 1 < n else 0]
+            d_ab = distancia(a, b)
+            for c, d_ac in self.vecinos[a]:
+                j = posicion[c]
+                d = recorrido[j + 1 if j + 1 < n else 0]
+                if c == b or d == a:
+                    continue
+                delta = d_ac + distancia(b, d) - d_ab - distancia(c, d)
+                yield delta, (a, c), (arista(a, c), arista(b, d))
+
+    def aplicar(self, movimiento):
+        """
+        Invierte el tramo entre los sucesores de a y c.
+        :return: Aristas quitadas del recorrido.
+        """
+        a, c = movimiento
+        recorrido, posicion, n = self.recorrido, self.posicion, self.n
+        i, j = posicion[a], posicion[c]
+        b, d = recorrido[(i + 1) % n], recorrido[(j + 1) % n]
+        if i > j:
+            i, j = j, i
+        recorrido[i + 1:j + 1] = recorrido[j:i:-1]
+        for k in range(i + 1, j + 1):
+            posicion[recorrido[k]] = k
+        return self._arista(a, b), self._arista(c, d)
+
+    def solucion(self):
+        return self.recorrido[:]
+
+
+def ciudades_aleatorias(n, semilla=0):
+    generador = random.Random(semilla)
+    return [(generador.random() * 1000, generador.random() * 1000) for _ in range(n)]
+
+
+# ============================================
+# BENCHMARK
+# ============================================
+def benchmark(n=1000, iteraciones=1000, permanencia=30, semilla=0):
+    """
+    Compara el costo de evaluar un vecino y de consultar la memoria tabú con la versión de nodos completos,
+    y ejecuta el motor sobre un TSP aleatorio de n ciudades.
+    """
+    t0 = time.perf_counter()
+    tsp = RecorridoTSP(ciudades_aleatorias(n, semilla))
+    print(f"TSP de {n} ciudades: vecino más cercano {tsp.costo:.0f} (preparación {time.perf_counter() - t0:.2f} s)")
+
+    # Evaluar un vecino: delta O(1) contra copiar, invertir y medir el recorrido completo O(n)
+    muestra = [movimiento for _, movimiento, _ in tsp.movimientos()][:500]
+    t0 = time.perf_counter()
+    for _ in range(20):
+        for _ in tsp.movimientos():
+            pass
+    por_delta = (time.perf_counter() - t0) / (20 * n * len(tsp.vecinos[0]))
+    t0 = time.perf_counter()
+    for a, c in muestra:
+        i, j = sorted((tsp.posicion[a], tsp.posicion[c]))
+        copia = tsp.recorrido[:]
+        copia[i + 1:j + 1] = copia[j:i:-1]
+        tsp.longitud(copia)
+    por_completo = (time.perf_counter() - t0) / len(muestra)
+    print(f"  Evaluar un vecino: delta {por_delta * 1e6:.2f} us, recorrido completo {por_completo * 1e6:.0f} us "
+          f"({por_completo / por_delta:.0f}x)")
+
+    # Consultar la memoria: atributos en un diccionario contra recorridos completos en una lista
+    memoria = MemoriaTabu(permanencia)
+    lista_tabu = []
+    for iteracion in range(permanencia):
+        a, c = muestra[iteracion]
+        memoria.prohibir(tsp._arista(a, c), iteracion)
+        copia = tsp.recorrido[:]
+        copia[-2], copia[-1] = copia[-1], copia[-2]  # Recorridos que solo difieren al final: peor caso de ==
+        lista_tabu.append(copia)
+    t0 = time.perf_counter()
+    for a, c in muestra:
+        tsp._arista(a, c) in memoria
+    por_atributo = (time.perf_counter() - t0) / len(muestra)
+    t0 = time.perf_counter()
+    for _ in range(20):
+        tsp.recorrido in lista_tabu
+    por_lista = (time.perf_counter() - t0) / 20
+    print(f"  Consulta tabú: atributo {por_atributo * 1e6:.2f} us, lista de {permanencia} recorridos "
+          f"{por_lista * 1e6:.0f} us")
+
+    for nombre, tenure in (("tabú", permanencia), ("sin memoria", 0)):
+        problema = RecorridoTSP(ciudades_aleatorias(n, semilla))
+        estadisticas = EstadisticasTabu()
+        costo, recorrido = motor_tabu(problema, iteraciones, tenure, estadisticas=estadisticas)
+        assert sorted(recorrido) == list(range(n)) and abs(problema.longitud(recorrido) - costo) < 1e-6 * costo
+        print(f"  Motor {nombre}: {estadisticas.costo_inicial:.0f} -> {costo:.0f} en {estadisticas.segundos:.2f} s "
+              f"({estadisticas.iteraciones / estadisticas.segundos:.0f} iteraciones/s), {estadisticas}")
+
+
+if __name__ == "__main__":
+    # Ejemplo pequeño: 12 ciudades en círculo, desordenadas
+    puntos = [(math.cos(2 * math.pi * i / 12), math.sin(2 * math.pi * i / 12)) for i in range(12)]
+    tsp = RecorridoTSP(puntos, k=5, recorrido=[0, 6, 3, 9, 1, 7, 4, 10, 2, 8, 5, 11])
+    estadisticas = EstadisticasTabu()
+    costo, recorrido = motor_tabu(tsp, 50, 5, max_sin_mejora=20, estadisticas=estadisticas)
+    print(f"Círculo de 12 ciudades: {estadisticas.costo_inicial:.3f} -> {costo:.3f} "
+          f"(óptimo {24 * math.sin(math.pi / 12):.3f}), recorrido {recorrido}")
+
+    # Instancia mayor: python _016_Motor_Tabu.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark(n=2000, iteraciones=3000)
+    else:
+        benchmark()
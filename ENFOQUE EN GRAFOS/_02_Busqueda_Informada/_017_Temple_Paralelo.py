@@ -0,0 +1,374 @@
+# ============================================
+# TEMPLE SIMULADO VECTORIZADO CON INTERCAMBIO DE RÉPLICAS
+# ============================================
+
+# DESCRIPCIÓN TEÓRICA:
+# _007_Busqueda_de_Temple_simulado.py avanza una sola cadena y paga una llamada a random.random() y a
+# math.exp() por paso. Aquí cientos de cadenas avanzan a la vez como arreglos de NumPy:
+# - En cada paso cada cadena evalúa `intentos` movimientos desde su estado actual en una sola llamada
+#   vectorizada y se queda con el primero que pasa la prueba de Metropolis, P = min(1, exp(-ΔE / T)).
+#   Mientras los anteriores se rechazan el estado no cambia, así que el resultado es el mismo que el de
+#   probarlos uno tras otro: a baja temperatura, donde casi todo se rechaza, un paso avanza muchas
+#   propuestas de la cadena. El número de intentos se ajusta a 1 / tasa de aceptación.
+# - Las cadenas se organizan en grupos; cada grupo es una escalera de temperaturas geométrica entre
+#   t_min y t_max (temple paralelo). Cada `bloque` pasos, las cadenas de peldaños vecinos intercambian
+#   sus temperaturas con probabilidad min(1, exp((1/Ti - 1/Tj) * (Ei - Ej))): las soluciones buenas
+#   bajan a los peldaños fríos y las frías atascadas suben a calentarse. Se intercambian las
+#   temperaturas, no los estados, así que no se copia ninguna solución.
+# - Enfriamiento adaptativo: la escalera entera se multiplica por `enfriamiento` elevado a
+#   (aceptación del peldaño más frío / aceptación objetivo); mientras las cadenas frías aceptan mucho
+#   se enfría rápido, y cuando se congelan el enfriamiento se detiene.
+# - Recalentamiento: si el mejor costo no mejora en `paciencia` bloques, la escalera se multiplica
+#   por `recalentamiento` (sin pasar de la escala inicial).
+# - Con `procesos`, los grupos se reparten entre procesos independientes (cada uno con su semilla) y
+#   se devuelve el mejor resultado.
+#
+# PROBLEMA DE EJEMPLO:
+# Asignación de trabajos a máquinas no relacionadas (el trabajo j tarda tiempos[j, k] en la máquina k).
+# El costo es la suma de los cuadrados de las cargas, que equilibra las máquinas y tiene un delta
+# exacto en O(1) al mover un trabajo: p_h * (2 * L_h + p_h) + p_d * (p_d - 2 * L_d).
+
+from multiprocessing import Pool
+import math
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+
+class EstadisticasTemple:
+    """
+    Contadores de una ejecución del temple paralelo.
+    """
+    def __init__(self):
+        self.pasos = 0
+        self.evaluadas = 0  # Propuestas evaluadas (cadenas x intentos por paso)
+        self.propuestas = 0  # Propuestas que equivalen a una cadena secuencial (hasta la primera aceptada)
+        self.aceptadas = 0
+        self.intercambios_propuestos = 0
+        self.intercambios_aceptados = 0
+        self.recalentamientos = 0
+        self.segundos = 0.0
+
+    @property
+    def propuestas_por_segundo(self):
+        return self.propuestas / self.segundos if self.segundos else 0.0
+
+    def sumar(self, otra):
+        for nombre, valor in vars(otra).items():
+            setattr(self, nombre, getattr(self, nombre) + valor)
+
+    def __repr__(self):
+        return (f"EstadisticasTemple(pasos={self.pasos}, evaluadas={self.evaluadas}, propuestas={self.propuestas}, "
+                f"aceptadas={self.aceptadas}, intercambios={self.intercambios_aceptados}/"
+                f"{self.intercambios_propuestos}, recalentamientos={self.recalentamientos}, "
+                f"propuestas_por_segundo={self.propuestas_por_segundo:.0f})")
+
+
+# ============================================
+# PROBLEMA: ASIGNACIÓN A MÁQUINAS NO RELACIONADAS
+# ============================================
+class AsignacionMaquinas:
+    """
+    Estados de muchas cadenas a la vez: asignación (cadenas x trabajos) y cargas (cadenas x máquinas).
+    """
+    def __init__(self, tiempos):
+        """
+        :param tiempos: Matriz entera (trabajos x máquinas) de tiempos de proceso.
+        """
+        self.tiempos = np.asarray(tiempos, dtype=np.int64)
+        self.trabajos, self.maquinas = self.tiempos.shape
+
+    def iniciar(self, cadenas, generador):
+        """
+        Asignaciones aleatorias.
+        :return: Tupla (estado, costos de cada cadena).
+        """
+        asignacion = generador.integers(0, self.maquinas, (cadenas, self.trabajos))
+        celdas = (np.arange(cadenas)[:, None] * self.maquinas + asignacion).ravel()
+        pesos = self.tiempos[np.arange(self.trabajos), asignacion].ravel()
+        cargas = np.bincount(celdas, weights=pesos, minlength=cadenas * self.maquinas) \
+            .round().astype(np.int64).reshape(cadenas, self.maquinas)
+        return {"asignacion": asignacion, "cargas": cargas}, (cargas * cargas).sum(axis=1)
+
+    def proponer(self, estado, generador, intentos):
+        """
+        Mueve un trabajo al azar a otra máquina al azar, `intentos` veces por cadena desde el estado actual.
+        :return: Tupla (movimiento, deltas de costo de forma cadenas x intentos).
+        """
+        asignacion, cargas = estado["asignacion"], estado["cargas"]
+        cadenas = len(asignacion)
+        fila = np.arange(cadenas)[:, None]
+        trabajo = generador.integers(0, self.trabajos, (cadenas, intentos))
+        desde = asignacion[fila, trabajo]
+        hacia = (desde + generador.integers(1, self.maquinas, (cadenas, intentos))) % self.maquinas
+        p_desde, p_hacia = self.tiempos[trabajo, desde], self.tiempos[trabajo, hacia]
+        deltas = p_hacia * (2 * cargas[fila, hacia] + p_hacia) + p_desde * (p_desde - 2 * cargas[fila, desde])
+        return (trabajo, desde, hacia, p_desde, p_hacia), deltas
+
+    def aplicar(self, estado, movimiento, cadenas, elegidos):
+        """
+        Aplica en cada cadena indicada su movimiento elegido.
+        """
+        trabajo, desde, hacia, p_desde, p_hacia = (arreglo[cadenas, elegidos] for arreglo in movimiento)
+        estado["asignacion"][cadenas, trabajo] = hacia
+        estado["cargas"][cadenas, desde] -= p_desde
+        estado["cargas"][cadenas, hacia] += p_hacia
+
+    def solucion(self, estado, cadena):
+        return estado["asignacion"][cadena].copy()
+
+    def cargas(self, asignacion):
+        return np.bincount(asignacion, weights=self.tiempos[np.arange(self.trabajos), asignacion],
+                           minlength=self.maquinas).round().astype(np.int64)
+
+    def costo(self, asignacion):
+        cargas = self.cargas(asignacion)
+        return int((cargas * cargas).sum())
+
+    def cota_inferior(self):
+        """
+        Costo con todas las cargas iguales a (suma de tiempos mínimos) / máquinas.
+        """
+        carga = self.tiempos.min(axis=1).sum() / self.maquinas
+        return self.maquinas * carga * carga
+
+
+def instancia_maquinas(trabajos, maquinas, semilla=0):
+    """
+    Tiempos aleatorios: tamaño del trabajo (1..100) por la afinidad de la máquina (0.5..1.5).
+    """
+    generador = np.random.default_rng(semilla)
+    tamanos = generador.integers(1, 101, (trabajos, 1))
+    return AsignacionMaquinas(np.maximum(1, (tamanos * generador.uniform(0.5, 1.5, (trabajos, maquinas))).round()))
+
+
+# ============================================
+# MOTOR
+# ============================================
+def _temple_grupos(problema, grupos, peldanos, pasos, t_min, t_max, bloque, enfriamiento, aceptacion_objetivo,
+                   paciencia, recalentamiento, intentos_max, semilla):
+    """
+    Temple paralelo de `grupos` escaleras de `peldanos` temperaturas en un solo proceso.
+    :return: Tupla (mejor costo, mejor solución, EstadisticasTemple, cadena que ocupa cada peldaño al final).
+    """
+    estadisticas = EstadisticasTemple()
+    generador = np.random.default_rng(semilla)
+    cadenas = grupos * peldanos
+    estado, costos = problema.iniciar(cadenas, generador)
+    t0 = time.perf_counter()
+
+    if t_max is None:  # Un empeoramiento típico se acepta con probabilidad 0.8 en el peldaño más caliente
+        _, deltas = problema.proponer(estado, generador, 1)
+        subidas = deltas[deltas > 0]
+        t_max = float(subidas.mean()) / math.log(1 / 0.8) if len(subidas) else 1.0
+    if t_min is None:
+        t_min = t_max / 1000
+    escalera = t_min * (t_max / t_min) ** (np.arange(peldanos) / max(1, peldanos - 1))
+    cadena_en = np.arange(cadenas).reshape(grupos, peldanos)  # Cadena que ocupa cada peldaño de cada grupo
+    peldano_de = np.tile(np.arange(peldanos), grupos)  # Peldaño de cada cadena
+    escala = 1.0
+    temperaturas = escalera[peldano_de]
+    intentos = 1
+
+    indice = int(costos.argmin())
+    mejor_costo, mejor_solucion = costos[indice].item(), problema.solucion(estado, indice)
+    aceptadas_bloque = propuestas_bloque = aceptadas_frias = propuestas_frias = sin_mejora = 0
+    for paso in range(pasos):
+        movimiento, deltas = problema.proponer(estado, generador, intentos)
+        aceptar = generador.random(deltas.shape) < np.exp(-np.maximum(deltas, 0) / temperaturas[:, None])
+        alguna = aceptar.any(axis=1)
+        primera = aceptar.argmax(axis=1)
+        consumidas = np.where(alguna, primera + 1, intentos)  # Propuestas hasta la primera aceptada
+        movidas = np.flatnonzero(alguna)
+        problema.aplicar(estado, movimiento, movidas, primera[movidas])
+        costos[movidas] += deltas[movidas, primera[movidas]]
+
+        frias = cadena_en[:, 0]
+        aceptadas_bloque += len(movidas)
+        propuestas_bloque += int(consumidas.sum())
+        aceptadas_frias += int(alguna[frias].sum())
+        propuestas_frias += int(consumidas[frias].sum())
+        estadisticas.evaluadas += deltas.size
+
+        indice = int(costos.argmin())
+        if costos[indice] < mejor_costo:
+            mejor_costo, mejor_solucion = costos[indice].item(), problema.solucion(estado, indice)
+            sin_mejora = 0
+
+        if (paso + 1) % bloque:
+            continue
+        # Intercambio de réplicas entre peldaños vecinos (pares e impares en bloques alternos)
+        if peldanos > 1:
+            paridad = (paso // bloque) % 2
+            # Copias: las rebanadas son vistas de cadena_en y la primera asignación pisaría i
+            i, j = cadena_en[:, paridad:peldanos - 1:2].copy(), cadena_en[:, paridad + 1:peldanos:2].copy()
+            if i.size:
+                log_p = (1 / temperaturas[i] - 1 / temperaturas[j]) * (costos[i] - costos[j])
+                intercambiar = generador.random(i.shape) < np.exp(np.minimum(log_p, 0))
+                cadena_en[:, paridad:peldanos - 1:2] = np.where(intercambiar, j, i)
+                cadena_en[:, paridad + 1:peldanos:2] = np.where(intercambiar, i, j)
+                peldano_de[cadena_en] = np.arange(peldanos)
+                estadisticas.intercambios_propuestos += i.size
+                estadisticas.intercambios_aceptados += int(intercambiar.sum())
+
+        # Enfriamiento adaptativo, recalentamiento y número de intentos por paso
+        escala *= enfriamiento ** min(2.0, aceptadas_frias / propuestas_frias / aceptacion_objetivo)
+        sin_mejora += 1
+        if sin_mejora >= paciencia:
+            escala = min(1.0, escala * recalentamiento)
+            estadisticas.recalentamientos += 1
+            sin_mejora = 0
+        temperaturas = escala * escalera[peldano_de]
+        intentos = int(min(intentos_max, max(1, round(propuestas_frias / max(1, aceptadas_frias)))))
+        estadisticas.aceptadas += aceptadas_bloque
+        estadisticas.propuestas += propuestas_bloque
+        aceptadas_bloque = propuestas_bloque = aceptadas_frias = propuestas_frias = 0
+
+    estadisticas.aceptadas += aceptadas_bloque
+    estadisticas.propuestas += propuestas_bloque
+    estadisticas.pasos = pasos
+    estadisticas.segundos = time.perf_counter() - t0
+    return mejor_costo, mejor_solucion, estadisticas, cadena_en
+
+
+def _temple_en_proceso(argumentos):
+    return _temple_grupos(*argumentos)
+
+
+def temple_paralelo(problema, cadenas=64, peldanos=8, pasos=2000, t_min=None, t_max=None, bloque=10,
+                    enfriamiento=0.98, aceptacion_objetivo=0.05, paciencia=50, recalentamiento=8.0,
+                    intentos_max=64, procesos=None, semilla=0, estadisticas=None):
+    """
+    Temple simulado de muchas cadenas con intercambio de réplicas.
+    :param problema: Objeto con iniciar, proponer, aplicar y solucion vectorizados sobre las cadenas
+                     (AsignacionMaquinas es el ejemplo).
+    :param cadenas: Número total de cadenas (se redondea a un múltiplo de peldanos).
+    :param peldanos: Temperaturas de cada escalera.
+    :param pasos: Pasos vectorizados; cada uno evalúa hasta intentos_max propuestas por cadena.
+    :param t_min: Temperatura más fría de la escalera (por defecto, t_max / 1000).
+    :param t_max: Temperatura más caliente (por defecto, se estima con una muestra de deltas).
+    :param bloque: Pasos entre intercambios de réplicas y ajustes de la escala.
+    :param enfriamiento: Factor de la escala por bloque cuando la aceptación fría es la objetivo.
+    :param aceptacion_objetivo: Aceptación del peldaño más frío que fija el ritmo de enfriamiento.
+    :param paciencia: Bloques sin mejora antes de recalentar.
+    :param recalentamiento: Factor por el que se multiplica la escala al recalentar.
+    :param intentos_max: Máximo de propuestas evaluadas por cadena en un paso.
+    :param procesos: Procesos entre los que se reparten los grupos (None o 1: un solo proceso).
+    :param semilla: Semilla del generador (cada proceso usa semilla + su índice).
+    :param estadisticas: EstadisticasTemple opcional que acumula las de todos los procesos.
+    :return: Tupla (mejor costo, mejor solución).
+    """
+    estadisticas = estadisticas if estadisticas is not None else EstadisticasTemple()
+    grupos = max(1, cadenas // peldanos)
+    procesos = min(procesos or 1, grupos)
+    reparto = [grupos // procesos + (indice < grupos % procesos) for indice in range(procesos)]
+    tareas = [(problema, g, peldanos, pasos, t_min, t_max, bloque, enfriamiento, aceptacion_objetivo,
+               paciencia, recalentamiento, intentos_max, semilla + indice) for indice, g in enumerate(reparto)]
+    t0 = time.perf_counter()
+    if procesos > 1:
+        with Pool(procesos) as grupo:
+            resultados = grupo.map(_temple_en_proceso, tareas)
+    else:
+        resultados = [_temple_en_proceso(tareas[0])]
+    segundos = time.perf_counter() - t0
+
+    for _, _, parciales, _ in resultados:
+        estadisticas.sumar(parciales)
+    estadisticas.pasos = pasos
+    estadisticas.segundos = segundos
+    mejor_costo, mejor_solucion, _, _ = min(resultados, key=lambda resultado: resultado[0])
+    return mejor_costo, mejor_solucion
+
+
+# ============================================
+# REFERENCIA: UNA CADENA ESCALAR
+# ============================================
+def temple_escalar(problema, segundos, semilla=0):
+    """
+    Temple de una sola cadena con random.random() y math.exp() por paso, como en _007, durante un tiempo dado.
+    La temperatura baja geométricamente de t_max a t_max / 1000 en ese tiempo.
+    :return: Tupla (mejor costo, propuestas evaluadas).
+    """
+    generador = random.Random(semilla)
+    tiempos = problema.tiempos.tolist()
+    n, m = problema.trabajos, problema.maquinas
+    asignacion = [generador.randrange(m) for _ in range(n)]
+    cargas = [0] * m
+    for trabajo, maquina in enumerate(asignacion):
+        cargas[maquina] += tiempos[trabajo][maquina]
+    costo = sum(carga * carga for carga in cargas)
+    mejor = costo
+
+    def delta(trabajo, desde, hacia):
+        p_d, p_h = tiempos[trabajo][desde], tiempos[trabajo][hacia]
+        return p_h * (2 * cargas[hacia] + p_h) + p_d * (p_d - 2 * cargas[desde])
+
+    subidas = [max(0, delta(trabajo, asignacion[trabajo], (asignacion[trabajo] + 1) % m))
+               for trabajo in (generador.randrange(n) for _ in range(100))]
+    t_max = max(1.0, sum(subidas) / len(subidas) / math.log(1 / 0.8))
+
+    propuestas = 0
+    inicio = time.perf_counter()
+    while (transcurrido := time.perf_counter() - inicio) < segundos:
+        temperatura = t_max * 0.001 ** (transcurrido / segundos)
+        for _ in range(1000):
+            trabajo, hacia = generador.randrange(n), generador.randrange(m - 1)
+            desde = asignacion[trabajo]
+            hacia += hacia >= desde
+            d = delta(trabajo, desde, hacia)
+            if d <= 0 or generador.random() < math.exp(-d / temperatura):
+                asignacion[trabajo] = hacia
+                cargas[desde] -= tiempos[trabajo][desde]
+                cargas[hacia] += tiempos[trabajo][hacia]
+                costo += d
+                if costo < mejor:
+                    mejor = costo
+        propuestas += 1000
+    return mejor, propuestas
+
+
+# ============================================
+# BENCHMARK
+# ============================================
+def benchmark(trabajos=500, maquinas=20, pasos=5000, procesos=None):
+    """
+    Compara el mejor costo por segundo de CPU entre una cadena escalar y el motor vectorizado.
+    """
+    problema = instancia_maquinas(trabajos, maquinas)
+    cota = problema.cota_inferior()
+    print(f"{trabajos} trabajos en {maquinas} máquinas, cota inferior del costo {cota:.0f}")
+    for cadenas, peldanos, intentos in ((16, 8, 1), (16, 8, 64), (64, 8, 64), (256, 8, 64)):
+        estadisticas = EstadisticasTemple()
+        costo, asignacion = temple_paralelo(problema, cadenas=cadenas, peldanos=peldanos, pasos=pasos,
+                                            intentos_max=intentos, procesos=procesos, estadisticas=estadisticas)
+        assert problema.costo(asignacion) == costo
+        escalar, propuestas = temple_escalar(problema, estadisticas.segundos)
+        print(f"  Temple paralelo {cadenas} cadenas, hasta {intentos} intentos: {costo / cota:.4f} x cota, "
+              f"makespan {problema.cargas(asignacion).max()}, {estadisticas.segundos:.2f} s, {estadisticas}")
+        print(f"    Una cadena escalar en el mismo tiempo: {escalar / cota:.4f} x cota, "
+              f"{propuestas / estadisticas.segundos:.0f} propuestas/s")
+
+
+if __name__ == "__main__":
+    # Ejemplo pequeño: 30 trabajos en 4 máquinas
+    problema = instancia_maquinas(30, 4, semilla=1)
+    estadisticas = EstadisticasTemple()
+    costo, asignacion = temple_paralelo(problema, cadenas=64, peldanos=8, pasos=500, estadisticas=estadisticas)
+    print(f"30 trabajos en 4 máquinas: costo {costo} (cota {problema.cota_inferior():.0f}), "
+          f"cargas {problema.cargas(asignacion).tolist()}")
+    print(f"  {estadisticas}")
+
+    # Los intercambios solo permutan las cadenas: cada escalera conserva una cadena por peldaño
+    *_, estadisticas_grupos, cadena_en = _temple_grupos(problema, 8, 8, 500, None, None, 10, 0.98, 0.05, 50, 8.0,
+                                                        64, 0)
+    assert estadisticas_grupos.intercambios_aceptados > 0
+    assert (np.sort(cadena_en, axis=1) == np.arange(64).reshape(8, 8)).all()
+
+    # Instancia mayor repartida entre procesos: python _017_Temple_Paralelo.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark(trabajos=2000, maquinas=50, pasos=10000, procesos=os.cpu_count())
+    else:
+        benchmark()
@@ -0,0 +1,200 @@
+# ============================================
+# MOTOR DE BÚSQUEDA DE HAZ (DETERMINISTA Y ESTOCÁSTICA)
+# ============================================
+
+# DESCRIPCIÓN TEÓRICA:
+# _008_Busqueda_de_Haz_Local.py ordena todos los sucesores para quedarse con k, copia la lista del
+# camino de cada sucesor y busca cada nodo con haz.index(nodo) (O(k), y con duplicados en el haz
+# devuelve el camino del primero). Con haces de 10^4 estados ese trabajo domina. Este motor trabaja
+# sobre un Problema (_015_problema_implicito.py):
+# - Selección de los k mejores con heapq.nsmallest: O(n log k) en lugar de ordenar los n sucesores.
+# - Los sucesores se deduplican por el hash de su clave: se descartan los que ya están en el haz actual
+#   y, entre sucesores repetidos, se conserva el de menor g. Con un AlmacenDuplicados opcional se
+#   descartan también los estados vistos en iteraciones anteriores.
+# - Cada estado guarda un puntero a su padre, (estado, padre); el camino solo se reconstruye al final.
+# - Modo estocástico: en lugar de los k mejores se eligen k sucesores al azar sin reemplazo con peso
+#   exp(-(h - h_min) / temperatura). Se usa el muestreo de Efraimidis-Spirakis: cada sucesor recibe la
+#   clave E * exp((h - h_min) / temperatura), con E exponencial(1), y se toman las k claves menores con
+#   el mismo heapq.nsmallest.
+#
+# CARACTERÍSTICAS:
+# - Con peso_g = 0 los estados se ordenan por h (haz local); con peso_g = 1, por g + h (haz sobre A*).
+# - No es completa ni óptima: el haz puede descartar el camino a la solución.
+
+import heapq
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "_01_Busqueda_no_informada"))
+
+from _015_problema_implicito import AlmacenDuplicados, PuzzleDeslizante, _camino, puzzle_aleatorio
+
+
+class EstadisticasHaz:
+    """
+    Contadores de una ejecución del motor de haz.
+    """
+    def __init__(self):
+        self.iteraciones = 0
+        self.nodos_generados = 0
+        self.duplicados = 0  # Sucesores descartados por estar en el haz, repetidos o ya vistos
+        self.segundos = 0.0
+
+    def __repr__(self):
+        return (f"EstadisticasHaz(iteraciones={self.iteraciones}, generados={self.nodos_generados}, "
+                f"duplicados={self.duplicados}, segundos={self.segundos:.3f})")
+
+
+def busqueda_haz(problema, k, max_iteraciones=1000, peso_g=0.0, estocastica=False, temperatura=1.0,
+                 almacen=None, semilla=None, estadisticas=None):
+    """
+    Búsqueda de haz sobre un Problema.
+    :param problema: Problema con sucesores, es_objetivo, clave y heurística.
+    :param k: Anchura del haz.
+    :param max_iteraciones: Límite de iteraciones (generaciones del haz).
+    :param peso_g: Peso del costo acumulado en el orden (0: solo h; 1: g + h).
+    :param estocastica: Si es True, el haz se muestrea con peso exp(-(h - h_min) / temperatura).
+    :param temperatura: Temperatura del muestreo estocástico.
+    :param almacen: AlmacenDuplicados opcional para descartar estados de iteraciones anteriores.
+    :param semilla: Semilla del modo estocástico.
+    :param estadisticas: EstadisticasHaz opcional que se rellena durante la búsqueda.
+    :return: Tupla (g, camino) del objetivo encontrado o, si no se encuentra, del estado de menor h de todos los haces.
+    """
+    estadisticas = estadisticas if estadisticas is not None else EstadisticasHaz()
+    generador = random.Random(semilla)
+    sucesores, heuristica, es_objetivo, clave = problema.sucesores, problema.heuristica, problema.es_objetivo, problema.clave
+    t0 = time.perf_counter()
+
+    inicio = problema.estado_inicial()
+    if almacen is not None:
+        almacen.registrar(clave(inicio), 0)
+    # Entrada del haz: (orden, h, g, hash de la clave, nodo (estado, padre))
+    h = heuristica(inicio)
+    haz = [(h, h, 0, hash(clave(inicio)), (inicio, None))]
+    mejor = haz[0]
+
+    for _ in range(max_iteraciones):
+        for entrada in haz:
+            if es_objetivo(entrada[4][0]):
+                estadisticas.segundos += time.perf_counter() - t0
+                return entrada[2], _camino(entrada[4])
+
+        en_haz = {entrada[3] for entrada in haz}
+        candidatos = {}  # hash de la clave -> mejor entrada
+        for _, _, g, _, nodo in haz:
+            for sucesor, costo in sucesores(nodo[0]):
+                estadisticas.nodos_generados += 1
+                codigo = hash(clave(sucesor))
+                g_sucesor = g + costo
+                previo = candidatos.get(codigo)
+                if codigo in en_haz or (previo is not None and previo[2] <= g_sucesor):
+                    estadisticas.duplicados += 1
+                    continue
+                if almacen is not None and not almacen.registrar(clave(sucesor), g_sucesor):
+                    estadisticas.duplicados += 1
+                    continue
+                h = heuristica(sucesor)
+                candidatos[codigo] = (peso_g * g_sucesor + h, h, g_sucesor, codigo, (sucesor, nodo))
+        estadisticas.iteraciones += 1
+        if not candidatos:
+            break
+
+        if estocastica:
+            minimo = min(entrada[0] for entrada in candidatos.values())
+            claves = [(generador.expovariate(1.0) * math.exp(min(700.0, (entrada[0] - minimo) / temperatura)), entrada)
+                      for entrada in candidatos.values()]
+            haz = [entrada for _, entrada in heapq.nsmallest(k, claves, key=_primero)]
+        else:
+            haz = heapq.nsmallest(k, candidatos.values(), key=_primero)
+        mejor_del_haz = min(haz, key=_por_h)
+        if mejor_del_haz[1] < mejor[1]:
+            mejor = mejor_del_haz
+
+    estadisticas.segundos += time.perf_counter() - t0
+    return mejor[2], _camino(mejor[4])
+
+
+def _primero(entrada):
+    return entrada[0]
+
+
+def _por_h(entrada):
+    return entrada[1]
+
+
+# ============================================
+# BENCHMARK EN EL 15-PUZZLE
+# ============================================
+def _haz_con_copias(problema, k, iteraciones):
+    """
+    Esquema de _008: ordena todos los sucesores, copia caminos y busca con index().
+    :return: Longitud de la solución o None.
+    """
+    haz = [problema.estado_inicial()]
+    caminos = [[haz[0]]]
+    for _ in range(iteraciones):
+        nuevos, nuevos_caminos = [], []
+        for i, estado in enumerate(haz):
+            for sucesor, _ in problema.sucesores(estado):
+                nuevos.append(sucesor)
+                nuevos_caminos.append(caminos[i] + [sucesor])
+        indices = sorted(range(len(nuevos)), key=lambda i: problema.heuristica(nuevos[i]))[:k]
+        haz = [nuevos[i] for i in indices]
+        caminos = [nuevos_caminos[i] for i in indices]
+        for estado in haz:
+            if problema.es_objetivo(estado):
+                return len(caminos[haz.index(estado)]) - 1
+    return None
+
+
+def _describir(problema, g, camino):
+    """
+    Texto con la longitud de la solución o, si el haz no llegó al objetivo, la mejor h alcanzada.
+    """
+    if problema.es_objetivo(camino[-1]):
+        return f"{g} movimientos"
+    return f"sin solución (mejor h = {problema.heuristica(camino[-1])})"
+
+
+def benchmark(anchuras=(100, 1000), movimientos=1000, iteraciones=200, semilla=0):
+    """
+    Compara el motor con el esquema de _008 en un 24-puzzle muy desordenado.
+    """
+    puzzle = puzzle_aleatorio(5, movimientos, semilla)
+    print(f"24-puzzle con {movimientos} movimientos aleatorios, h = {puzzle.heuristica(puzzle.inicial)}")
+    for k in anchuras:
+        t0 = time.perf_counter()
+        longitud = _haz_con_copias(puzzle, k, iteraciones)
+        anterior = time.perf_counter() - t0
+        estadisticas = EstadisticasHaz()
+        g, camino = busqueda_haz(puzzle, k, iteraciones, estadisticas=estadisticas)
+        resultado = _describir(puzzle, g, camino)
+        print(f"  k = {k}: {resultado} en {estadisticas.segundos:.2f} s, {estadisticas}")
+        print(f"    Esquema de _008: {f'{longitud} movimientos' if longitud else 'sin solución'} en {anterior:.2f} s")
+
+    k = anchuras[-1]
+    for nombre, argumentos in (("estocástico", {"estocastica": True, "temperatura": 2.0, "semilla": semilla}),
+                               ("con almacén", {"almacen": AlmacenDuplicados(max_entradas=50 * k)})):
+        estadisticas = EstadisticasHaz()
+        g, camino = busqueda_haz(puzzle, k, iteraciones, estadisticas=estadisticas, **argumentos)
+        resultado = _describir(puzzle, g, camino)
+        print(f"  Haz {nombre} k = {k}: {resultado}, {estadisticas}")
+
+
+if __name__ == "__main__":
+    # 8-puzzle del ejemplo de _015_problema_implicito.py (31 movimientos óptimos)
+    puzzle = PuzzleDeslizante((8, 6, 7, 2, 5, 4, 3, 0, 1))
+    for k in (10, 100, 1000):
+        estadisticas = EstadisticasHaz()
+        g, camino = busqueda_haz(puzzle, k, estadisticas=estadisticas)
+        resultado = _describir(puzzle, g, camino)
+        print(f"Haz con k = {k} en el 8-puzzle: {resultado}, {estadisticas}")
+
+    # Haz de 10^4 estados (el esquema de _008 tarda minutos): python _018_Motor_Haz.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark(anchuras=(100, 1000, 10000), iteraciones=400)
+    else:
+        benchmark()
@@ -0,0 +1,360 @@
+# ============================================
+# ASCENSIÓN DE COLINAS CON REINICIOS ALEATORIOS EN VARIOS PROCESOS
+# ============================================
+
+# DESCRIPCIÓN TEÓRICA:
+# _005_Busqueda_de_Ascension_de_colinas.py se detiene en el primer óptimo local y se ejecuta una vez.
+# Con reinicios aleatorios se repite la ascensión desde estados iniciales al azar y se conserva el mejor
+# resultado: si un reinicio llega al objetivo con probabilidad p, hacen falta 1 / p reinicios en promedio.
+# - Dos variantes: ascensión de máxima pendiente (evalúa todos los vecinos y toma el mejor, con un
+#   número limitado de movimientos laterales en mesetas) y de primera elección (prueba vecinos al azar
+#   y toma el primero que mejora).
+# - Los reinicios son independientes y se reparten en bloques entre los procesos de un
+#   ProcessPoolExecutor. Cada reinicio tiene su propio generador, random.Random("semilla:índice"), así
+#   que el resultado de un reinicio no depende del proceso que lo ejecute.
+# - Los procesos comparten el mejor valor encontrado (multiprocessing.Value). Cuando alcanza el valor
+#   objetivo, los demás dejan de empezar reinicios y cortan el que tienen en curso.
+# - El resultado guarda lo que dio cada reinicio (valor, pasos, segundos) y estima a partir de ahí la
+#   probabilidad de éxito por reinicio y los reinicios necesarios para un presupuesto de tiempo. Los
+#   reinicios cortados a medias no entran en esas estimaciones; solo se cuentan.
+#
+# PROBLEMA DE EJEMPLO:
+# N reinas: una reina por columna, el valor es el número de pares que se atacan (0 es solución). Los
+# contadores por fila y diagonal dan el delta de mover una reina en O(1).
+
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+import math
+from multiprocessing import Value
+import os
+import random
+import sys
+import time
+
+
+# ============================================
+# PROBLEMA: N REINAS
+# ============================================
+class EstadoReinas:
+    """
+    Fila de la reina de cada columna y número de reinas por fila y por diagonal.
+    """
+    __slots__ = ("filas", "por_fila", "por_diagonal", "por_antidiagonal", "valor")
+
+    def __init__(self, filas):
+        n = len(filas)
+        self.filas = list(filas)
+        self.por_fila = [0] * n
+        self.por_diagonal = [0] * (2 * n - 1)
+        self.por_antidiagonal = [0] * (2 * n - 1)
+        for columna, fila in enumerate(self.filas):
+            self.por_fila[fila] += 1
+            self.por_diagonal[fila + columna] += 1
+            self.por_antidiagonal[fila - columna + n - 1] += 1
+        self.valor = sum(k * (k - 1) // 2 for contadores in (self.por_fila, self.por_diagonal, self.por_antidiagonal)
+                         for k in contadores)
+
+
+class ReinasN:
+    """
+    N reinas como problema de minimización para la ascensión de colinas.
+    """
+    def __init__(self, n):
+        self.n = n
+
+    def estado_aleatorio(self, generador):
+        return EstadoReinas([generador.randrange(self.n) for _ in range(self.n)])
+
+    def delta(self, estado, columna, fila):
+        """
+        Cambio en el número de ataques al mover la reina de la columna a la fila dada.
+        """
+        n, actual = self.n, estado.filas[columna]
+        pierde = (estado.por_fila[actual] + estado.por_diagonal[actual + columna]
+                  + estado.por_antidiagonal[actual - columna + n - 1] - 3)
+        gana = estado.por_fila[fila] + estado.por_diagonal[fila + columna] + estado.por_antidiagonal[fila - columna + n - 1]
+        return gana - pierde
+
+    def mejores_movimientos(self, estado):
+        """
+        Movimientos (columna, fila) de menor delta entre todos los vecinos.
+        :return: Tupla (delta, lista de movimientos empatados).
+        """
+        n, filas = self.n, estado.filas
+        por_fila, por_diagonal, por_antidiagonal = estado.por_fila, estado.por_diagonal, estado.por_antidiagonal
+        mejor, empatados = math.inf, []
+        for columna in range(n):
+            actual = filas[columna]
+            pierde = por_fila[actual] + por_diagonal[actual + columna] + por_antidiagonal[actual - columna + n - 1] - 3
+            for fila in range(n):
+                if fila == actual:
+                    continue
+                delta = por_fila[fila] + por_diagonal[fila + columna] + por_antidiagonal[fila - columna + n - 1] - pierde
+                if delta < mejor:
+                    mejor, empatados = delta, [(columna, fila)]
+                elif delta == mejor:
+                    empatados.append((columna, fila))
+        return mejor, empatados
+
+    def movimiento_aleatorio(self, estado, generador):
+        columna = generador.randrange(self.n)
+        fila = generador.randrange(self.n - 1)
+        return columna, fila + (fila >= estado.filas[columna])
+
+    def aplicar(self, estado, movimiento, delta):
+        columna, fila = movimiento
+        n, actual = self.n, estado.filas[columna]
+        estado.por_fila[actual] -= 1
+        estado.por_diagonal[actual + columna] -= 1
+        estado.por_antidiagonal[actual - columna + n - 1] -= 1
+        estado.por_fila[fila] += 1
+        estado.por_diagonal[fila + columna] += 1
+        estado.por_antidiagonal[fila - columna + n - 1] += 1
+        estado.filas[columna] = fila
+        estado.valor += delta
+
+    def solucion(self, estado):
+        return tuple(estado.filas)
+
+
+# ============================================
+# VARIANTES DE ASCENSIÓN
+# ============================================
+def ascension_maxima_pendiente(problema, generador, max_pasos=10000, laterales=100, detener=None):
+    """
+    Toma siempre el mejor vecino (empates al azar); admite hasta `laterales` movimientos seguidos sin mejora.
+    :param detener: Función sin argumentos que devuelve True para cortar la ascensión.
+    :return: Tupla (valor, solución, pasos, cortada); cortada es True si la detuvo `detener`.
+    """
+    estado = problema.estado_aleatorio(generador)
+    seguidos = 0
+    for paso in range(max_pasos):
+        if estado.valor == 0:
+            return estado.valor, problema.solucion(estado), paso, False
+        if paso % 64 == 0 and detener is not None and detener():
+            return estado.valor, problema.solucion(estado), paso, True
+        delta, empatados = problema.mejores_movimientos(estado)
+        if delta > 0 or (delta == 0 and seguidos >= laterales):
+            return estado.valor, problema.solucion(estado), paso, False
+        seguidos = seguidos + 1 if delta == 0 else 0
+        problema.aplicar(estado, generador.choice(empatados), delta)
+    return estado.valor, problema.solucion(estado), max_pasos, False
+
+
+def ascension_primera_eleccion(problema, generador, max_pasos=100000, max_intentos=None, detener=None):
+    """
+    Prueba vecinos al azar y toma el primero que mejora; se detiene tras `max_intentos` vecinos seguidos sin mejora.
+    :return: Tupla (valor, solución, pasos, cortada); cortada es True si la detuvo `detener`.
+    """
+    estado = problema.estado_aleatorio(generador)
+    max_intentos = max_intentos or 2 * problema.n * problema.n
+    intentos = 0
+    for paso in range(max_pasos):
+        if estado.valor == 0 or intentos >= max_intentos:
+            return estado.valor, problema.solucion(estado), paso, False
+        if paso % 1024 == 0 and detener is not None and detener():
+            return estado.valor, problema.solucion(estado), paso, True
+        movimiento = problema.movimiento_aleatorio(estado, generador)
+        delta = problema.delta(estado, *movimiento)
+        if delta < 0:
+            problema.aplicar(estado, movimiento, delta)
+            intentos = 0
+        else:
+            intentos += 1
+    return estado.valor, problema.solucion(estado), max_pasos, False
+
+
+_VARIANTES = {"maxima": ascension_maxima_pendiente, "primera": ascension_primera_eleccion}
+
+
+# ============================================
+# ORQUESTACIÓN DE REINICIOS
+# ============================================
+class ResultadoReinicios:
+    """
+    Mejor solución y resultado de cada reinicio completo: (índice, valor, pasos, segundos, pid).
+    Los reinicios cortados al alcanzarse el objetivo en otro proceso no terminaron su ascensión: solo se
+    cuentan en `cortados`, para que no sesguen la distribución ni las estimaciones.
+    """
+    def __init__(self):
+        self.mejor_valor = math.inf
+        self.mejor_solucion = None
+        self.reinicios = []
+        self.cortados = 0
+        self.segundos = 0.0  # Tiempo de reloj de toda la ejecución
+        self.detenido = False  # True si se alcanzó el objetivo antes de agotar los reinicios
+
+    def distribucion(self):
+        """
+        Número de reinicios que terminaron en cada valor.
+        """
+        conteo = {}
+        for _, valor, _, _, _ in self.reinicios:
+            conteo[valor] = conteo.get(valor, 0) + 1
+        return dict(sorted(conteo.items()))
+
+    def probabilidad_exito(self, objetivo=0):
+        """
+        Fracción de reinicios que alcanzaron un valor menor o igual que el objetivo.
+        """
+        return sum(valor <= objetivo for _, valor, _, _, _ in self.reinicios) / len(self.reinicios) if self.reinicios else 0.0
+
+    def segundos_por_reinicio(self):
+        """
+        Percentiles 50, 90 y 99 del tiempo de un reinicio.
+        """
+        tiempos = sorted(segundos for _, _, _, segundos, _ in self.reinicios)
+        return tuple(tiempos[min(len(tiempos) - 1, int(q * len(tiempos)))] for q in (0.5, 0.9, 0.99)) if tiempos else ()
+
+    def reinicios_necesarios(self, confianza=0.99, objetivo=0):
+        """
+        Reinicios para alcanzar el objetivo al menos una vez con la confianza dada: log(1 - c) / log(1 - p).
+        """
+        p = self.probabilidad_exito(objetivo)
+        if p <= 0:
+            return math.inf
+        if p >= 1:
+            return 1
+        return math.ceil(math.log(1 - confianza) / math.log(1 - p))
+
+    def exito_en_presupuesto(self, segundos, procesos=1, objetivo=0):
+        """
+        Probabilidad de alcanzar el objetivo en un presupuesto de reloj: 1 - (1 - p)^r, con r los reinicios
+        que caben según el tiempo medio por reinicio.
+        """
+        if not self.reinicios:
+            return 0.0
+        medio = sum(segundos for _, _, _, segundos, _ in self.reinicios) / len(self.reinicios)
+        reinicios = int(segundos * procesos / medio) if medio else len(self.reinicios)
+        return 1 - (1 - self.probabilidad_exito(objetivo)) ** reinicios
+
+    def __repr__(self):
+        return (f"ResultadoReinicios(mejor={self.mejor_valor}, reinicios={len(self.reinicios)}, "
+                f"cortados={self.cortados}, detenido={self.detenido}, segundos={self.segundos:.2f})")
+
+
+_trabajador = {}  # Problema y mejor valor compartido de cada proceso
+
+
+def _iniciar_trabajador(problema, mejor_compartido):
+    _trabajador.update(problema=problema, mejor=mejor_compartido)
+
+
+def _ejecutar_reinicios(tarea):
+    """
+    Ejecuta un bloque de reinicios en un proceso.
+    :param tarea: Tupla (variante, índices, semilla, objetivo, argumentos de la variante).
+    :return: Tupla (resultados por reinicio completo, reinicios cortados, mejor valor del bloque, su solución).
+    """
+    variante, indices, semilla, objetivo, argumentos = tarea
+    problema, mejor = _trabajador["problema"], _trabajador["mejor"]
+    ascender = _VARIANTES[variante]
+    detener = (lambda: mejor.value <= objetivo) if objetivo is not None else None
+    resultados, cortados, mejor_valor, mejor_solucion = [], 0, math.inf, None
+    for indice in indices:
+        if detener is not None and detener():
+            break
+        t0 = time.perf_counter()
+        valor, solucion, pasos, cortada = ascender(problema, random.Random(f"{semilla}:{indice}"), detener=detener,
+                                                   **argumentos)
+        if cortada:
+            cortados += 1
+        else:
+            resultados.append((indice, valor, pasos, time.perf_counter() - t0, os.getpid()))
+        if valor < mejor_valor:
+            mejor_valor, mejor_solucion = valor, solucion
+        if valor < mejor.value:
+            with mejor.get_lock():
+                if valor < mejor.value:
+                    mejor.value = valor
+    return resultados, cortados, mejor_valor, mejor_solucion
+
+
+def reinicios_aleatorios(problema, reinicios, variante="maxima", objetivo=None, procesos=None, tamano_bloque=8,
+                         semilla=0, **argumentos):
+    """
+    Ejecuta reinicios independientes de ascensión de colinas en un ProcessPoolExecutor.
+    :param problema: Problema con estado_aleatorio, mejores_movimientos, movimiento_aleatorio, delta y aplicar
+                     (ReinasN es el ejemplo).
+    :param reinicios: Número máximo de reinicios.
+    :param variante: "maxima" (máxima pendiente) o "primera" (primera elección).
+    :param objetivo: Valor con el que todos los procesos se detienen (None: ejecutar todos los reinicios).
+    :param procesos: Número de procesos (None: todos los núcleos; 1: en este proceso).
+    :param tamano_bloque: Reinicios por tarea enviada a un proceso.
+    :param semilla: Semilla base; el reinicio i usa random.Random(f"{semilla}:{i}").
+    :param argumentos: Parámetros de la variante (max_pasos, laterales, max_intentos).
+    :return: ResultadoReinicios.
+    """
+    resultado = ResultadoReinicios()
+    procesos = procesos or os.cpu_count() or 1
+    mejor = Value("d", math.inf)
+    tareas = [(variante, range(inicio, min(reinicios, inicio + tamano_bloque)), semilla, objetivo, argumentos)
+              for inicio in range(0, reinicios, tamano_bloque)]
+    t0 = time.perf_counter()
+
+    def recoger(parcial):
+        resultados, cortados, valor, solucion = parcial
+        resultado.reinicios.extend(resultados)
+        resultado.cortados += cortados
+        if valor < resultado.mejor_valor:
+            resultado.mejor_valor, resultado.mejor_solucion = valor, solucion
+
+    if procesos == 1:
+        _iniciar_trabajador(problema, mejor)
+        for tarea in tareas:
+            recoger(_ejecutar_reinicios(tarea))
+            if objetivo is not None and resultado.mejor_valor <= objetivo:
+                break
+    else:
+        with ProcessPoolExecutor(procesos, initializer=_iniciar_trabajador, initargs=(problema, mejor)) as ejecutor:
+            pendientes = {ejecutor.submit(_ejecutar_reinicios, tarea) for tarea in tareas}
+            while pendientes:
+                terminadas, pendientes = wait(pendientes, return_when=FIRST_COMPLETED)
+                for futuro in terminadas:
+                    recoger(futuro.result())
+                if objetivo is not None and resultado.mejor_valor <= objetivo:
+                    for futuro in pendientes:
+                        futuro.cancel()
+                    break
+
+    resultado.reinicios.sort()
+    resultado.detenido = (objetivo is not None and resultado.mejor_valor <= objetivo
+                          and len(resultado.reinicios) + resultado.cortados < reinicios)
+    resultado.segundos = time.perf_counter() - t0
+    return resultado
+
+
+# ============================================
+# BENCHMARK
+# ============================================
+def benchmark(n=8, reinicios=400, procesos=None):
+    """
+    Distribución de resultados de las dos variantes y estimación de reinicios por presupuesto.
+    """
+    problema = ReinasN(n)
+    for variante, argumentos in (("maxima", {"laterales": 0}), ("maxima", {"laterales": 100}), ("primera", {})):
+        resultado = reinicios_aleatorios(problema, reinicios, variante, procesos=procesos, **argumentos)
+        mediana, p90, p99 = resultado.segundos_por_reinicio()
+        print(f"{n} reinas, {variante} {argumentos}: {resultado}")
+        print(f"  Distribución de valores finales: {resultado.distribucion()}")
+        print(f"  Éxito por reinicio {resultado.probabilidad_exito():.3f}; reinicios para 99 %: "
+              f"{resultado.reinicios_necesarios()}; segundos por reinicio p50/p90/p99 "
+              f"{mediana * 1e3:.2f}/{p90 * 1e3:.2f}/{p99 * 1e3:.2f} ms; "
+              f"éxito en 1 ms con {procesos or os.cpu_count()} proceso(s): "
+              f"{resultado.exito_en_presupuesto(0.001, procesos or os.cpu_count()):.3f}")
+
+    resultado = reinicios_aleatorios(problema, 10000, "maxima", objetivo=0, procesos=procesos, laterales=100)
+    print(f"Hasta la primera solución: {resultado}, solución {resultado.mejor_solucion}")
+
+
+if __name__ == "__main__":
+    # Una ascensión cortada lo informa (reinicios_aleatorios la cuenta aparte, fuera de las estadísticas)
+    problema = ReinasN(8)
+    for ascender in (ascension_maxima_pendiente, ascension_primera_eleccion):
+        valor, _, pasos, cortada = ascender(problema, random.Random(1), detener=lambda: True)
+        assert cortada and pasos == 0 and valor > 0
+
+    # Tablero mayor: python _019_Reinicios_Colinas.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark(n=50, reinicios=100)
+    else:
+        benchmark()
@@ -0,0 +1,225 @@
+# ============================================
+# ALGORITMO GENÉTICO VECTORIZADO PARA PERMUTACIONES
+# ============================================
+
+# DESCRIPCIÓN TEÓRICA:
+# _009_Algoritmos_Genéticos.py guarda cada ruta como una lista de nombres, busca cada arista en un
+# diccionario de diccionarios, recorre la población entera en cada selección por ruleta y la cruza
+# ordenada pregunta `ciudad not in hijo` (O(n²)). Con 10^4 individuos de 500 ciudades eso son horas.
+# Aquí toda la población es un arreglo int32 de forma (población, n) y cada operador trabaja sobre el
+# arreglo completo:
+# - Longitud: distancias[poblacion, np.roll(poblacion, -1, axis=1)].sum(axis=1), un solo indexado.
+# - Selección por torneo (el menor de t índices al azar) o por ruleta con la suma acumulada de la
+#   aptitud 1 / longitud y np.searchsorted (O(log n) por selección en lugar de O(n)).
+# - Cruza ordenada (OX) con máscaras: el hijo copia el tramo [a, b) del primer padre; las demás casillas,
+#   empezando en b, se llenan con los genes del segundo padre leídos desde b que no están en el tramo.
+#   La permutación inversa del primer padre dice en O(1) si un gen está en el tramo (sustituye a la
+#   búsqueda `not in`) y una suma acumulada de esa máscara da la casilla de destino de cada gen.
+# - Mutación por intercambio de dos posiciones en las filas elegidas, con indexado por filas.
+# - Elitismo: los mejores individuos pasan sin cambios a la siguiente generación.
+
+import sys
+import time
+
+import numpy as np
+
+
+class EstadisticasGenetico:
+    """
+    Contadores de una ejecución del algoritmo genético vectorizado.
+    """
+    def __init__(self):
+        self.generaciones = 0
+        self.individuos = 0  # Individuos evaluados
+        self.historial = []  # Mejor longitud al terminar cada generación
+        self.segundos = 0.0
+
+    @property
+    def individuos_por_segundo(self):
+        return self.individuos / self.segundos if self.segundos else 0.0
+
+    def __repr__(self):
+        return (f"EstadisticasGenetico(generaciones={self.generaciones}, individuos={self.individuos}, "
+                f"individuos_por_segundo={self.individuos_por_segundo:.0f}, segundos={self.segundos:.2f})")
+
+
+# ============================================
+# OPERADORES
+# ============================================
+def longitudes_de_ruta(poblacion, distancias):
+    """
+    Longitud del recorrido cerrado de cada fila.
+    """
+    return distancias[poblacion, np.roll(poblacion, -1, axis=1)].sum(axis=1)
+
+
+def seleccion_torneo(longitudes, cantidad, generador, tamano=3):
+    """
+    Índices de `cantidad` ganadores de torneos de `tamano` individuos (gana la menor longitud).
+    """
+    participantes = generador.integers(0, len(longitudes), (cantidad, tamano))
+    return participantes[np.arange(cantidad), longitudes[participantes].argmin(axis=1)]
+
+
+def seleccion_ruleta(longitudes, cantidad, generador):
+    """
+    Índices elegidos con probabilidad proporcional a 1 / longitud (suma acumulada y búsqueda binaria).
+    """
+    acumulada = np.cumsum(1.0 / longitudes)
+    return np.searchsorted(acumulada, generador.random(cantidad) * acumulada[-1], side="right") \
+        .clip(max=len(longitudes) - 1)
+
+
+def cruza_ordenada(padres1, padres2, generador):
+    """
+    Cruza ordenada (OX) fila a fila entre dos matrices de padres.
+    :return: Matriz de hijos.
+    """
+    filas, n = padres1.shape
+    cortes = np.sort(generador.integers(0, n + 1, (filas, 2), dtype=np.int32), axis=1)
+    a, b = cortes[:, :1], cortes[:, 1:]
+    columnas = np.arange(n, dtype=np.int32)
+    base = np.arange(0, filas * n, n, dtype=np.int32)[:, None]  # Índices planos en int32: la mitad de memoria
+
+    posicion1 = np.empty(filas * n, dtype=np.int32)  # posicion1[f * n + g]: columna del gen g en padres1[f]
+    posicion1[base + padres1] = columnas
+    desde_b = b + columnas  # Columnas leídas desde b, dando la vuelta
+    desde_b[desde_b >= n] -= n
+    orden2 = padres2.ravel()[base + desde_b]
+    columna = posicion1[base + orden2]
+    fuera = (columna < a) | (columna >= b)  # Genes de padres2 que no están en el tramo de padres1
+
+    # Las casillas libres son b, b + 1, ..., a - 1 (dando la vuelta): el k-ésimo gen que se conserva va a
+    # b + k - 1 módulo n. Los descartados se escriben en una columna extra que luego se quita.
+    destino = np.cumsum(fuera, axis=1, dtype=np.int32)
+    destino += b - 1
+    destino[destino >= n] -= n
+    destino[~fuera] = n
+    hijos = np.empty((filas, n + 1), dtype=padres1.dtype)
+    hijos[:, :n] = padres1
+    hijos.ravel()[np.arange(0, filas * (n + 1), n + 1, dtype=np.int32)[:, None] + destino] = orden2
+    return hijos[:, :n]
+
+
+def mutacion_intercambio(poblacion, tasa, generador):
+    """
+    Intercambia dos posiciones al azar en cada fila elegida con probabilidad `tasa` (en el sitio).
+    """
+    filas = np.flatnonzero(generador.random(len(poblacion)) < tasa)
+    n = poblacion.shape[1]
+    i = generador.integers(0, n, len(filas))
+    j = generador.integers(0, n, len(filas))
+    poblacion[filas, i], poblacion[filas, j] = poblacion[filas, j], poblacion[filas, i]
+    return poblacion
+
+
+def poblacion_aleatoria(tamano, n, generador):
+    return np.argsort(generador.random((tamano, n)), axis=1).astype(np.int32)
+
+
+def generacion(poblacion, longitudes, distancias, generador, elite=2, tasa_mutacion=0.2, seleccion="torneo"):
+    """
+    Produce la siguiente generación: élite, selección de padres, cruza ordenada y mutación.
+    :return: Tupla (nueva población, sus longitudes).
+    """
+    tamano = len(poblacion)
+    hijos = tamano - elite
+    if seleccion == "ruleta":
+        padres = seleccion_ruleta(longitudes, 2 * hijos, generador)
+    else:
+        padres = seleccion_torneo(longitudes, 2 * hijos, generador)
+    nuevos = mutacion_intercambio(cruza_ordenada(poblacion[padres[:hijos]], poblacion[padres[hijos:]], generador),
+                                  tasa_mutacion, generador)
+    mejores = np.argpartition(longitudes, elite)[:elite] if elite else np.empty(0, dtype=np.intp)
+    poblacion = np.concatenate([poblacion[mejores], nuevos])
+    return poblacion, np.concatenate([longitudes[mejores], longitudes_de_ruta(nuevos, distancias)])
+
+
+# ============================================
+# ALGORITMO GENÉTICO
+# ============================================
+def algoritmo_genetico_vectorizado(distancias, tamano_poblacion, generaciones, tasa_mutacion=0.2, elite=2,
+                                   seleccion="torneo", semilla=0, mejora=None, mejorados=0, estadisticas=None):
+    """
+    Algoritmo genético para el problema del viajero con la población en un arreglo (población, n).
+    :param distancias: Matriz de distancias n x n (por ejemplo, de matriz_de_distancias).
+    :param tamano_poblacion: Individuos por generación.
+    :param generaciones: Número de generaciones.
+    :param tasa_mutacion: Probabilidad de mutar a cada hijo.
+    :param elite: Individuos que pasan sin cambios.
+    :param seleccion: "torneo" o "ruleta".
+    :param semilla: Semilla del generador de NumPy.
+    :param mejora: MejoraLocal de _022_Mejora_Local.py opcional (algoritmo memético): mejora hijos y la ruta final.
+    :param mejorados: Hijos que se llevan a un óptimo local en cada generación.
+    :param estadisticas: EstadisticasGenetico opcional que se rellena durante la ejecución.
+    :return: Tupla (mejor ruta como arreglo de índices, su longitud).
+    """
+    estadisticas = estadisticas if estadisticas is not None else EstadisticasGenetico()
+    distancias = np.asarray(distancias)
+    generador = np.random.default_rng(semilla)
+    t0 = time.perf_counter()
+    poblacion = poblacion_aleatoria(tamano_poblacion, len(distancias), generador)
+    longitudes = longitudes_de_ruta(poblacion, distancias)
+    estadisticas.individuos += tamano_poblacion
+    for _ in range(generaciones):
+        poblacion, longitudes = generacion(poblacion, longitudes, distancias, generador, elite, tasa_mutacion, seleccion)
+        if mejora is not None and mejorados:
+            mejora.mejorar_poblacion(poblacion, longitudes, range(elite, min(elite + mejorados, tamano_poblacion)))
+        estadisticas.generaciones += 1
+        estadisticas.individuos += tamano_poblacion - elite
+        estadisticas.historial.append(float(longitudes.min()))
+    mejor = int(longitudes.argmin())
+    ruta, longitud = poblacion[mejor].copy(), float(longitudes[mejor])
+    if mejora is not None:
+        ruta, longitud = mejora.mejorar(ruta)
+        ruta = np.array(ruta, dtype=np.int32)
+    estadisticas.segundos += time.perf_counter() - t0
+    return ruta, longitud
+
+
+def ciudades_aleatorias(n, semilla=0):
+    """
+    Coordenadas uniformes en [0, 1000)^2 y su matriz de distancias euclídeas.
+    """
+    puntos = np.random.default_rng(semilla).random((n, 2)) * 1000
+    return puntos, np.sqrt(((puntos[:, None, :] - puntos[None, :, :]) ** 2).sum(axis=2))
+
+
+# ============================================
+# BENCHMARK
+# ============================================
+def benchmark(n=500, tamano_poblacion=10000, generaciones=20):
+    """
+    Compara el tiempo por individuo con _009 y mide generaciones por segundo con 10^4 individuos.
+    """
+    from _009_Algoritmos_Genéticos import algoritmo_genetico
+
+    _, distancias = ciudades_aleatorias(n)
+    lista = distancias.tolist()
+    t0 = time.perf_counter()
+    algoritmo_genetico(list(range(n)), lista, 100, 1, 0.01)
+    por_individuo = (time.perf_counter() - t0) / 200  # Población inicial y una generación
+    print(f"{n} ciudades, _009: {por_individuo * 1e3:.2f} ms por individuo")
+
+    for seleccion in ("torneo", "ruleta"):
+        estadisticas = EstadisticasGenetico()
+        ruta, longitud = algoritmo_genetico_vectorizado(distancias, tamano_poblacion, generaciones,
+                                                        seleccion=seleccion, estadisticas=estadisticas)
+        assert sorted(ruta.tolist()) == list(range(n))
+        print(f"  Vectorizado ({seleccion}), {tamano_poblacion} individuos: {longitud:.0f} tras {generaciones} "
+              f"generaciones ({estadisticas.historial[0]:.0f} en la primera), "
+              f"{estadisticas.segundos / generaciones * 1e3:.0f} ms por generación, "
+              f"{1e6 / estadisticas.individuos_por_segundo:.2f} us por individuo, {estadisticas}")
+
+
+if __name__ == "__main__":
+    # Ejemplo pequeño: 30 ciudades
+    _, distancias = ciudades_aleatorias(30, semilla=1)
+    ruta, longitud = algoritmo_genetico_vectorizado(distancias, 500, 300)
+    print(f"30 ciudades: longitud {longitud:.0f}, ruta {ruta.tolist()}")
+
+    # Más generaciones: python _020_Genetico_Vectorizado.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark(generaciones=100)
+    else:
+        benchmark()
@@ -0,0 +1,297 @@
+# ============================================
+# ALGORITMO GENÉTICO EN ISLAS CON MIGRACIÓN
+# ============================================
+
+# DESCRIPCIÓN TEÓRICA:
+# El modelo de islas divide la población en subpoblaciones independientes que evolucionan en paralelo
+# (cada una con los operadores vectorizados de _020_Genetico_Vectorizado.py) y cada `intervalo`
+# generaciones intercambian sus mejores individuos:
+# - Topología en anillo: la isla i recibe a los emigrantes de la isla i - 1.
+# - Topología aleatoria: en cada época se baraja el orden de las islas (con la misma semilla en todos los
+#   procesos) y cada isla recibe de la anterior en ese orden; así cada isla envía y recibe exactamente una vez.
+# Los emigrantes (los `tasa_migracion * tamaño` mejores) sustituyen a los peores de la isla de destino.
+#
+# Cada isla es un proceso que vive toda la ejecución; la matriz de distancias, los buzones de emigrantes
+# y los resultados están en un único bloque de memoria compartida, de modo que una migración solo copia
+# migrantes * n enteros. Dos esperas en una Barrier por época separan la escritura de los buzones de su lectura.
+# El trabajo entre barreras es el mismo en todas las islas, así que el rendimiento escala casi linealmente
+# hasta el número de núcleos.
+
+import math
+import os
+import sys
+import time
+from multiprocessing import Barrier, Process, shared_memory
+
+import numpy as np
+
+from _020_Genetico_Vectorizado import (
+    EstadisticasGenetico, algoritmo_genetico_vectorizado, ciudades_aleatorias, generacion, longitudes_de_ruta,
+    poblacion_aleatoria)
+
+
+class EstadisticasIslas:
+    """
+    Contadores de una ejecución del modelo de islas.
+    """
+    def __init__(self):
+        self.epocas = 0
+        self.migrantes = 0  # Individuos copiados entre islas
+        self.individuos = 0  # Individuos evaluados en todas las islas
+        self.historial = []  # Mejor longitud de todas las islas al final de cada época
+        self.segundos = 0.0
+
+    @property
+    def individuos_por_segundo(self):
+        return self.individuos / self.segundos if self.segundos else 0.0
+
+    def __repr__(self):
+        return (f"EstadisticasIslas(epocas={self.epocas}, migrantes={self.migrantes}, individuos={self.individuos}, "
+                f"individuos_por_segundo={self.individuos_por_segundo:.0f}, segundos={self.segundos:.2f})")
+
+
+class Isla:
+    """
+    Subpoblación que evoluciona con los operadores de _020 y admite emigrantes.
+    """
+    def __init__(self, distancias, tamano, generador, elite=2, tasa_mutacion=0.2, seleccion="torneo"):
+        self.distancias, self.generador = distancias, generador
+        self.elite, self.tasa_mutacion, self.seleccion = elite, tasa_mutacion, seleccion
+        self.poblacion = poblacion_aleatoria(tamano, len(distancias), generador)
+        self.longitudes = longitudes_de_ruta(self.poblacion, distancias)
+
+    def evolucionar(self, generaciones):
+        for _ in range(generaciones):
+            self.poblacion, self.longitudes = generacion(self.poblacion, self.longitudes, self.distancias,
+                                                         self.generador, self.elite, self.tasa_mutacion, self.seleccion)
+
+    def emigrantes(self, cantidad):
+        """
+        Copias de los `cantidad` mejores individuos y sus longitudes.
+        """
+        mejores = np.argpartition(self.longitudes, cantidad - 1)[:cantidad]
+        return self.poblacion[mejores], self.longitudes[mejores]
+
+    def recibir(self, individuos, longitudes):
+        """
+        Sustituye a los peores individuos por los recibidos.
+        """
+        peores = np.argpartition(self.longitudes, len(self.longitudes) - len(longitudes))[len(self.longitudes) - len(longitudes):]
+        self.poblacion[peores] = individuos
+        self.longitudes[peores] = longitudes
+
+    def mejor(self):
+        indice = int(self.longitudes.argmin())
+        return self.poblacion[indice], self.longitudes[indice]
+
+
+def _origen(isla, epoca, islas, topologia, semilla):
+    """
+    Isla cuyos emigrantes recibe `isla` al final de `epoca`.
+    """
+    if topologia == "anillo":
+        return (isla - 1) % islas
+    orden = np.random.default_rng((semilla, epoca)).permutation(islas)
+    posicion = np.empty(islas, dtype=np.intp)
+    posicion[orden] = np.arange(islas)
+    return int(orden[(posicion[isla] - 1) % islas])
+
+
+# ============================================
+# MEMORIA COMPARTIDA
+# ============================================
+def _secciones(n, islas, migrantes, epocas):
+    """
+    Forma y tipo de cada arreglo del bloque compartido, de mayor a menor tamaño de elemento para alinearlos.
+    """
+    return (("distancias", (n, n), np.float64),
+            ("longitudes_emigrantes", (islas, migrantes), np.float64),
+            ("historial", (epocas, islas), np.float64),
+            ("longitudes_mejores", (islas,), np.float64),
+            ("emigrantes", (islas, migrantes, n), np.int32),
+            ("mejores", (islas, n), np.int32))
+
+
+def _tamano_bloque(secciones):
+    return max(1, sum(math.prod(forma) * np.dtype(tipo).itemsize for _, forma, tipo in secciones))
+
+
+def _vistas(buffer, secciones):
+    """
+    Arreglos de NumPy sobre el bloque compartido (o cualquier buffer del tamaño de _tamano_bloque).
+    """
+    vistas, desplazamiento = {}, 0
+    for nombre, forma, tipo in secciones:
+        vistas[nombre] = np.ndarray(forma, dtype=tipo, buffer=buffer, offset=desplazamiento)
+        desplazamiento += math.prod(forma) * np.dtype(tipo).itemsize
+    return vistas
+
+
+def _ciclo_isla(isla, vistas, parametros):
+    """
+    Épocas de una isla: evolucionar, publicar emigrantes, esperar, recibir, esperar.
+    Es un generador que cede en cada punto donde todas las islas deben esperarse.
+    """
+    islas, epocas = len(vistas["mejores"]), len(vistas["historial"])
+    migrantes, intervalo, generaciones = parametros["migrantes"], parametros["intervalo"], parametros["generaciones"]
+    for epoca in range(epocas):
+        isla.evolucionar(min(intervalo, generaciones - epoca * intervalo))
+        vistas["historial"][epoca, isla.indice] = isla.longitudes.min()
+        if migrantes and epoca < epocas - 1:
+            vistas["emigrantes"][isla.indice], vistas["longitudes_emigrantes"][isla.indice] = isla.emigrantes(migrantes)
+            yield
+            origen = _origen(isla.indice, epoca, islas, parametros["topologia"], parametros["semilla"])
+            isla.recibir(vistas["emigrantes"][origen], vistas["longitudes_emigrantes"][origen])
+            yield
+    vistas["mejores"][isla.indice], vistas["longitudes_mejores"][isla.indice] = isla.mejor()
+
+
+def _crear_isla(indice, distancias, parametros):
+    isla = Isla(distancias, parametros["tamano"], np.random.default_rng((parametros["semilla"], indice)),
+                parametros["elite"], parametros["tasa_mutacion"], parametros["seleccion"])
+    isla.indice = indice
+    return isla
+
+
+def _proceso_isla(indice, nombre_bloque, secciones, parametros, barrera):
+    """
+    Punto de entrada de cada proceso: abre el bloque compartido y ejecuta su isla.
+    """
+    bloque = shared_memory.SharedMemory(name=nombre_bloque)
+    try:
+        vistas = _vistas(bloque.buf, secciones)
+        ciclo = _ciclo_isla(_crear_isla(indice, vistas["distancias"], parametros), vistas, parametros)
+        for _ in ciclo:
+            barrera.wait()
+        del vistas, ciclo  # Las vistas (también las de la isla) deben soltarse antes de cerrar el bloque
+        bloque.close()
+    except BaseException:
+        barrera.abort()  # Las demás islas reciben BrokenBarrierError en lugar de esperar para siempre
+        raise
+
+
+# ============================================
+# MODELO DE ISLAS
+# ============================================
+def algoritmo_genetico_islas(distancias, islas=None, tamano_poblacion=1000, generaciones=100, intervalo=10,
+                             tasa_migracion=0.02, elite=2, topologia="anillo", tasa_mutacion=0.2, seleccion="torneo",
+                             procesos=None, semilla=0, estadisticas=None):
+    """
+    Algoritmo genético para el problema del viajero con varias poblaciones que intercambian individuos.
+    :param distancias: Matriz de distancias n x n.
+    :param islas: Número de islas (por defecto, el número de núcleos).
+    :param tamano_poblacion: Individuos de cada isla.
+    :param generaciones: Generaciones de cada isla.
+    :param intervalo: Generaciones entre migraciones.
+    :param tasa_migracion: Fracción de la isla que emigra en cada migración (0 para islas aisladas).
+    :param elite: Individuos que pasan sin cambios en cada isla.
+    :param topologia: "anillo" o "aleatoria".
+    :param tasa_mutacion: Probabilidad de mutar a cada hijo.
+    :param seleccion: "torneo" o "ruleta".
+    :param procesos: 1 para ejecutar todas las islas en este proceso; cualquier otro valor, un proceso por isla.
+    :param semilla: Semilla base; la isla i usa np.random.default_rng((semilla, i)).
+    :param estadisticas: EstadisticasIslas opcional que se rellena durante la ejecución.
+    :return: Tupla (mejor ruta de todas las islas, su longitud).
+    """
+    if topologia not in ("anillo", "aleatoria"):
+        raise ValueError(f"Topología desconocida: {topologia!r}")
+    estadisticas = estadisticas if estadisticas is not None else EstadisticasIslas()
+    distancias = np.asarray(distancias, dtype=np.float64)
+    islas = islas or os.cpu_count() or 1
+    migrantes = 0 if islas == 1 or tasa_migracion <= 0 else \
+        min(tamano_poblacion - elite, max(1, round(tasa_migracion * tamano_poblacion)))
+    epocas = max(1, math.ceil(generaciones / intervalo))
+    parametros = {"tamano": tamano_poblacion, "generaciones": generaciones, "intervalo": intervalo,
+                  "migrantes": migrantes, "elite": elite, "topologia": topologia, "tasa_mutacion": tasa_mutacion,
+                  "seleccion": seleccion, "semilla": semilla}
+    secciones = _secciones(len(distancias), islas, migrantes, epocas)
+    t0 = time.perf_counter()
+
+    if procesos == 1:
+        vistas = _vistas(bytearray(_tamano_bloque(secciones)), secciones)
+        # Las islas avanzan por turnos: cada una hasta su siguiente punto de espera
+        ciclos = [_ciclo_isla(_crear_isla(indice, distancias, parametros), vistas, parametros) for indice in range(islas)]
+        while ciclos:
+            ciclos = [ciclo for ciclo in ciclos if next(ciclo, StopIteration) is not StopIteration]
+        resultado = _resumir(vistas, estadisticas)
+    else:
+        bloque = shared_memory.SharedMemory(create=True, size=_tamano_bloque(secciones))
+        try:
+            vistas = _vistas(bloque.buf, secciones)
+            vistas["distancias"][:] = distancias
+            barrera = Barrier(islas)
+            trabajadores = [Process(target=_proceso_isla, args=(indice, bloque.name, secciones, parametros, barrera))
+                            for indice in range(islas)]
+            for trabajador in trabajadores:
+                trabajador.start()
+            for trabajador in trabajadores:
+                trabajador.join()
+            fallidos = [indice for indice, trabajador in enumerate(trabajadores) if trabajador.exitcode != 0]
+            if fallidos:
+                raise RuntimeError(f"Las islas {fallidos} terminaron con error")
+            resultado = _resumir(vistas, estadisticas)
+            del vistas  # Las vistas deben soltarse antes de cerrar el bloque
+        finally:
+            bloque.close()
+            bloque.unlink()
+
+    estadisticas.epocas += epocas
+    estadisticas.migrantes += migrantes * islas * (epocas - 1)
+    estadisticas.individuos += islas * (tamano_poblacion + generaciones * (tamano_poblacion - elite))
+    estadisticas.segundos += time.perf_counter() - t0
+    return resultado
+
+
+def _resumir(vistas, estadisticas):
+    """
+    Une los resultados de las islas: historial por época y mejor ruta global.
+    """
+    estadisticas.historial.extend(vistas["historial"].min(axis=1).tolist())
+    mejor = int(vistas["longitudes_mejores"].argmin())
+    return vistas["mejores"][mejor].copy(), float(vistas["longitudes_mejores"][mejor])
+
+
+# ============================================
+# BENCHMARK
+# ============================================
+def benchmark(n=500, islas=None, tamano_poblacion=2000, generaciones=40, semilla=0):
+    """
+    Mide el rendimiento de las islas en procesos frente a las mismas islas en un solo proceso, y la
+    calidad frente a una única población del mismo tamaño total.
+    """
+    islas = islas or os.cpu_count() or 1
+    _, distancias = ciudades_aleatorias(n, semilla)
+    print(f"{n} ciudades, {islas} islas de {tamano_poblacion} individuos, {generaciones} generaciones "
+          f"({os.cpu_count()} núcleos)")
+    rendimiento = {}
+    for procesos, nombre in ((1, "un proceso"), (None, "un proceso por isla")):
+        estadisticas = EstadisticasIslas()
+        ruta, longitud = algoritmo_genetico_islas(distancias, islas, tamano_poblacion, generaciones, procesos=procesos,
+                                                  semilla=semilla, estadisticas=estadisticas)
+        assert sorted(ruta.tolist()) == list(range(n))
+        rendimiento[procesos] = estadisticas.individuos_por_segundo
+        print(f"  Islas en {nombre}: {longitud:.0f}, {estadisticas}")
+    print(f"  Aceleración: {rendimiento[None] / rendimiento[1]:.2f}x con {min(islas, os.cpu_count() or 1)} núcleos")
+
+    for topologia, tasa in (("aleatoria", 0.02), ("anillo", 0.0)):
+        _, longitud = algoritmo_genetico_islas(distancias, islas, tamano_poblacion, generaciones, topologia=topologia,
+                                               tasa_migracion=tasa, semilla=semilla)
+        print(f"  Topología {topologia}, migración {tasa}: {longitud:.0f}")
+    estadisticas = EstadisticasGenetico()
+    _, longitud = algoritmo_genetico_vectorizado(distancias, islas * tamano_poblacion, generaciones, semilla=semilla,
+                                                 estadisticas=estadisticas)
+    print(f"  Una población de {islas * tamano_poblacion}: {longitud:.0f}, {estadisticas}")
+
+
+if __name__ == "__main__":
+    # Ejemplo pequeño: 4 islas de 200 individuos sobre 30 ciudades
+    _, distancias = ciudades_aleatorias(30, semilla=1)
+    estadisticas = EstadisticasIslas()
+    ruta, longitud = algoritmo_genetico_islas(distancias, 4, 200, 200, estadisticas=estadisticas)
+    print(f"30 ciudades: longitud {longitud:.0f}, ruta {ruta.tolist()}, {estadisticas}")
+
+    # Más islas y generaciones: python _021_Genetico_Islas.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark(islas=max(4, os.cpu_count() or 1), generaciones=200)
+    else:
+        benchmark(islas=max(4, os.cpu_count() or 1))
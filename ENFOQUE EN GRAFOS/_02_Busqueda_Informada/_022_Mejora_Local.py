@@ -0,0 +1,368 @@
+# ============================================
+# MEJORA LOCAL 2-OPT Y OR-OPT PARA RECORRIDOS
+# ============================================
+
+# DESCRIPCIÓN TEÓRICA:
+# Los algoritmos genéticos de _009, _020 y _021 no mejoran localmente a sus individuos: cada cambio se
+# evalúa recalculando la longitud completa del recorrido. Esta etapa de mejora (algoritmo memético)
+# aplica sobre una matriz de distancias:
+# - 2-opt: quitar dos aristas (a, b) y (c, d) y poner (a, c) y (b, d), invirtiendo un tramo.
+# - Or-opt: mover un tramo de 1 a 3 ciudades entre otras dos ciudades consecutivas, en cualquier sentido.
+# Cada movimiento se evalúa en O(1) con las aristas que quita y pone. Solo se prueban las k ciudades más
+# cercanas a cada una (listas de vecinos), y el recorrido se cierra antes en cuanto la arista nueva ya es
+# más larga que la que se quita. Los bits "no mirar" guardan en una cola solo las ciudades cuyas aristas
+# cambiaron; una ciudad sin mejora sale de la cola hasta que un movimiento toca a una vecina suya.
+#
+# El recorrido es una lista con la posición de cada ciudad; invertir un tramo cuesta lo que el lado más
+# corto del ciclo. Or-opt se aplica como dos o tres intercambios 2-opt, así el sentido del recorrido no importa.
+# Con `patadas` se repite la búsqueda tras perturbaciones doble puente locales y se conserva la mejor
+# (búsqueda local iterada).
+
+import math
+import random
+import sys
+import time
+from collections import deque
+
+import numpy as np
+
+EPSILON = 1e-9  # Mejora mínima para aceptar un movimiento (evita ciclos por errores de redondeo)
+
+
+class EstadisticasMejora:
+    """
+    Contadores de la mejora local.
+    """
+    def __init__(self):
+        self.movimientos_2opt = 0
+        self.movimientos_or = 0
+        self.evaluados = 0  # Movimientos cuyo delta se calculó
+        self.patadas = 0
+        self.patadas_aceptadas = 0
+        self.segundos = 0.0
+
+    def __repr__(self):
+        return (f"EstadisticasMejora(2opt={self.movimientos_2opt}, or_opt={self.movimientos_or}, "
+                f"evaluados={self.evaluados}, patadas={self.patadas_aceptadas}/{self.patadas}, "
+                f"segundos={self.segundos:.2f})")
+
+
+class MejoraLocal:
+    """
+    Búsqueda local 2-opt + Or-opt con listas de vecinos y bits "no mirar".
+    """
+    def __init__(self, distancias, k=10, or_opt=True, max_tramo=3):
+        """
+        :param distancias: Matriz de distancias simétrica n x n (arreglo de NumPy o lista de listas).
+        :param k: Vecinos más cercanos considerados por ciudad.
+        :param or_opt: Si es False solo se aplican movimientos 2-opt.
+        :param max_tramo: Longitud máxima de los tramos que mueve Or-opt.
+        """
+        matriz = np.asarray(distancias, dtype=np.float64)
+        self.n = len(matriz)
+        self.distancias = matriz.tolist()  # Acceso escalar a listas: mucho más rápido que a un arreglo
+        k = min(k, self.n - 1)
+        cercanas = np.argpartition(matriz + np.diag(np.full(self.n, np.inf)), k - 1, axis=1)[:, :k] if k > 0 \
+            else np.empty((self.n, 0), dtype=np.intp)
+        self.vecinos = []
+        for a, fila in enumerate(cercanas.tolist()):
+            self.vecinos.append(sorted(((c, self.distancias[a][c]) for c in fila), key=lambda par: par[1]))
+        self.or_opt, self.max_tramo = or_opt, max_tramo
+
+    def longitud(self, recorrido):
+        distancias = self.distancias
+        return sum(distancias[recorrido[i - 1]][recorrido[i]] for i in range(len(recorrido)))
+
+    def mejorar(self, recorrido, patadas=0, segundos=None, semilla=0, estadisticas=None):
+        """
+        Lleva un recorrido a un óptimo local 2-opt / Or-opt.
+        :param recorrido: Secuencia de índices de ciudad (lista o fila de NumPy).
+        :param patadas: Perturbaciones doble puente tras el primer óptimo local (búsqueda local iterada).
+        :param segundos: Límite de tiempo para las patadas (None: sin límite).
+        :param semilla: Semilla de las perturbaciones.
+        :param estadisticas: EstadisticasMejora opcional que se rellena durante la mejora.
+        :return: Tupla (recorrido mejorado como lista, su longitud).
+        """
+        estadisticas = estadisticas if estadisticas is not None else EstadisticasMejora()
+        t0 = time.perf_counter()
+        recorrido = [int(ciudad) for ciudad in recorrido]
+        n = len(recorrido)
+        if n < 5:
+            return recorrido, self.longitud(recorrido)
+        posicion = [0] * n
+        for i, ciudad in enumerate(recorrido):
+            posicion[ciudad] = i
+        longitud = self.longitud(recorrido)
+        longitud += self._busqueda_local(recorrido, posicion, deque(recorrido), [True] * n, estadisticas)
+
+        generador = random.Random(semilla)
+        mejor, mejor_longitud = recorrido[:], longitud
+        for _ in range(patadas):
+            if segundos is not None and time.perf_counter() - t0 > segundos:
+                break
+            estadisticas.patadas += 1
+            delta, extremos = self._doble_puente(recorrido, posicion, generador)
+            activa = [False] * n
+            for ciudad in extremos:
+                activa[ciudad] = True
+            longitud += delta + self._busqueda_local(recorrido, posicion, deque(extremos), activa, estadisticas)
+            if longitud < mejor_longitud - EPSILON:
+                estadisticas.patadas_aceptadas += 1
+                mejor[:], mejor_longitud = recorrido, longitud
+            else:  # Se vuelve al mejor recorrido
+                recorrido[:], longitud = mejor, mejor_longitud
+                for i, ciudad in enumerate(recorrido):
+                    posicion[ciudad] = i
+
+        estadisticas.segundos += time.perf_counter() - t0
+        return mejor, self.longitud(mejor)  # Se recalcula para no arrastrar errores de redondeo
+
+    def mejorar_poblacion(self, poblacion, longitudes, filas):
+        """
+        Mejora en el sitio las filas indicadas de una población de _020 y actualiza sus longitudes.
+        """
+        for fila in filas:
+            recorrido, longitud = self.mejorar(poblacion[fila])
+            poblacion[fila] = recorrido
+            longitudes[fila] = longitud
+
+    def _busqueda_local(self, recorrido, posicion, cola, activa, estadisticas):
+        """
+        Aplica movimientos de mejora desde las ciudades de la cola hasta vaciarla.
+        :return: Cambio total de longitud (negativo).
+        """
+        distancias, vecinos, n = self.distancias, self.vecinos, len(recorrido)
+        or_opt, max_tramo = self.or_opt and n >= self.max_tramo + 4, self.max_tramo
+
+        def invertir(i, j):
+            # Invierte las posiciones i..j (cíclicas), o su complemento si es más corto: es el mismo ciclo
+            largo = (j - i) % n + 1
+            if 2 * largo > n:
+                i, j, largo = (j + 1) % n, (i - 1) % n, n - largo
+            for _ in range(largo // 2):
+                ci, cj = recorrido[i], recorrido[j]
+                recorrido[i], recorrido[j] = cj, ci
+                posicion[cj], posicion[ci] = i, j
+                i = i + 1 if i + 1 < n else 0
+                j = j - 1 if j > 0 else n - 1
+
+        def intercambio(x, y, u, w):
+            # Quita (x, y) y (u, w), pone (x, u) y (y, w); y sigue a x en el mismo sentido en que w sigue a u
+            i = posicion[x] + 1
+            if recorrido[i if i < n else 0] == y:
+                invertir(posicion[y], posicion[u])
+            else:
+                invertir(posicion[u], posicion[y])
+
+        def siguiente(ciudad, adelante):
+            i = posicion[ciudad] + 1 if adelante else posicion[ciudad] - 1
+            return recorrido[i if i < n else 0]  # recorrido[-1] es la última ciudad
+
+        cambio = 0.0
+        evaluados = 0
+        while cola:
+            a = cola.popleft()
+            activa[a] = False
+            tocadas = None
+            # 2-opt en los dos sentidos: b y d siguen a a y c
+            for adelante in (True, False):
+                b = siguiente(a, adelante)
+                d_ab = distancias[a][b]
+                fila_b = distancias[b]
+                for c, d_ac in vecinos[a]:
+                    if d_ac >= d_ab:
+                        break
+                    d = siguiente(c, adelante)
+                    if c == b or d == a:
+                        continue
+                    evaluados += 1
+                    delta = d_ac + fila_b[d] - d_ab - distancias[c][d]
+                    if delta < -EPSILON:
+                        intercambio(a, b, c, d)
+                        cambio += delta
+                        estadisticas.movimientos_2opt += 1
+                        tocadas = (a, b, c, d)
+                        break
+                if tocadas:
+                    break
+
+            # Or-opt: el tramo a..e (en el sentido elegido) pasa de entre p y nx a entre c1 y c2
+            if not tocadas and or_opt:
+                for adelante in (True, False):
+                    p = siguiente(a, not adelante)
+                    tramo, e = [a], a
+                    for largo in range(1, max_tramo + 1):
+                        if largo > 1:
+                            e = siguiente(e, adelante)
+                            tramo.append(e)
+                        nx = siguiente(e, adelante)
+                        if nx == p:
+                            break
+                        ganancia = distancias[p][a] + distancias[e][nx] - distancias[p][nx]
+                        if ganancia <= EPSILON:
+                            continue
+                        for c, d_ac in vecinos[a]:
+                            if d_ac >= ganancia:
+                                break
+                            if c in tramo:
+                                continue
+                            for c1, c2 in ((c, siguiente(c, adelante)), (siguiente(c, not adelante), c)):
+                                if c2 == p or c1 == nx or c1 in tramo or c2 in tramo:
+                                    continue
+                                evaluados += 1
+                                invertido = distancias[c1][e] + distancias[a][c2]
+                                directo = distancias[c1][a] + distancias[e][c2]
+                                delta = min(invertido, directo) - distancias[c1][c2] - ganancia
+                                if delta < -EPSILON:
+                                    intercambio(p, a, c1, c2)  # p c1 ... nx e..a c2
+                                    intercambio(p, c1, nx, e)  # p nx ... c1 e..a c2
+                                    if directo < invertido and largo > 1:
+                                        intercambio(c1, e, a, c2)  # c1 a..e c2
+                                    cambio += delta
+                                    estadisticas.movimientos_or += 1
+                                    tocadas = (p, a, e, nx, c1, c2)
+                                    break
+                            if tocadas:
+                                break
+                        if tocadas:
+                            break
+                    if tocadas:
+                        break
+
+            if tocadas:
+                for ciudad in tocadas:
+                    if not activa[ciudad]:
+                        activa[ciudad] = True
+                        cola.append(ciudad)
+        estadisticas.evaluados += evaluados
+        return cambio
+
+    def _doble_puente(self, recorrido, posicion, generador, ventana=50):
+        """
+        Perturbación doble puente A B C D -> A C B D con los tres cortes dentro de una ventana local.
+        :return: Tupla (cambio de longitud, ciudades en los extremos de las aristas nuevas).
+        """
+        n, distancias = len(recorrido), self.distancias
+        ventana = min(n, ventana)
+        inicio = generador.randrange(n - ventana + 1)
+        i, j, k = (inicio + corte for corte in sorted(generador.sample(range(1, ventana), 3)))
+        extremos = (recorrido[i - 1], recorrido[i], recorrido[j - 1], recorrido[j], recorrido[k - 1], recorrido[k % n])
+        a1, b0, b1, c0, c1, d0 = extremos
+        delta = (distancias[a1][c0] + distancias[c1][b0] + distancias[b1][d0]
+                 - distancias[a1][b0] - distancias[b1][c0] - distancias[c1][d0])
+        recorrido[i:k] = recorrido[j:k] + recorrido[i:j]
+        for indice in range(i, k):
+            posicion[recorrido[indice]] = indice
+        return delta, extremos
+
+
+def vecino_mas_cercano(distancias, inicio=0):
+    """
+    Recorrido del vecino más cercano sobre una matriz de NumPy, en O(n²).
+    """
+    distancias = np.asarray(distancias, dtype=np.float64)
+    n = len(distancias)
+    visitada = np.zeros(n, dtype=bool)
+    recorrido = [inicio]
+    visitada[inicio] = True
+    for _ in range(n - 1):
+        fila = np.where(visitada, np.inf, distancias[recorrido[-1]])
+        siguiente = int(fila.argmin())
+        visitada[siguiente] = True
+        recorrido.append(siguiente)
+    return recorrido
+
+
+# ============================================
+# BENCHMARK
+# ============================================
+def cota_held_karp(distancias, iteraciones=300, cota_superior=None):
+    """
+    Cota inferior de Held y Karp: máximo por subgradiente del 1-árbol con penalizaciones por nodo.
+    :param cota_superior: Longitud de un recorrido conocido, para el tamaño de paso.
+    """
+    distancias = np.asarray(distancias, dtype=np.float64)
+    n = len(distancias)
+    penalizacion = np.zeros(n)
+    mejor, paso = -math.inf, 2.0
+    cota_superior = cota_superior if cota_superior is not None else float(distancias.sum(axis=1).max())
+    for iteracion in range(iteraciones):
+        modificada = distancias + penalizacion[:, None] + penalizacion[None, :]
+        # Árbol de expansión mínima de los nodos 1..n-1 (Prim en O(n²)) más las dos aristas más baratas del nodo 0
+        grado = np.zeros(n, dtype=np.int64)
+        en_arbol = np.zeros(n, dtype=bool)
+        en_arbol[0] = en_arbol[1] = True
+        costo_min, padre = modificada[1].copy(), np.ones(n, dtype=np.intp)
+        costo_min[en_arbol] = np.inf
+        peso = 0.0
+        for _ in range(n - 2):
+            v = int(costo_min.argmin())
+            peso += costo_min[v]
+            grado[v] += 1
+            grado[padre[v]] += 1
+            en_arbol[v] = True
+            costo_min[v] = np.inf
+            mas_barato = ~en_arbol & (modificada[v] < costo_min)
+            costo_min[mas_barato] = modificada[v][mas_barato]
+            padre[mas_barato] = v
+        dos = np.argpartition(modificada[0, 1:], 1)[:2] + 1
+        peso += modificada[0, dos].sum()
+        grado[0] = 2
+        grado[dos] += 1
+        valor = peso - 2 * penalizacion.sum()
+        if valor > mejor + EPSILON:
+            mejor = valor
+        elif iteracion % 20 == 19:
+            paso /= 2
+        subgradiente = grado - 2
+        norma = float((subgradiente ** 2).sum())
+        if norma == 0:
+            break  # El 1-árbol es un recorrido: la cota es exacta
+        penalizacion += paso * (cota_superior - valor) / norma * subgradiente
+    return mejor
+
+
+def benchmark(n=1000, segundos=10.0, semilla=0):
+    """
+    Mejora desde un recorrido aleatorio y desde el del vecino más cercano en n ciudades uniformes;
+    compara con la cota de Held y Karp.
+    """
+    from _020_Genetico_Vectorizado import ciudades_aleatorias
+
+    _, distancias = ciudades_aleatorias(n, semilla)
+    t0 = time.perf_counter()
+    mejora = MejoraLocal(distancias)
+    print(f"{n} ciudades uniformes (listas de vecinos en {time.perf_counter() - t0:.2f} s)")
+    inicial = vecino_mas_cercano(distancias)
+    resultados = []
+    for nombre, recorrido, argumentos in (
+            ("aleatorio, solo 2-opt", np.random.default_rng(semilla).permutation(n), {}),
+            ("aleatorio", np.random.default_rng(semilla).permutation(n), {}),
+            ("vecino más cercano", inicial, {}),
+            (f"vecino más cercano + {segundos:.0f} s de patadas", inicial, {"patadas": 10 ** 6, "segundos": segundos})):
+        local = MejoraLocal(distancias, or_opt=False) if "2-opt" in nombre else mejora
+        estadisticas = EstadisticasMejora()
+        antes = local.longitud(recorrido)
+        mejorado, longitud = local.mejorar(recorrido, estadisticas=estadisticas, semilla=semilla, **argumentos)
+        assert sorted(mejorado) == list(range(n))
+        resultados.append((nombre, antes, longitud, estadisticas))
+    cota = cota_held_karp(distancias, cota_superior=min(resultado[2] for resultado in resultados))
+    print(f"  Cota de Held y Karp: {cota:.0f}")
+    for nombre, antes, longitud, estadisticas in resultados:
+        print(f"  Desde {nombre}: {antes:.0f} -> {longitud:.0f} ({100 * (longitud / cota - 1):.1f} % sobre la cota) "
+              f"en {estadisticas.segundos:.2f} s, {estadisticas}")
+
+
+if __name__ == "__main__":
+    # Ejemplo pequeño: 200 ciudades, recorrido aleatorio
+    from _020_Genetico_Vectorizado import ciudades_aleatorias
+
+    _, distancias = ciudades_aleatorias(200, semilla=1)
+    mejora = MejoraLocal(distancias)
+    recorrido = list(range(200))
+    estadisticas = EstadisticasMejora()
+    mejorado, longitud = mejora.mejorar(recorrido, estadisticas=estadisticas)
+    print(f"200 ciudades: {mejora.longitud(recorrido):.0f} -> {longitud:.0f}, {estadisticas}")
+
+    # 60 s de patadas: python _022_Mejora_Local.py --benchmark
+    benchmark(segundos=60.0 if "--benchmark" in sys.argv else 10.0)
@@ -0,0 +1,341 @@
+# ============================================
+# BÚSQUEDA EN TIEMPO REAL (LRTA* / RTAA*) CON HEURÍSTICA APRENDIDA
+# ============================================
+
+# DESCRIPCIÓN TEÓRICA:
+# busqueda_online de _010_Busqueda_Online.py siempre se mueve al vecino más barato: en cuanto el grafo
+# tiene un ciclo da vueltas para siempre, y no aprende nada de un viaje al siguiente. Un agente de
+# búsqueda en tiempo real planifica con un presupuesto fijo por paso y corrige su heurística al moverse:
+# - LRTA* (anticipación 1): desde el estado actual s mira sus vecinos, actualiza
+#       h(s) = min(c(s, s') + h(s'))
+#   y se mueve al vecino que da ese mínimo. Como h(s) sube cada vez que pasa por un mínimo local, el
+#   agente acaba saliendo de cualquier ciclo.
+# - RTAA* (anticipación k): ejecuta un A* desde s limitado a k expansiones. Sea s' el estado de la
+#   frontera con menor f = g + h; cada estado expandido x aprende h(x) = f(s') - g(x) y el agente se mueve
+#   por el camino hasta s'. Con k = 1 coincide con LRTA*.
+# Las actualizaciones solo aumentan h y, si la heurística inicial es admisible, la tabla sigue siéndolo
+# (el A* limitado reabre los estados cerrados cuyo g mejora; sin eso, una h admisible pero inconsistente
+# con anticipación k > 1 puede dejar valores que sobreestiman);
+# por eso, al repetir el viaje entre los mismos puntos, el costo converge al óptimo.
+#
+# La tabla aprendida pertenece a un objetivo y se guarda en disco (pickle, escrito en un archivo temporal
+# y renombrado) para que cada viaje continúe donde terminó el anterior. El costo de un paso depende solo
+# de la anticipación k (O(k log k)), no del tamaño del mapa.
+
+import heapq
+import math
+import os
+import pickle
+import random
+import sys
+import tempfile
+import time
+from itertools import count
+
+from _011_Motor_A_Estrella import a_estrella, mapa_cuadricula, sucesores_cuadricula
+
+_FORMATO = "LRTA1"
+
+
+class TablaHeuristica:
+    """
+    Heurística aprendida: valores corregidos por estado sobre una heurística base admisible.
+    """
+    def __init__(self, heuristica_base, objetivo=None):
+        """
+        :param heuristica_base: Función con la estimación inicial (por ejemplo, la distancia Manhattan).
+        :param objetivo: Identificador del objetivo al que pertenecen los valores (se comprueba al cargar).
+        """
+        self.heuristica_base = heuristica_base
+        self.objetivo = objetivo
+        self.valores = {}
+
+    def __call__(self, estado):
+        valor = self.valores.get(estado)
+        return valor if valor is not None else self.heuristica_base(estado)
+
+    def actualizar(self, estado, valor):
+        """
+        Sube h(estado) a valor si es mayor que la estimación actual.
+        :return: True si la tabla cambió.
+        """
+        if valor > self(estado):
+            self.valores[estado] = valor
+            return True
+        return False
+
+    def __len__(self):
+        return len(self.valores)
+
+    def guardar(self, ruta):
+        """
+        Escribe la tabla en un archivo temporal y lo renombra: un lector nunca ve un archivo a medias.
+        """
+        directorio = os.path.dirname(os.path.abspath(ruta))
+        descriptor, temporal = tempfile.mkstemp(dir=directorio, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as archivo:
+                pickle.dump({"formato": _FORMATO, "objetivo": self.objetivo, "valores": self.valores}, archivo,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(temporal, ruta)
+        except BaseException:
+            os.unlink(temporal)
+            raise
+
+    @classmethod
+    def cargar(cls, ruta, heuristica_base, objetivo=None):
+        """
+        Lee una tabla guardada; si el archivo no existe, devuelve una tabla vacía.
+        :raises ValueError: Si el archivo no es una tabla o pertenece a otro objetivo.
+        """
+        tabla = cls(heuristica_base, objetivo)
+        if not os.path.exists(ruta):
+            return tabla
+        with open(ruta, "rb") as archivo:
+            datos = pickle.load(archivo)
+        if not isinstance(datos, dict) or datos.get("formato") != _FORMATO:
+            raise ValueError(f"{ruta} no contiene una tabla heurística")
+        if datos["objetivo"] != objetivo:
+            raise ValueError(f"{ruta} pertenece al objetivo {datos['objetivo']!r}, no a {objetivo!r}")
+        tabla.valores = datos["valores"]
+        return tabla
+
+
+class EstadisticasLRTA:
+    """
+    Contadores de un viaje del agente.
+    """
+    def __init__(self):
+        self.pasos = 0  # Planificaciones (una por paso de decisión)
+        self.movimientos = 0
+        self.expansiones = 0
+        self.actualizaciones = 0  # Valores de h que subieron
+        self.max_segundos_paso = 0.0
+        self.segundos = 0.0
+
+    @property
+    def segundos_por_paso(self):
+        return self.segundos / self.pasos if self.pasos else 0.0
+
+    def __repr__(self):
+        return (f"EstadisticasLRTA(pasos={self.pasos}, movimientos={self.movimientos}, expansiones={self.expansiones}, "
+                f"actualizaciones={self.actualizaciones}, us_por_paso={self.segundos_por_paso * 1e6:.1f}, "
+                f"max_us_paso={self.max_segundos_paso * 1e6:.1f})")
+
+
+# ============================================
+# AGENTE EN TIEMPO REAL
+# ============================================
+def _planificar(sucesores, inicio, es_objetivo, tabla, anticipacion, estadisticas):
+    """
+    A* limitado a `anticipacion` expansiones desde inicio, con la actualización de RTAA*. Los estados
+    cerrados se reabren si su g mejora, de modo que la tabla sigue siendo admisible aunque h no sea consistente.
+    :return: Camino de inicio al estado elegido de la frontera (sin incluir inicio), o None si no hay salida.
+    """
+    contador = count()
+    h = tabla(inicio)
+    frontera = [(h, h, next(contador), 0, inicio)]
+    mejor_g, padre = {inicio: 0}, {inicio: None}
+    cerrados = set()
+    expansiones = 0
+    elegido = None
+    while frontera:
+        f, h, _, g, estado = frontera[0]
+        if estado in cerrados or g > mejor_g[estado]:  # Entrada obsoleta
+            heapq.heappop(frontera)
+            continue
+        if (es_objetivo(estado) and estado != inicio) or expansiones == anticipacion:
+            elegido = (f, estado)
+            break
+        heapq.heappop(frontera)
+        cerrados.add(estado)
+        expansiones += 1
+        for vecino, costo in sucesores(estado):
+            g_vecino = g + costo
+            if g_vecino >= mejor_g.get(vecino, math.inf):
+                continue
+            # Con h inconsistente un estado cerrado puede mejorar: se reabre para que la actualización
+            # f(s') - g(x) de los cerrados se calcule con g ya propagados y no sobreestime
+            cerrados.discard(vecino)
+            mejor_g[vecino], padre[vecino] = g_vecino, estado
+            h = tabla(vecino)
+            heapq.heappush(frontera, (g_vecino + h, h, next(contador), g_vecino, vecino))
+    estadisticas.expansiones += expansiones
+
+    f = elegido[0] if elegido is not None else math.inf  # Sin frontera: ningún expandido alcanza el objetivo
+    for estado in cerrados:
+        if tabla.actualizar(estado, f - mejor_g[estado]):
+            estadisticas.actualizaciones += 1
+    if elegido is None:
+        return None
+    camino, estado = [], elegido[1]
+    while estado != inicio:
+        camino.append(estado)
+        estado = padre[estado]
+    return camino[::-1]
+
+
+def lrta_estrella(sucesores, inicio, es_objetivo, tabla, anticipacion=1, max_movimientos=10 ** 6, estadisticas=None):
+    """
+    Un viaje del agente LRTA* / RTAA* desde inicio hasta un objetivo, aprendiendo sobre la tabla.
+    :param sucesores: Función que recibe un estado y devuelve pares (vecino, costo).
+    :param inicio: Estado inicial.
+    :param es_objetivo: Función que indica si un estado es objetivo.
+    :param tabla: TablaHeuristica del objetivo (se actualiza durante el viaje).
+    :param anticipacion: Expansiones por paso (1: LRTA*; k > 1: RTAA* con k expansiones).
+    :param max_movimientos: Límite de movimientos del viaje.
+    :param estadisticas: EstadisticasLRTA opcional que se rellena durante el viaje.
+    :return: Tupla (costo, camino recorrido) o None si el objetivo no es alcanzable o se agota el límite.
+    """
+    estadisticas = estadisticas if estadisticas is not None else EstadisticasLRTA()
+    costos = {}  # Costo de las aristas recorridas, para sumar el costo del viaje
+
+    def sucesores_registrados(estado):
+        for vecino, costo in sucesores(estado):
+            costos[estado, vecino] = costo
+            yield vecino, costo
+
+    actual, camino, costo_total = inicio, [inicio], 0
+    while not es_objetivo(actual):
+        if estadisticas.movimientos >= max_movimientos:
+            return None
+        t0 = time.perf_counter()
+        tramo = _planificar(sucesores_registrados, actual, es_objetivo, tabla, anticipacion, estadisticas)
+        transcurrido = time.perf_counter() - t0
+        estadisticas.pasos += 1
+        estadisticas.segundos += transcurrido
+        estadisticas.max_segundos_paso = max(estadisticas.max_segundos_paso, transcurrido)
+        if tramo is None:
+            return None
+        for estado in tramo:
+            costo_total += costos[actual, estado]
+            actual = estado
+            camino.append(estado)
+        estadisticas.movimientos += len(tramo)
+        costos.clear()
+    return costo_total, camino
+
+
+def viajes_repetidos(sucesores, inicio, es_objetivo, tabla, viajes, anticipacion=1, ruta=None):
+    """
+    Repite el viaje con la misma tabla hasta que un viaje no cambia ningún valor (el costo ya es estable).
+    :param ruta: Archivo opcional donde se guarda la tabla tras cada viaje.
+    :return: Lista de tuplas (costo, EstadisticasLRTA) por viaje.
+    """
+    resultados = []
+    for _ in range(viajes):
+        estadisticas = EstadisticasLRTA()
+        resultado = lrta_estrella(sucesores, inicio, es_objetivo, tabla, anticipacion, estadisticas=estadisticas)
+        if ruta is not None:
+            tabla.guardar(ruta)
+        resultados.append((resultado[0] if resultado else None, estadisticas))
+        if resultado is None or estadisticas.actualizaciones == 0:
+            break
+    return resultados
+
+
+# ============================================
+# COMPROBACIÓN CON HEURÍSTICAS INCONSISTENTES
+# ============================================
+def comprobar_admisibilidad(grafos=300, anticipaciones=(1, 2, 4, 8), semilla=0):
+    """
+    Grafos no dirigidos al azar con h admisible pero inconsistente (valores al azar en [0, distancia real]):
+    tras los viajes repetidos la tabla no debe sobreestimar y el último viaje debe costar el óptimo.
+    :return: Número de casos comprobados.
+    """
+    generador = random.Random(semilla)
+    casos = 0
+    for _ in range(grafos):
+        n = generador.randint(4, 12)
+        grafo = {nodo: {} for nodo in range(n)}
+        aristas = [(nodo, generador.randrange(nodo)) for nodo in range(1, n)]  # Árbol: el grafo es conexo
+        aristas += [tuple(generador.sample(range(n), 2)) for _ in range(n)]
+        for a, b in aristas:
+            grafo[a][b] = grafo[b][a] = generador.randint(1, 5)
+        objetivo = n - 1
+        distancia = {objetivo: 0}  # Distancias reales al objetivo (Dijkstra; el grafo es simétrico)
+        pendientes = [(0, objetivo)]
+        while pendientes:
+            d, nodo = heapq.heappop(pendientes)
+            if d > distancia[nodo]:
+                continue
+            for vecino, costo in grafo[nodo].items():
+                if d + costo < distancia.get(vecino, math.inf):
+                    distancia[vecino] = d + costo
+                    heapq.heappush(pendientes, (d + costo, vecino))
+        base = {nodo: generador.uniform(0, distancia[nodo]) for nodo in grafo}
+        for anticipacion in anticipaciones:
+            tabla = TablaHeuristica(base.__getitem__, objetivo)
+            viajes = viajes_repetidos(lambda nodo: grafo[nodo].items(), 0, lambda nodo: nodo == objetivo, tabla,
+                                      200, anticipacion)
+            assert all(tabla(nodo) <= distancia[nodo] + 1e-9 for nodo in grafo), "La tabla sobreestima"
+            assert math.isclose(viajes[-1][0], distancia[0]), f"Costo final {viajes[-1][0]}, óptimo {distancia[0]}"
+            casos += 1
+    return casos
+
+
+# ============================================
+# BENCHMARK EN MAPAS DE CUADRÍCULA
+# ============================================
+def _manhattan(ancho, alto, objetivo):
+    fila_objetivo, columna_objetivo = divmod(objetivo, ancho)
+    return lambda celda: abs(celda // ancho - fila_objetivo) + abs(celda % ancho - columna_objetivo)
+
+
+def benchmark(lados=(100, 300), anticipaciones=(1, 16, 64), lado_convergencia=40, semilla=0):
+    """
+    Latencia por paso en mapas de distinto tamaño y convergencia de viajes repetidos con la tabla en disco.
+    """
+    for lado in lados:
+        mapa = mapa_cuadricula(lado, lado, 0.25, semilla)
+        sucesores, objetivo = sucesores_cuadricula(mapa, lado, lado), lado * lado - 1
+        optimo = a_estrella(sucesores, 0, lambda c: c == objetivo, _manhattan(lado, lado, objetivo))
+        print(f"Mapa {lado}x{lado} (costo óptimo {optimo.g if optimo else None}):")
+        for anticipacion in anticipaciones:
+            estadisticas = EstadisticasLRTA()
+            tabla = TablaHeuristica(_manhattan(lado, lado, objetivo), objetivo)
+            resultado = lrta_estrella(sucesores, 0, lambda c: c == objetivo, tabla, anticipacion,
+                                      estadisticas=estadisticas)
+            print(f"  Anticipación {anticipacion}: primer viaje de costo {resultado[0] if resultado else None}, "
+                  f"{len(tabla)} valores aprendidos, {estadisticas}")
+
+    lado = lado_convergencia
+    mapa = mapa_cuadricula(lado, lado, 0.25, semilla)
+    sucesores, objetivo = sucesores_cuadricula(mapa, lado, lado), lado * lado - 1
+    optimo = a_estrella(sucesores, 0, lambda c: c == objetivo, _manhattan(lado, lado, objetivo))
+    print(f"Viajes repetidos en {lado}x{lado} (costo óptimo {optimo.g}), tabla guardada tras cada viaje:")
+    with tempfile.TemporaryDirectory() as directorio:
+        ruta = os.path.join(directorio, "tabla.lrta")
+        for anticipacion in (1, 16):
+            if os.path.exists(ruta):
+                os.remove(ruta)
+            costos, viajes = [], 0
+            while viajes < 500:
+                # Cada viaje arranca de la tabla en disco, como lo haría un proceso nuevo
+                tabla = TablaHeuristica.cargar(ruta, _manhattan(lado, lado, objetivo), objetivo)
+                costo, estadisticas = viajes_repetidos(sucesores, 0, lambda c: c == objetivo, tabla, 1,
+                                                       anticipacion, ruta)[0]
+                costos.append(costo)
+                viajes += 1
+                if estadisticas.actualizaciones == 0:
+                    break
+            print(f"  Anticipación {anticipacion}: {viajes} viajes hasta estabilizarse, costos "
+                  f"{costos[:5]} ... {costos[-3:]} (óptimo {optimo.g})")
+
+
+if __name__ == "__main__":
+    # Grafo con un ciclo de costos bajos (Madrid <-> París) en el que busqueda_online de _010 se queda atrapada
+    grafo = {"Madrid": {"París": 1, "Lisboa": 600}, "París": {"Madrid": 1, "Berlín": 1050},
+             "Lisboa": {"Atenas": 2800}, "Berlín": {"Atenas": 1800}, "Atenas": {}}
+    heuristica = {"Madrid": 0, "París": 0, "Lisboa": 0, "Berlín": 0, "Atenas": 0}
+    sucesores = lambda nodo: grafo[nodo].items()
+    tabla = TablaHeuristica(heuristica.__getitem__, "Atenas")
+    for costo, estadisticas in viajes_repetidos(sucesores, "Madrid", lambda nodo: nodo == "Atenas", tabla, 20):
+        print(f"Viaje de costo {costo}: {estadisticas}")
+    print(f"Heurísticas admisibles e inconsistentes: {comprobar_admisibilidad()} casos sin sobreestimar")
+
+    # Mapas de 1000x1000: python _023_LRTA_Estrella.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark(lados=(100, 300, 1000))
+    else:
+        benchmark()
@@ -0,0 +1,291 @@
+# ============================================
+# D* LITE: REPLANIFICACIÓN INCREMENTAL CUANDO CAMBIAN LOS COSTOS
+# ============================================
+
+# DESCRIPCIÓN TEÓRICA:
+# Cuando cambia el costo de una arista (tráfico, un pasillo bloqueado), ucs o A* vuelven a buscar desde
+# cero aunque casi todo el árbol de búsqueda anterior siga siendo válido. D* Lite (Koenig y Likhachev)
+# busca hacia atrás, desde el objetivo, y conserva entre llamadas dos valores por nodo:
+# - g(s): distancia de s al objetivo calculada en la última expansión de s.
+# - rhs(s) = min(c(s, s') + g(s')) sobre los sucesores s': el valor que g(s) debería tener ahora.
+# Un nodo con g(s) != rhs(s) es "inconsistente" y es el único que entra en la cola de prioridad, con
+# clave [min(g, rhs) + h(inicio, s) + km, min(g, rhs)]. Al cambiar el costo de (u, v) solo se recalcula
+# rhs(u); la búsqueda expande únicamente los nodos inconsistentes que pueden afectar al camino desde el
+# inicio, en lugar de todo el grafo.
+# - km acumula h(inicio anterior, inicio nuevo) cuando el robot se mueve, para no reordenar la cola.
+# - La cola usa eliminación perezosa: cada nodo guarda su clave vigente y las entradas viejas se descartan.
+#
+# CARACTERÍSTICAS:
+# - Trabaja sobre el formato de _002_busqueda_en_anchura_con_costo_uniforme.py: {nodo: [(vecino, costo)]}.
+# - Con la heurística h = 0 (por defecto) es un Dijkstra incremental; con una heurística consistente
+#   expande además solo hacia el inicio.
+# - Un costo math.inf (o quitar_arista) bloquea la arista.
+# - Replanificar es barato cuando los cambios están cerca del inicio (lo que ve un robot a su alrededor):
+#   afectan a pocas ramas del árbol que cuelga del objetivo. Muchos cambios repartidos por todo el camino
+#   invalidan gran parte del árbol y pueden costar más que ucs desde cero (ver benchmark).
+
+import heapq
+import itertools
+import math
+import os
+import random
+import sys
+import time
+
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "_01_Busqueda_no_informada"))
+
+from _002_busqueda_en_anchura_con_costo_uniforme import ucs
+from _008_grafo_csr import grafo_malla
+from _011_Motor_A_Estrella import EstadisticasAEstrella, buscar_camino
+
+
+class EstadisticasDStarLite:
+    """
+    Contadores acumulados de un planificador D* Lite.
+    """
+    def __init__(self):
+        self.planificaciones = 0
+        self.expansiones = 0
+        self.actualizaciones = 0  # Llamadas a _actualizar_nodo (recálculos de rhs)
+        self.aristas_cambiadas = 0
+
+    def __repr__(self):
+        return (f"EstadisticasDStarLite(planificaciones={self.planificaciones}, expansiones={self.expansiones}, "
+                f"actualizaciones={self.actualizaciones}, aristas_cambiadas={self.aristas_cambiadas})")
+
+
+class DStarLite:
+    """
+    Planificador incremental entre un inicio (que puede moverse) y un objetivo fijo.
+    """
+    def __init__(self, grafo, inicio, objetivo, heuristica=None, estadisticas=None):
+        """
+        :param grafo: Diccionario {nodo: [(vecino, costo)]} (se copia; los cambios se avisan con cambiar_costo).
+        :param inicio: Nodo inicial.
+        :param objetivo: Nodo objetivo.
+        :param heuristica: Función h(a, b) consistente que estima el costo de a a b (None para h = 0).
+        :param estadisticas: EstadisticasDStarLite opcional que se rellena en cada llamada.
+        """
+        self.sucesores, self.predecesores = {}, {}
+        for nodo, vecinos in grafo.items():
+            self.sucesores.setdefault(nodo, {})
+            self.predecesores.setdefault(nodo, {})
+            for vecino, costo in vecinos:
+                self.sucesores[nodo][vecino] = costo
+                self.sucesores.setdefault(vecino, {})
+                self.predecesores.setdefault(vecino, {})[nodo] = costo
+        self.inicio, self.objetivo = inicio, objetivo
+        self.heuristica = heuristica if heuristica is not None else (lambda a, b: 0)
+        self.estadisticas = estadisticas if estadisticas is not None else EstadisticasDStarLite()
+        self.g, self.rhs = {}, {objetivo: 0}
+        self.km = 0
+        self.cola, self.clave_vigente = [], {}  # Montículo con eliminación perezosa
+        self._insertar(objetivo)
+
+    def _clave(self, nodo):
+        g, rhs = self.g.get(nodo, math.inf), self.rhs.get(nodo, math.inf)
+        minimo = g if g < rhs else rhs
+        return minimo + self.heuristica(self.inicio, nodo) + self.km, minimo
+
+    def _insertar(self, nodo):
+        clave = self._clave(nodo)
+        self.clave_vigente[nodo] = clave
+        heapq.heappush(self.cola, (clave, nodo))
+
+    def _tope(self):
+        """
+        Primera entrada vigente de la cola (descarta las obsoletas), o None.
+        """
+        cola, vigente = self.cola, self.clave_vigente
+        while cola:
+            clave, nodo = cola[0]
+            if vigente.get(nodo) == clave:
+                return clave, nodo
+            heapq.heappop(cola)
+        return None
+
+    def _actualizar_nodo(self, nodo):
+        self.estadisticas.actualizaciones += 1
+        g, rhs = self.g, self.rhs
+        if nodo != self.objetivo:
+            minimo = math.inf
+            for sucesor, costo in self.sucesores[nodo].items():
+                valor = costo + g.get(sucesor, math.inf)
+                if valor < minimo:
+                    minimo = valor
+            rhs[nodo] = minimo
+        self.clave_vigente.pop(nodo, None)
+        if g.get(nodo, math.inf) != rhs.get(nodo, math.inf):
+            self._insertar(nodo)
+
+    def _calcular_camino_minimo(self):
+        g, rhs, inicio, cola, vigente = self.g, self.rhs, self.inicio, self.cola, self.clave_vigente
+        vecinos_inicio = self.sucesores[inicio]
+        clave_inicio = self._clave(inicio)
+        while True:
+            tope = self._tope()
+            if tope is None:
+                break
+            clave_vieja, nodo = tope
+            if not (clave_vieja < clave_inicio or rhs.get(inicio, math.inf) > g.get(inicio, math.inf)):
+                break
+            clave_nueva = self._clave(nodo)
+            if clave_vieja < clave_nueva:  # La clave quedó vieja por un cambio de km
+                self._insertar(nodo)
+                continue
+            heapq.heappop(cola)
+            del vigente[nodo]
+            self.estadisticas.expansiones += 1
+            g_nodo, rhs_nodo = g.get(nodo, math.inf), rhs.get(nodo, math.inf)
+            if g_nodo > rhs_nodo:  # Sobreconsistente: g baja a rhs y se propaga a los predecesores
+                g[nodo] = rhs_nodo
+                for predecesor, costo in self.predecesores[nodo].items():
+                    if predecesor != self.objetivo and costo + rhs_nodo < rhs.get(predecesor, math.inf):
+                        rhs[predecesor] = costo + rhs_nodo
+                        vigente.pop(predecesor, None)
+                        if g.get(predecesor, math.inf) != rhs[predecesor]:
+                            self._insertar(predecesor)
+            else:  # Subconsistente: g pasa a infinito y se recalculan el nodo y los que dependían de él
+                g[nodo] = math.inf
+                for predecesor, costo in self.predecesores[nodo].items():
+                    if rhs.get(predecesor, math.inf) == costo + g_nodo:
+                        self._actualizar_nodo(predecesor)
+                self._actualizar_nodo(nodo)
+            if nodo == inicio or nodo in vecinos_inicio:  # Solo entonces pueden cambiar g o rhs del inicio
+                clave_inicio = self._clave(inicio)
+
+    def planificar(self):
+        """
+        Repara el árbol de búsqueda y devuelve el camino mínimo actual.
+        :return: Tupla (costo, camino) desde el inicio actual hasta el objetivo, o None si no hay camino.
+        """
+        self.estadisticas.planificaciones += 1
+        self._calcular_camino_minimo()
+        costo = self.rhs.get(self.inicio, math.inf)
+        if costo == math.inf:
+            return None
+        camino, nodo, g = [self.inicio], self.inicio, self.g
+        while nodo != self.objetivo:
+            nodo = min(self.sucesores[nodo].items(), key=lambda par: par[1] + g.get(par[0], math.inf))[0]
+            camino.append(nodo)
+        return costo, camino
+
+    def cambiar_costo(self, origen, destino, costo):
+        """
+        Cambia (o crea) la arista origen -> destino; math.inf la bloquea.
+        """
+        self.estadisticas.aristas_cambiadas += 1
+        self.sucesores.setdefault(destino, {})
+        self.predecesores.setdefault(origen, {})
+        self.sucesores.setdefault(origen, {})[destino] = costo
+        self.predecesores.setdefault(destino, {})[origen] = costo
+        self._actualizar_nodo(origen)
+
+    def quitar_arista(self, origen, destino):
+        """
+        Elimina la arista origen -> destino.
+        """
+        self.estadisticas.aristas_cambiadas += 1
+        self.sucesores[origen].pop(destino, None)
+        self.predecesores[destino].pop(origen, None)
+        self._actualizar_nodo(origen)
+
+    def mover_inicio(self, nodo):
+        """
+        Traslada el inicio (el robot avanzó) sin reordenar la cola: km acumula la corrección de las claves.
+        """
+        self.km += self.heuristica(self.inicio, nodo)
+        self.inicio = nodo
+
+
+# ============================================
+# BENCHMARK: REPLANIFICAR FRENTE A BUSCAR DE NUEVO
+# ============================================
+def malla_como_diccionario(ancho, alto, semilla=0):
+    """
+    Malla de calles de _008_grafo_csr.py en el formato {nodo: [(vecino, costo)]}.
+    """
+    grafo = {nodo: [] for nodo in range(ancho * alto)}
+    for origen, destino, costo in zip(*grafo_malla(ancho, alto, semilla)):
+        grafo[origen].append((destino, costo))
+    return grafo
+
+
+def benchmark(lado=150, cambios=(1, 10, 100, 1000), repeticiones=3, semilla=0):
+    """
+    Costo de replanificar con D* Lite frente a ucs y A* desde cero, según el número de aristas cambiadas.
+    Los cambios tocan aristas junto al camino actual, donde sí obligan a replanificar: en el primer 10 %
+    del camino (lo que ve un robot a su alrededor) o en cualquier punto del camino.
+    """
+    grafo = malla_como_diccionario(lado, lado, semilla)
+    inicio, objetivo = 0, lado * lado - 1
+    manhattan = lambda a, b: abs(a // lado - b // lado) + abs(a % lado - b % lado)  # Costos >= 1: admisible
+    generador = random.Random(semilla)
+    print(f"Malla {lado}x{lado} ({lado * lado} nodos), de {inicio} a {objetivo}")
+
+    for (heuristica, nombre), zona in itertools.product(((None, "h = 0"), (manhattan, "Manhattan")), (0.1, 1.0)):
+        estadisticas = EstadisticasDStarLite()
+        planificador = DStarLite(grafo, inicio, objetivo, heuristica, estadisticas)
+        t0 = time.perf_counter()
+        costo, camino = planificador.planificar()
+        print(f"  D* Lite ({nombre}), cambios en el primer {zona:.0%} del camino. Inicial: costo {costo}, {estadisticas.expansiones} expansiones, "
+              f"{time.perf_counter() - t0:.3f} s")
+        actual = {nodo: dict(vecinos) for nodo, vecinos in grafo.items()}  # Costos vigentes para las búsquedas
+        for cantidad in cambios:
+            tiempos = {"D* Lite": 0.0, "ucs": 0.0, "A*": 0.0}
+            expansiones = {"D* Lite": 0, "A*": 0}
+            for _ in range(repeticiones):
+                for _ in range(cantidad):
+                    nodo = generador.choice(camino[:max(1, int(zona * (len(camino) - 1)))])
+                    vecino = generador.choice(list(actual[nodo]))
+                    nuevo = generador.randint(1, 20)
+                    actual[nodo][vecino] = actual[vecino][nodo] = nuevo
+                    planificador.cambiar_costo(nodo, vecino, nuevo)
+                    planificador.cambiar_costo(vecino, nodo, nuevo)
+                antes = estadisticas.expansiones
+                t0 = time.perf_counter()
+                costo, camino = planificador.planificar()
+                tiempos["D* Lite"] += time.perf_counter() - t0
+                expansiones["D* Lite"] += estadisticas.expansiones - antes
+
+                lista = {nodo: list(vecinos.items()) for nodo, vecinos in actual.items()}
+                t0 = time.perf_counter()
+                costo_ucs, _ = ucs(lista, inicio, objetivo)
+                tiempos["ucs"] += time.perf_counter() - t0
+                estadisticas_a = EstadisticasAEstrella()
+                t0 = time.perf_counter()
+                costo_a, _ = buscar_camino(actual, inicio, objetivo, lambda nodo: manhattan(nodo, objetivo),
+                                           estadisticas=estadisticas_a)
+                tiempos["A*"] += time.perf_counter() - t0
+                expansiones["A*"] += estadisticas_a.nodos_expandidos
+                assert costo == costo_ucs == costo_a, (costo, costo_ucs, costo_a)
+            print(f"    {cantidad} aristas cambiadas: D* Lite {1e3 * tiempos['D* Lite'] / repeticiones:.1f} ms "
+                  f"({expansiones['D* Lite'] // repeticiones} expansiones), "
+                  f"ucs {1e3 * tiempos['ucs'] / repeticiones:.1f} ms, "
+                  f"A* {1e3 * tiempos['A*'] / repeticiones:.1f} ms ({expansiones['A*'] // repeticiones} expansiones)")
+
+
+if __name__ == "__main__":
+    # Grafo de _002: se bloquea Guadalajara -> Cancún y el robot replanifica sin buscar desde cero
+    grafo = {
+        "Ciudad de México": [("Guadalajara", 10), ("Monterrey", 15)],
+        "Guadalajara": [("Tijuana", 12), ("Cancún", 15)],
+        "Monterrey": [("Mérida", 10)],
+        "Tijuana": [("Chihuahua", 2)],
+        "Cancún": [("Chihuahua", 5)],
+        "Mérida": [("Chihuahua", 10)],
+        "Chihuahua": []
+    }
+    planificador = DStarLite(grafo, "Ciudad de México", "Chihuahua")
+    print(f"Camino inicial: {planificador.planificar()}")
+    planificador.cambiar_costo("Guadalajara", "Tijuana", math.inf)
+    print(f"Con Guadalajara -> Tijuana bloqueada: {planificador.planificar()}")
+    planificador.mover_inicio("Guadalajara")
+    planificador.cambiar_costo("Guadalajara", "Cancún", 40)
+    print(f"Desde Guadalajara, con Guadalajara -> Cancún a 40: {planificador.planificar()}, {planificador.estadisticas}")
+
+    # Malla de 300x300: python _024_D_Estrella_Lite.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark(lado=300)
+    else:
+        benchmark()
@@ -0,0 +1,285 @@
+# ============================================
+# ARA*: A* PONDERADO ANYTIME CON PRESUPUESTO
+# ============================================
+
+# DESCRIPCIÓN TEÓRICA:
+# busqueda_a_estrella (_003) solo responde cuando tiene el camino óptimo. ARA* (Likhachev, Gordon y Thrun)
+# encuentra primero un camino con la heurística inflada, f = g + ε·h, que expande muchos menos nodos,
+# y luego baja ε y mejora el camino reutilizando lo ya buscado:
+# - Con h consistente, el camino de cada iteración cuesta como mucho ε veces el óptimo.
+# - Al bajar ε no se empieza de cero: los estados cuyo g mejoró después de cerrarse se guardaron en
+#   INCONS y vuelven a ABIERTOS con la nueva prioridad; el resto del árbol se conserva.
+# - La cota de subóptimo que se informa es costo / min(g + h) sobre ABIERTOS ∪ INCONS: el mínimo es una
+#   cota inferior del óptimo en cualquier momento, así que la cota vale aunque el presupuesto corte una
+#   iteración a la mitad.
+# Cada llamada a buscar() recibe un presupuesto (segundos o expansiones) y devuelve el mejor camino
+# encontrado con su cota; la siguiente llamada continúa donde quedó la anterior.
+#
+# CARACTERÍSTICAS:
+# - Con peso_inicial = 1 es A* (una sola iteración, cota 1).
+# - La heurística debe ser consistente para que la cota sea válida.
+
+import heapq
+import math
+import sys
+import time
+from itertools import count
+
+from _011_Motor_A_Estrella import EstadisticasAEstrella, a_estrella, mapa_cuadricula, sucesores_cuadricula
+
+
+class EstadisticasARA:
+    """
+    Contadores de una búsqueda ARA* y perfil de sus soluciones.
+    """
+    def __init__(self):
+        self.expansiones = 0
+        self.iteraciones = 0  # Iteraciones completas (una por valor de ε)
+        self.soluciones = []  # (expansiones, segundos, costo, cota) cada vez que mejora el camino o la cota
+
+    def __repr__(self):
+        return f"EstadisticasARA(expansiones={self.expansiones}, iteraciones={self.iteraciones})"
+
+
+class ResultadoARA:
+    """
+    Mejor camino conocido, su costo y la cota de subóptimo (costo <= cota * óptimo).
+    """
+    def __init__(self, costo, camino, cota, peso, terminado):
+        self.costo, self.camino, self.cota, self.peso, self.terminado = costo, camino, cota, peso, terminado
+
+    def __repr__(self):
+        return (f"ResultadoARA(costo={self.costo}, cota={self.cota:.3f}, peso={self.peso:.2f}, "
+                f"longitud={len(self.camino)}, terminado={self.terminado})")
+
+
+class BusquedaARA:
+    """
+    Estado de una búsqueda ARA* que se puede continuar en sucesivas llamadas a buscar().
+    """
+    def __init__(self, sucesores, inicio, es_objetivo, heuristica, peso_inicial=3.0, decremento=0.5,
+                 estadisticas=None):
+        """
+        :param sucesores: Función que recibe un estado y devuelve pares (vecino, costo), con costos positivos.
+        :param inicio: Estado inicial.
+        :param es_objetivo: Función que indica si un estado es objetivo.
+        :param heuristica: Función consistente que estima el costo restante (math.inf poda el estado).
+        :param peso_inicial: ε de la primera iteración.
+        :param decremento: Cuánto baja ε entre iteraciones (hasta 1).
+        :param estadisticas: EstadisticasARA opcional que se rellena durante la búsqueda.
+        """
+        self.sucesores, self.es_objetivo, self.heuristica = sucesores, es_objetivo, heuristica
+        self.peso, self.decremento = max(1.0, peso_inicial), decremento
+        self.estadisticas = estadisticas if estadisticas is not None else EstadisticasARA()
+        self.g, self.h = {inicio: 0}, {inicio: heuristica(inicio)}
+        self.padre = {inicio: None}
+        self.costo_arista = {inicio: 0}
+        self.contador = count()
+        self.abiertos = {}  # Estado -> prioridad vigente en el montículo (eliminación perezosa)
+        self.frontera = []
+        self.cerrados, self.inconsistentes = set(), set()
+        self.objetivo, self.g_objetivo = None, math.inf
+        self.terminado = self.h[inicio] == math.inf
+        self.segundos = 0.0
+        self._cota_registrada = None
+        if es_objetivo(inicio):
+            self.objetivo, self.g_objetivo = inicio, 0
+        self._abrir(inicio)
+
+    def _abrir(self, estado):
+        prioridad = self.g[estado] + self.peso * self.h[estado]
+        self.abiertos[estado] = prioridad
+        heapq.heappush(self.frontera, (prioridad, self.h[estado], next(self.contador), estado))
+
+    def _tope(self):
+        frontera, abiertos = self.frontera, self.abiertos
+        while frontera:
+            prioridad, _, _, estado = frontera[0]
+            if abiertos.get(estado) == prioridad:
+                return prioridad, estado
+            heapq.heappop(frontera)
+        return None
+
+    def _mejorar_camino(self, limite_expansiones, limite_tiempo):
+        """
+        ImprovePath de ARA*: expande hasta que ningún abierto puede mejorar el objetivo o se agota el presupuesto.
+        :return: True si la iteración terminó; False si se cortó por presupuesto.
+        """
+        g, h, padre, costo_arista = self.g, self.h, self.padre, self.costo_arista
+        abiertos, cerrados, inconsistentes = self.abiertos, self.cerrados, self.inconsistentes
+        sucesores, es_objetivo, heuristica, peso = self.sucesores, self.es_objetivo, self.heuristica, self.peso
+        estadisticas = self.estadisticas
+        while True:
+            tope = self._tope()
+            if tope is None or self.g_objetivo <= tope[0]:
+                return True
+            if estadisticas.expansiones >= limite_expansiones or \
+                    (estadisticas.expansiones & 31 == 0 and time.perf_counter() >= limite_tiempo):
+                return False
+            _, estado = tope
+            heapq.heappop(self.frontera)
+            del abiertos[estado]
+            cerrados.add(estado)
+            estadisticas.expansiones += 1
+            g_estado = g[estado]
+            for vecino, costo in sucesores(estado):
+                g_vecino = g_estado + costo
+                if g_vecino >= g.get(vecino, math.inf):
+                    continue
+                h_vecino = h.get(vecino)
+                if h_vecino is None:
+                    h_vecino = h[vecino] = heuristica(vecino)
+                if h_vecino == math.inf:
+                    continue
+                g[vecino], padre[vecino], costo_arista[vecino] = g_vecino, estado, costo
+                if g_vecino < self.g_objetivo and es_objetivo(vecino):
+                    self.objetivo, self.g_objetivo = vecino, g_vecino
+                if vecino in cerrados:
+                    inconsistentes.add(vecino)
+                else:
+                    prioridad = g_vecino + peso * h_vecino
+                    abiertos[vecino] = prioridad
+                    heapq.heappush(self.frontera, (prioridad, h_vecino, next(self.contador), vecino))
+
+    def _cota_inferior(self):
+        """
+        min(g + h) sobre ABIERTOS ∪ INCONS: cota inferior del costo óptimo.
+        """
+        g, h = self.g, self.h
+        return min((g[estado] + h[estado] for conjunto in (self.abiertos, self.inconsistentes) for estado in conjunto),
+                   default=math.inf)
+
+    def _resultado(self):
+        if self.objetivo is None:
+            return None
+        camino, costo, estado = [], 0, self.objetivo
+        while estado is not None:  # El costo se suma sobre el camino real (los g de los padres pueden haber bajado)
+            camino.append(estado)
+            costo += self.costo_arista[estado]
+            estado = self.padre[estado]
+        inferior = min(self._cota_inferior(), costo)
+        cota = costo / inferior if inferior > 0 else (1.0 if costo == 0 else math.inf)
+        if self._cota_registrada != (costo, cota):
+            self._cota_registrada = (costo, cota)
+            self.estadisticas.soluciones.append((self.estadisticas.expansiones, self.segundos, costo, cota))
+        return ResultadoARA(costo, camino[::-1], cota, self.peso, self.terminado)
+
+    def buscar(self, segundos=None, max_expansiones=None):
+        """
+        Continúa la búsqueda con un presupuesto.
+        :param segundos: Tiempo de reloj de esta llamada (None: sin límite).
+        :param max_expansiones: Expansiones de esta llamada (None: sin límite).
+        :return: ResultadoARA con el mejor camino conocido, o None si aún no se encontró ninguno.
+        """
+        t0 = time.perf_counter()
+        limite_tiempo = t0 + segundos if segundos is not None else math.inf
+        limite_expansiones = self.estadisticas.expansiones + max_expansiones if max_expansiones is not None else math.inf
+        while not self.terminado:
+            if not self._mejorar_camino(limite_expansiones, limite_tiempo):
+                break
+            self.estadisticas.iteraciones += 1
+            inferior = self._cota_inferior()
+            if self.objetivo is None and inferior == math.inf:
+                self.terminado = True  # Sin abiertos ni objetivo: no hay camino
+                break
+            if self.peso <= 1 or self.g_objetivo <= inferior:
+                self.terminado = True
+            self.segundos += time.perf_counter() - t0
+            t0 = time.perf_counter()
+            self._resultado()
+            if self.terminado:
+                break
+            # Siguiente iteración: ε más pequeño, INCONS vuelve a ABIERTOS y CERRADOS se vacía
+            self.peso = max(1.0, self.peso - self.decremento)
+            pendientes = list(self.abiertos) + list(self.inconsistentes)
+            self.abiertos, self.frontera = {}, []
+            self.inconsistentes.clear()
+            self.cerrados.clear()
+            for estado in pendientes:
+                self._abrir(estado)
+        self.segundos += time.perf_counter() - t0
+        return self._resultado()
+
+
+def ara_estrella(sucesores, inicio, es_objetivo, heuristica, segundos=None, max_expansiones=None,
+                 peso_inicial=3.0, decremento=0.5, estadisticas=None):
+    """
+    ARA* con un único presupuesto de tiempo o de expansiones.
+    :return: ResultadoARA con el mejor camino encontrado y su cota de subóptimo, o None.
+    """
+    return BusquedaARA(sucesores, inicio, es_objetivo, heuristica, peso_inicial, decremento,
+                       estadisticas).buscar(segundos, max_expansiones)
+
+
+# ============================================
+# BENCHMARK EN MAPAS DE CUADRÍCULA
+# ============================================
+def benchmark(lado=500, densidad=0.3, peso_inicial=3.0, decremento=0.5, semilla=0):
+    """
+    Perfil anytime de ARA* frente a A* y frente a repetir A* ponderado desde cero con la misma serie de ε.
+    """
+    mapa = mapa_cuadricula(lado, lado, densidad, semilla)
+    sucesores, objetivo = sucesores_cuadricula(mapa, lado, lado), lado * lado - 1
+    es_objetivo = lambda celda: celda == objetivo
+    manhattan = lambda celda: (lado - 1 - celda // lado) + (lado - 1 - celda % lado)
+    print(f"Mapa {lado}x{lado} con {densidad:.0%} de obstáculos:")
+
+    estadisticas = EstadisticasAEstrella()
+    t0 = time.perf_counter()
+    nodo = a_estrella(sucesores, 0, es_objetivo, manhattan, estadisticas=estadisticas)
+    if nodo is None:
+        print("  Sin camino")
+        return
+    print(f"  A*: costo {nodo.g}, {estadisticas.nodos_expandidos} expansiones, {time.perf_counter() - t0:.2f} s")
+
+    estadisticas = EstadisticasARA()
+    resultado = ara_estrella(sucesores, 0, es_objetivo, manhattan, peso_inicial=peso_inicial, decremento=decremento,
+                             estadisticas=estadisticas)
+    assert resultado.costo == nodo.g
+    print(f"  ARA* hasta el óptimo: {estadisticas.expansiones} expansiones en {estadisticas.iteraciones} iteraciones")
+    for expansiones, segundos, costo, cota in estadisticas.soluciones:
+        print(f"    {expansiones:>8} expansiones, {segundos:.2f} s: costo {costo} (cota {cota:.3f})")
+
+    repetido = 0
+    peso = peso_inicial
+    while True:
+        estadisticas_wa = EstadisticasAEstrella()
+        a_estrella(sucesores, 0, es_objetivo, manhattan, peso_h=peso, estadisticas=estadisticas_wa)
+        repetido += estadisticas_wa.nodos_expandidos
+        if peso <= 1:
+            break
+        peso = max(1.0, peso - decremento)
+    print(f"  A* ponderado desde cero con la misma serie de ε: {repetido} expansiones en total")
+
+    for fraccion in (0.1, 0.25, 0.5):
+        presupuesto = max(1, int(fraccion * estadisticas.expansiones))
+        resultado = ara_estrella(sucesores, 0, es_objetivo, manhattan, max_expansiones=presupuesto,
+                                 peso_inicial=peso_inicial, decremento=decremento)
+        print(f"  Presupuesto de {presupuesto} expansiones: {resultado}")
+    busqueda = BusquedaARA(sucesores, 0, es_objetivo, manhattan, peso_inicial, decremento)
+    for llamada in range(1, 4):
+        print(f"  Llamada {llamada} de 50 ms sobre la misma búsqueda: {busqueda.buscar(segundos=0.05)}")
+
+
+if __name__ == "__main__":
+    # Grafo de _003_Busquedas_A_Estrella.py (la heurística de ese ejemplo es admisible)
+    grafo = {
+        "Madrid": {"París": 1275, "Lisboa": 635},
+        "París": {"Berlín": 1050, "Roma": 1420},
+        "Lisboa": {"Madrid": 635, "París": 1450},
+        "Berlín": {"Varsovia": 570, "Praga": 350},
+        "Roma": {"Atenas": 1300},
+        "Varsovia": {"Moscú": 1150},
+        "Praga": {"Viena": 330},
+        "Atenas": {}, "Moscú": {}, "Viena": {}
+    }
+    heuristica = {"Madrid": 1500, "París": 1200, "Lisboa": 1600, "Berlín": 800, "Roma": 1000,
+                  "Varsovia": 600, "Praga": 700, "Atenas": 0, "Moscú": 0, "Viena": 400}
+    print(ara_estrella(lambda nodo: grafo[nodo].items(), "Madrid", lambda nodo: nodo == "Atenas",
+                       heuristica.__getitem__).camino)
+
+    # Mapa de 1000x1000: python _025_ARA_Estrella.py --benchmark
+    if "--benchmark" in sys.argv:
+        benchmark(lado=1000)
+    else:
+        benchmark()
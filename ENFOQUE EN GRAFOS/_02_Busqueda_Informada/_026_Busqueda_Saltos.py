@@ -0,0 +1,430 @@
+# ============================================
+# JUMP POINT SEARCH (JPS) EN CUADRÍCULAS DE COSTO UNIFORME
+# ============================================
+
+# DESCRIPCIÓN TEÓRICA:
+# En una cuadrícula con 8 vecinos (costo 1 en recto y √2 en diagonal) hay muchísimos caminos simétricos
+# del mismo costo, y A* expande casi todas las celdas que están en alguno de ellos. Jump Point Search
+# (Harabor y Grastien) poda esa simetría sin perder el óptimo:
+# - Al expandir una celda se mira la dirección por la que se llegó y solo se siguen los vecinos que no
+#   tienen un camino igual de barato a través del padre (vecinos naturales y forzados).
+# - En lugar de generar el vecino, se "salta" en línea recta hasta encontrar una celda con vecinos
+#   forzados (un obstáculo al lado que obliga a girar), el objetivo o una pared; solo esas celdas
+#   (puntos de salto) entran en la frontera del motor A*.
+# - En diagonal, cada paso lanza saltos rectos en las dos componentes; si alguno encuentra algo, la
+#   celda diagonal es un punto de salto.
+# Se usa la regla de los mapas de referencia de MovingAI: un movimiento diagonal exige que las dos
+# celdas rectas que rodea estén libres (no se cortan esquinas), y con esa regla un salto diagonal nunca
+# tiene vecinos forzados.
+#
+# CARACTERÍSTICAS:
+# - El mapa es un arreglo booleano de NumPy. Las marcas de parada de los saltos rectos (celda bloqueada
+#   o con vecino forzado) dependen solo del mapa: se calculan una vez con NumPy por dirección y cada salto
+#   recto es un bytes.find, que recorre la fila o la columna en C.
+# - Los mapas y escenarios se leen en el formato .map / .scen de los benchmarks de MovingAI.
+
+import math
+import os
+import random
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+from _011_Motor_A_Estrella import EstadisticasAEstrella, a_estrella
+
+RAIZ_2 = math.sqrt(2)
+_LIBRES = frozenset(".GS")  # Terreno transitable en los mapas de MovingAI ('@', 'O', 'T' y 'W' bloquean)
+
+
+def distancia_octil(dx, dy):
+    """
+    Costo de moverse dx, dy celdas con 8 vecinos y sin obstáculos.
+    """
+    dx, dy = abs(dx), abs(dy)
+    return max(dx, dy) - min(dx, dy) + RAIZ_2 * min(dx, dy)
+
+
+# ============================================
+# MAPA DE CUADRÍCULA
+# ============================================
+class MapaCuadricula:
+    """
+    Cuadrícula de ocupación con 8 vecinos sobre un arreglo booleano de NumPy (True = libre).
+    Los estados de búsqueda son índices de un mapa con un borde bloqueado de una celda, de modo que
+    ningún vecino se sale del arreglo: celda = (y + 1) * (ancho + 2) + (x + 1).
+    """
+    def __init__(self, libre):
+        """
+        :param libre: Arreglo booleano de forma (alto, ancho) con True en las celdas transitables.
+        """
+        self.libre = np.asarray(libre, dtype=bool)
+        self.alto, self.ancho = self.libre.shape
+        self.paso_fila = self.ancho + 2
+        relleno = np.zeros((self.alto + 2, self.ancho + 2), dtype=bool)
+        relleno[1:-1, 1:-1] = self.libre
+        self._relleno = relleno
+        self._libres = relleno.astype(np.uint8).tobytes()
+        self._paradas = None
+
+    @classmethod
+    def leer(cls, ruta):
+        """
+        Lee un mapa en formato .map de MovingAI (cabecera type/height/width/map y una fila de texto por línea).
+        """
+        with open(ruta, encoding="ascii") as archivo:
+            cabecera = {}
+            for linea in archivo:
+                linea = linea.strip()
+                if linea == "map":
+                    break
+                clave, _, valor = linea.partition(" ")
+                cabecera[clave] = valor
+            else:
+                raise ValueError(f"{ruta}: falta la línea 'map'")
+            alto, ancho = int(cabecera["height"]), int(cabecera["width"])
+            filas = [linea.rstrip("\r\n") for linea in archivo][:alto]
+        if len(filas) != alto or any(len(fila) < ancho for fila in filas):
+            raise ValueError(f"{ruta}: se esperaban {alto} filas de {ancho} celdas")
+        texto = np.frombuffer("".join(fila[:ancho] for fila in filas).encode("ascii"), dtype=np.uint8)
+        libre = np.isin(texto, np.frombuffer("".join(_LIBRES).encode("ascii"), dtype=np.uint8))
+        return cls(libre.reshape(alto, ancho))
+
+    def guardar(self, ruta):
+        """
+        Escribe el mapa en formato .map de MovingAI ('.' libre, '@' bloqueada).
+        """
+        filas = np.where(self.libre, ord("."), ord("@")).astype(np.uint8)
+        with open(ruta, "w", encoding="ascii") as archivo:
+            archivo.write(f"type octile\nheight {self.alto}\nwidth {self.ancho}\nmap\n")
+            archivo.writelines(fila.tobytes().decode("ascii") + "\n" for fila in filas)
+
+    def celda(self, x, y):
+        return (y + 1) * self.paso_fila + x + 1
+
+    def coordenadas(self, celda):
+        y, x = divmod(celda, self.paso_fila)
+        return x - 1, y - 1
+
+    def es_libre(self, x, y):
+        return 0 <= x < self.ancho and 0 <= y < self.alto and bool(self.libre[y, x])
+
+    def heuristica_octil(self, objetivo):
+        """
+        Distancia octil hasta la celda objetivo (consistente con 8 vecinos).
+        """
+        paso_fila = self.paso_fila
+        y_objetivo, x_objetivo = divmod(objetivo, paso_fila)
+
+        def heuristica(celda):
+            y, x = divmod(celda, paso_fila)
+            dx, dy = abs(x - x_objetivo), abs(y - y_objetivo)
+            return dx + dy + (RAIZ_2 - 2) * min(dx, dy)
+        return heuristica
+
+    def sucesores_octiles(self):
+        """
+        Sucesores de A* sin poda: 8 vecinos, costo 1 o √2 y diagonales solo sin cortar esquinas.
+        """
+        libres, paso_fila = self._libres, self.paso_fila
+        rectos = (1, -1, paso_fila, -paso_fila)
+        diagonales = ((1, paso_fila), (1, -paso_fila), (-1, paso_fila), (-1, -paso_fila))
+
+        def sucesores(celda):
+            for paso in rectos:
+                if libres[celda + paso]:
+                    yield celda + paso, 1
+            for dx, dy in diagonales:
+                if libres[celda + dx] and libres[celda + dy] and libres[celda + dx + dy]:
+                    yield celda + dx + dy, RAIZ_2
+        return sucesores
+
+    def paradas(self):
+        """
+        Marcas de parada de los saltos rectos por dirección: 1 si la celda está bloqueada o tiene un vecino
+        forzado al llegar en esa dirección. Este y oeste se guardan por filas; sur y norte, traspuestos
+        (por columnas) para que el salto vertical también sea un recorrido contiguo.
+        :return: (este, oeste, sur, norte) como bytes.
+        """
+        if self._paradas is None:
+            libre = self._relleno
+            bloqueada = ~libre
+            arriba, abajo = libre[:-2, 1:-1], libre[2:, 1:-1]
+            izquierda, derecha = libre[1:-1, :-2], libre[1:-1, 2:]
+            forzados = {
+                # Llegando hacia el este, la celda de arriba (o abajo) es forzada si la de arriba-atrás está bloqueada
+                "este": (arriba & bloqueada[:-2, :-2]) | (abajo & bloqueada[2:, :-2]),
+                "oeste": (arriba & bloqueada[:-2, 2:]) | (abajo & bloqueada[2:, 2:]),
+                "sur": (izquierda & bloqueada[:-2, :-2]) | (derecha & bloqueada[:-2, 2:]),
+                "norte": (izquierda & bloqueada[2:, :-2]) | (derecha & bloqueada[2:, 2:]),
+            }
+            paradas = []
+            for direccion, forzado in forzados.items():
+                parada = bloqueada.copy()
+                parada[1:-1, 1:-1] |= forzado
+                if direccion in ("sur", "norte"):
+                    parada = parada.T
+                paradas.append(np.ascontiguousarray(parada, dtype=np.uint8).tobytes())
+            self._paradas = tuple(paradas)
+        return self._paradas
+
+
+# ============================================
+# JUMP POINT SEARCH
+# ============================================
+def sucesores_jps(mapa, objetivo):
+    """
+    Sucesores de JPS para el motor A* con recibe_nodo=True: reciben el nodo expandido, podan según la
+    dirección de llegada desde su padre y devuelven pares (punto de salto, costo del salto).
+    """
+    libres, paso_fila = mapa._libres, mapa.paso_fila
+    paso_columna = mapa.alto + 2
+    este, oeste, sur, norte = mapa.paradas()
+    y_objetivo, x_objetivo = divmod(objetivo, paso_fila)
+    objetivo_traspuesto = x_objetivo * paso_columna + y_objetivo
+
+    def saltar_recto(celda, dx, dy):
+        """
+        Salto recto desde celda (sin incluirla); devuelve el punto de salto o None si choca con una pared.
+        """
+        if dy == 0:
+            if dx > 0:
+                siguiente = celda + 1
+                parada = este.find(1, siguiente)
+                if siguiente <= objetivo <= parada:
+                    return objetivo
+            else:
+                siguiente = celda - 1
+                parada = oeste.rfind(1, 0, siguiente + 1)
+                if parada <= objetivo <= siguiente:
+                    return objetivo
+            return parada if libres[parada] else None
+        y, x = divmod(celda, paso_fila)
+        traspuesta = x * paso_columna + y
+        if dy > 0:
+            siguiente = traspuesta + 1
+            parada = sur.find(1, siguiente)
+            if siguiente <= objetivo_traspuesto <= parada:
+                return objetivo
+        else:
+            siguiente = traspuesta - 1
+            parada = norte.rfind(1, 0, siguiente + 1)
+            if parada <= objetivo_traspuesto <= siguiente:
+                return objetivo
+        x, y = divmod(parada, paso_columna)
+        parada = y * paso_fila + x
+        return parada if libres[parada] else None
+
+    def saltar_diagonal(celda, dx, dy):
+        paso_y = dy * paso_fila
+        while libres[celda + dx] and libres[celda + paso_y]:
+            celda += dx + paso_y
+            if not libres[celda]:
+                return None
+            if celda == objetivo or saltar_recto(celda, dx, 0) is not None or saltar_recto(celda, 0, dy) is not None:
+                return celda
+        return None
+
+    def direcciones(celda, padre):
+        if padre is None:
+            return ((1, 0), (-1, 0), (0, 1), (0, -1), (1, 1), (1, -1), (-1, 1), (-1, -1))
+        y, x = divmod(celda, paso_fila)
+        y_padre, x_padre = divmod(padre, paso_fila)
+        dx, dy = (x > x_padre) - (x < x_padre), (y > y_padre) - (y < y_padre)
+        if dx and dy:
+            return (dx, 0), (0, dy), (dx, dy)
+        resultado = [(dx, dy)]
+        if dy == 0:
+            for lado in (-1, 1):  # Vecinos forzados: libre al costado y bloqueado al costado del padre
+                if libres[celda + lado * paso_fila] and not libres[celda - dx + lado * paso_fila]:
+                    resultado += [(0, lado), (dx, lado)]
+        else:
+            for lado in (-1, 1):
+                if libres[celda + lado] and not libres[celda + lado - dy * paso_fila]:
+                    resultado += [(lado, 0), (lado, dy)]
+        return resultado
+
+    def sucesores(nodo):
+        celda = nodo.estado
+        padre = nodo.padre.estado if nodo.padre is not None else None
+        y, x = divmod(celda, paso_fila)
+        for dx, dy in direcciones(celda, padre):
+            if dx and dy:
+                salto = saltar_diagonal(celda, dx, dy)
+            else:
+                salto = saltar_recto(celda, dx, dy)
+            if salto is not None:
+                y_salto, x_salto = divmod(salto, paso_fila)
+                yield salto, distancia_octil(x_salto - x, y_salto - y)
+    return sucesores
+
+
+def completar_camino(mapa, puntos):
+    """
+    Convierte la lista de puntos de salto en el camino celda a celda (cada salto es recto o diagonal).
+    """
+    camino = puntos[:1]
+    for desde, hasta in zip(puntos, puntos[1:]):
+        (x0, y0), (x1, y1) = mapa.coordenadas(desde), mapa.coordenadas(hasta)
+        dx, dy = (x1 > x0) - (x1 < x0), (y1 > y0) - (y1 < y0)
+        camino.extend(mapa.celda(x0 + dx * i, y0 + dy * i) for i in range(1, max(abs(x1 - x0), abs(y1 - y0)) + 1))
+    return camino
+
+
+def busqueda_saltos(mapa, inicio, objetivo, estadisticas=None):
+    """
+    Camino óptimo con 8 vecinos usando JPS sobre el motor A*.
+    :param mapa: MapaCuadricula.
+    :param inicio: Celda inicial como (x, y).
+    :param objetivo: Celda objetivo como (x, y).
+    :param estadisticas: EstadisticasAEstrella opcional (cuenta solo los puntos de salto expandidos).
+    :return: (costo, camino como lista de (x, y)) o None si no hay camino.
+    """
+    if not (mapa.es_libre(*inicio) and mapa.es_libre(*objetivo)):
+        return None
+    celda_inicio, celda_objetivo = mapa.celda(*inicio), mapa.celda(*objetivo)
+    nodo = a_estrella(sucesores_jps(mapa, celda_objetivo), celda_inicio, lambda celda: celda == celda_objetivo,
+                      mapa.heuristica_octil(celda_objetivo), estadisticas=estadisticas, recibe_nodo=True)
+    if nodo is None:
+        return None
+    return nodo.g, [mapa.coordenadas(celda) for celda in completar_camino(mapa, nodo.camino())]
+
+
+def busqueda_octil(mapa, inicio, objetivo, estadisticas=None):
+    """
+    Mismo problema con A* sin poda (referencia para JPS).
+    :return: (costo, camino como lista de (x, y)) o None si no hay camino.
+    """
+    if not (mapa.es_libre(*inicio) and mapa.es_libre(*objetivo)):
+        return None
+    celda_inicio, celda_objetivo = mapa.celda(*inicio), mapa.celda(*objetivo)
+    nodo = a_estrella(mapa.sucesores_octiles(), celda_inicio, lambda celda: celda == celda_objetivo,
+                      mapa.heuristica_octil(celda_objetivo), estadisticas=estadisticas)
+    if nodo is None:
+        return None
+    return nodo.g, [mapa.coordenadas(celda) for celda in nodo.camino()]
+
+
+def leer_escenarios(ruta):
+    """
+    Lee un archivo .scen de MovingAI ("version 1" y una línea por consulta:
+    cubeta, mapa, ancho, alto, x inicio, y inicio, x objetivo, y objetivo, longitud óptima).
+    :return: Lista de ((x, y) inicio, (x, y) objetivo, longitud óptima).
+    """
+    escenarios = []
+    with open(ruta, encoding="ascii") as archivo:
+        for linea in archivo:
+            campos = linea.split()
+            if len(campos) < 9 or campos[0] == "version":
+                continue
+            x0, y0, x1, y1 = map(int, campos[-5:-1])
+            escenarios.append(((x0, y0), (x1, y1), float(campos[-1])))
+    return escenarios
+
+
+# ============================================
+# BENCHMARK CON MAPAS EN FORMATO MOVINGAI
+# ============================================
+def _mapas_de_prueba(directorio, lado, semilla):
+    """
+    Escribe en el directorio mapas .map de tres tipos: abierto con bloques, salas con puertas y aleatorio.
+    """
+    generador = np.random.default_rng(semilla)
+    abierto = np.ones((lado, lado), dtype=bool)
+    for _ in range(lado // 8):
+        x, y = generador.integers(0, lado, 2)
+        ancho, alto = generador.integers(2, lado // 16 + 3, 2)
+        abierto[y:y + alto, x:x + ancho] = False
+    salas = np.ones((lado, lado), dtype=bool)
+    lado_sala = 32
+    salas[lado_sala::lado_sala, :] = salas[:, lado_sala::lado_sala] = False
+    for inicio in range(0, lado, lado_sala):  # Una puerta en cada tramo de pared
+        for pared in range(lado_sala, lado, lado_sala):
+            salas[pared, inicio + generador.integers(1, lado_sala - 1)] = True
+            salas[inicio + generador.integers(1, lado_sala - 1), pared] = True
+    aleatorio = generador.random((lado, lado)) >= 0.25
+    rutas = []
+    for nombre, libre in (("abierto", abierto), ("salas", salas), ("aleatorio", aleatorio)):
+        ruta = os.path.join(directorio, f"{nombre}{lado}.map")
+        MapaCuadricula(libre).guardar(ruta)
+        rutas.append(ruta)
+    return rutas
+
+
+def benchmark(rutas=None, consultas=20, lado=256, semilla=0):
+    """
+    Compara expansiones y tiempo de A* sin poda y de JPS en mapas .map. Si junto a un mapa existe su
+    archivo .scen se usan sus consultas (y se comprueba la longitud óptima); si no, pares de celdas
+    libres al azar. Sin rutas se generan mapas de prueba en un directorio temporal.
+    """
+    directorio = None
+    if not rutas:
+        directorio = tempfile.TemporaryDirectory()
+        rutas = _mapas_de_prueba(directorio.name, lado, semilla)
+    generador = random.Random(semilla)
+    for ruta in rutas:
+        t0 = time.perf_counter()
+        mapa = MapaCuadricula.leer(ruta)
+        mapa.paradas()
+        preparacion = time.perf_counter() - t0
+        if os.path.exists(ruta + ".scen"):
+            escenarios = leer_escenarios(ruta + ".scen")
+            escenarios = escenarios[-consultas:]  # Las últimas cubetas son las consultas más largas
+        else:
+            libres = np.argwhere(mapa.libre)
+            escenarios = []
+            for _ in range(consultas):
+                (y0, x0), (y1, x1) = libres[generador.randrange(len(libres))], libres[generador.randrange(len(libres))]
+                escenarios.append(((int(x0), int(y0)), (int(x1), int(y1)), None))
+
+        totales = {"A*": [0, 0.0], "JPS": [0, 0.0]}
+        resueltas = 0
+        for inicio, objetivo, optimo in escenarios:
+            costos = []
+            for nombre, busqueda in (("A*", busqueda_octil), ("JPS", busqueda_saltos)):
+                estadisticas = EstadisticasAEstrella()
+                t0 = time.perf_counter()
+                resultado = busqueda(mapa, inicio, objetivo, estadisticas)
+                totales[nombre][1] += time.perf_counter() - t0
+                totales[nombre][0] += estadisticas.nodos_expandidos
+                costos.append(resultado[0] if resultado else None)
+            if costos[0] is None:
+                assert costos[1] is None, "JPS no puede encontrar un camino que A* no encuentra"
+                continue
+            assert math.isclose(costos[0], costos[1]), f"JPS debe dar el costo óptimo: {costos}"
+            assert optimo is None or abs(costos[1] - optimo) < 1e-3, f"Longitud óptima {optimo}, JPS {costos[1]}"
+            resueltas += 1
+
+        print(f"{os.path.basename(ruta)} ({mapa.ancho}x{mapa.alto}, {mapa.libre.mean():.0%} libre, "
+              f"preparación {preparacion * 1000:.0f} ms), {resueltas} consultas con camino:")
+        for nombre, (expansiones, segundos) in totales.items():
+            print(f"  {nombre}: {expansiones / max(1, resueltas):.0f} expansiones por consulta, {segundos:.2f} s en total")
+        print(f"  Reducción de expansiones: {totales['A*'][0] / max(1, totales['JPS'][0]):.1f}x, "
+              f"de tiempo: {totales['A*'][1] / max(1e-9, totales['JPS'][1]):.1f}x")
+    if directorio is not None:
+        directorio.cleanup()
+
+
+if __name__ == "__main__":
+    plano = ["..........",
+             "....@.....",
+             "....@.....",
+             "....@@@@..",
+             "..........",
+             ".@@@@.....",
+             ".........."]
+    mapa = MapaCuadricula(np.array([[celda == "." for celda in fila] for fila in plano]))
+    estadisticas = EstadisticasAEstrella()
+    costo, camino = busqueda_saltos(mapa, (0, 0), (9, 6), estadisticas)
+    print(f"JPS: costo {costo:.3f}, {len(camino)} celdas, {estadisticas.nodos_expandidos} puntos de salto expandidos")
+    estadisticas = EstadisticasAEstrella()
+    costo, _ = busqueda_octil(mapa, (0, 0), (9, 6), estadisticas)
+    print(f"A*:  costo {costo:.3f}, {estadisticas.nodos_expandidos} celdas expandidas")
+
+    # Mapas propios (con su .scen al lado si existe): python _026_Busqueda_Saltos.py --benchmark a.map b.map
+    # Sin rutas, --benchmark genera mapas de prueba de 1024x1024
+    if "--benchmark" in sys.argv:
+        benchmark([ruta for ruta in sys.argv[1:] if ruta != "--benchmark"], lado=1024)
+    else:
+        benchmark()